@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Git-less sync check for `python -m myskillium_spore.sync`.
+
+Generates an upstream archive the way `git archive` (and so GitHub) does -
+a tar.gz with a top-level directory and the commit SHA in the pax global
+header - serves it from the local stand-in server (standin.py) and runs the
+sync as a subprocess against a temporary project, verifying that:
+
+- every file under the sync roots is written byte-for-byte (executable bit
+  included) and nothing outside them is, and the commit is recorded in
+  `.myskillium-version`
+- a second sync changes nothing and writes no file (every file keeps its
+  inode and mtime, and no temp copies are written either); a locally modified file is restored and a local-only
+  file is left alone
+- `--dry-run` writes nothing
+- an existing skill index is brought up to date with the files a sync
+  rewrote
+- the sync runs from the spore alone (the `myskillium_spore` package without
+  sync-myskillium.py next to it)
+- a truncated archive fails without touching the recorded version
+- the archive is streamed: the sync's peak memory stays far below the
+  archive size (which is dominated by an incompressible asset)
+
+Usage:
+    python bench/bench-archive.py [--asset-mb N] [--keep]
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import io
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+
+sys.path.insert(0, str(REPO_ROOT))
+from standin import StandinServer  # noqa: E402
+
+_spec = importlib.util.spec_from_file_location("sync_myskillium", REPO_ROOT / "sync-myskillium.py")
+sync_myskillium = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(sync_myskillium)
+
+# Bytes a no-op re-sync may write (its report and the version file)
+RESYNC_WRITE_BUDGET = 16 * 1024
+
+COMMIT = hashlib.sha1(b"bench-archive").hexdigest()
+TOP_DIR = f"Myskillium-{COMMIT}"
+
+# Runs the sync and reports its own peak RSS (VmHWM, reset on exec, unlike
+# ru_maxrss which would include the forked bench process holding the archive)
+# and the bytes it passed to write() (wchar, Linux only)
+SYNC_RUNNER = """
+import atexit, runpy, sys
+def report():
+    try:
+        with open("/proc/self/status") as f:
+            hwm = next(line.split()[1] for line in f if line.startswith("VmHWM:"))
+    except (OSError, StopIteration):
+        hwm = "0"
+    try:
+        with open("/proc/self/io") as f:
+            wchar = next(line.split()[1] for line in f if line.startswith("wchar:"))
+    except (OSError, StopIteration):
+        wchar = "-1"
+    sys.stderr.write(f"VmHWM {hwm}\\nwchar {wchar}\\n")
+atexit.register(report)
+sys.argv = ["sync"] + sys.argv[1:]
+runpy.run_module("myskillium_spore.sync", run_name="__main__")
+"""
+
+
+def make_archive(asset_mb: int, rng: random.Random) -> tuple[bytes, dict[str, tuple[bytes, int]]]:
+    """Return (tar.gz bytes, {path: (content, mode)} of every file in it)."""
+    files = {
+        "README.md": (b"# Myskillium\n", 0o644),
+        "sync-myskillium.py": (b"print('sync')\n", 0o755),
+        "docs/notes.md": (b"outside the sync roots\n", 0o644),
+        ".claude/settings.json": (b"{}\n", 0o644),
+        ".claude/skills/bootstrap/SKILL.md": (b"---\nname: bootstrap\n---\nBootstrap.\n", 0o644),
+        ".claude/skills/finder/SKILL.md": (b"---\nname: finder\n---\nFind skills.\n", 0o644),
+        ".claude/skills/finder/scripts/find.sh": (b"#!/bin/sh\necho find\n", 0o755),
+        ".claude/skills/finder/assets/model.bin": (rng.randbytes(asset_mb * 1024 * 1024), 0o644),
+    }
+    for i in range(50):
+        files[f".claude/skills/bulk/doc-{i:02d}.md"] = (f"# Doc {i}\n".encode() * 50, 0o644)
+
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz", format=tarfile.PAX_FORMAT,
+                      pax_headers={"comment": COMMIT}) as tar:
+        for path, (content, mode) in files.items():
+            info = tarfile.TarInfo(f"{TOP_DIR}/{path}")
+            info.size = len(content)
+            info.mode = mode
+            tar.addfile(info, io.BytesIO(content))
+    return buffer.getvalue(), files
+
+
+def run_sync(project: Path, url: str, *args: str,
+             package_root: Path = REPO_ROOT) -> tuple[subprocess.CompletedProcess, int, int]:
+    """Run the git-less sync; return (result, peak RSS in KB or 0, bytes written or -1 if unknown)."""
+    env = dict(os.environ, PYTHONPATH=str(package_root))
+    env.pop("CLAUDE_PROJECT_DIR", None)
+    result = subprocess.run(
+        [sys.executable, "-c", SYNC_RUNNER, "--url", url, "--project", str(project), *args],
+        env=env, capture_output=True, text=True,
+    )
+    stats = dict(line.split() for line in result.stderr.splitlines() if line.startswith(("VmHWM ", "wchar ")))
+    return result, int(stats.get("VmHWM", 0)), int(stats.get("wchar", -1))
+
+
+def project_files(project: Path) -> dict[str, tuple[bytes, int]]:
+    return {
+        p.relative_to(project).as_posix(): (p.read_bytes(), p.stat().st_mode & 0o777)
+        for p in project.rglob("*") if p.is_file()
+    }
+
+
+def file_stamps(project: Path) -> dict[str, tuple[int, int]]:
+    """(inode, mtime_ns) of every file: a rewrite through a temp file changes both."""
+    return {p.relative_to(project).as_posix(): (p.stat().st_ino, p.stat().st_mtime_ns)
+            for p in project.rglob("*") if p.is_file()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Git-less sync check")
+    parser.add_argument("--asset-mb", type=int, default=64, help="Size of the incompressible asset in the archive")
+    parser.add_argument("--keep", action="store_true", help="Keep the generated project for inspection")
+    args = parser.parse_args()
+
+    archive, files = make_archive(args.asset_mb, random.Random(42))
+    synced = {p: c for p, c in files.items() if p.startswith(".claude/skills/")}
+    work = Path(tempfile.mkdtemp(prefix="myskillium-archive-"))
+    failures = []
+    try:
+        with StandinServer({"/main.tar.gz": archive, "/truncated.tar.gz": archive[: len(archive) // 2]}) as server:
+            project = work / "project"
+            project.mkdir()
+            url = server.url("/main.tar.gz")
+
+            result, _, _ = run_sync(project, url, "--dry-run")
+            if result.returncode != 0 or any(project.iterdir()):
+                failures.append(f"dry run failed or wrote files: {result.stdout.strip()}")
+
+            result, peak_kb, _ = run_sync(project, url)
+            print(f"Archive:      {len(archive) / 1e6:.1f}MB ({len(synced)} of {len(files)} files in the sync roots)")
+            print(f"First sync:   exit {result.returncode}, peak RSS {peak_kb / 1024:.1f}MB")
+            written = project_files(project)
+            version = written.pop(".myskillium-version", (b"", 0))[0].decode().strip()
+            if result.returncode != 0:
+                failures.append(f"first sync failed: {result.stdout.strip()}")
+            if written != synced:
+                diff = sorted(set(written) ^ set(synced) | {p for p in synced if written.get(p) != synced[p]})
+                failures.append(f"synced files differ: {diff[:5]}")
+            if version != COMMIT:
+                failures.append(f"recorded version {version!r}, expected the archive's commit {COMMIT}")
+            if peak_kb * 1024 > len(archive) / 2:
+                failures.append(f"peak RSS {peak_kb / 1024:.1f}MB is not far below the archive size (buffered?)")
+
+            before = file_stamps(project)
+            result, _, written = run_sync(project, url)
+            rewritten = sorted(p for p, stamp in file_stamps(project).items()
+                               if before.get(p) != stamp and p != ".myskillium-version")
+            print(f"Second sync:  exit {result.returncode}, {len(rewritten)} file(s) rewritten, "
+                  f"{written / 1024:.1f}KB written")
+            if "Already at version" not in result.stdout or "Added" in result.stdout or "Updated" in result.stdout:
+                failures.append(f"second sync changed something: {result.stdout.strip()}")
+            if rewritten:
+                failures.append(f"second sync rewrote unchanged files: {rewritten[:5]}")
+            # The report and the version file only, not a temp copy of each file
+            if written > RESYNC_WRITE_BUDGET:
+                failures.append(f"second sync wrote {written} bytes (budget {RESYNC_WRITE_BUDGET})")
+
+            edited = project / ".claude/skills/finder/SKILL.md"
+            edited.write_text("local edit\n")
+            local_only = project / ".claude/skills/mine/SKILL.md"
+            local_only.parent.mkdir(parents=True)
+            local_only.write_text("mine\n")
+            sync_myskillium.update_index(project)
+            result, _, _ = run_sync(project, url)
+            if edited.read_bytes() != synced[".claude/skills/finder/SKILL.md"][0] or "Updated (1)" not in result.stdout:
+                failures.append(f"modified file was not restored: {result.stdout.strip()}")
+            if not local_only.exists():
+                failures.append("local-only skill was removed")
+            stale = sync_myskillium.update_index(project)["indexed"]
+            print(f"Index:        {'refreshed' if 'Skill index: 1 file(s) re-indexed' in result.stdout else 'NOT refreshed'}"
+                  f" by the sync, {stale} stale file(s) left")
+            if "Skill index: 1 file(s) re-indexed" not in result.stdout or stale:
+                failures.append(f"sync did not refresh the skill index ({stale} stale file(s))")
+
+            spore = work / "spore"
+            shutil.copytree(REPO_ROOT / "myskillium_spore", spore / "myskillium_spore",
+                            ignore=shutil.ignore_patterns("__pycache__"))
+            bare = work / "spore-project"
+            bare.mkdir()
+            result, _, _ = run_sync(bare, url, package_root=spore)
+            print(f"Spore only:   exit {result.returncode}")
+            if result.returncode != 0 or project_files(bare).keys() - {".myskillium-version"} != synced.keys():
+                failures.append(f"sync from the spore alone failed: {(result.stdout + result.stderr).strip()[-300:]}")
+
+            result, _, _ = run_sync(project, server.url("/truncated.tar.gz"))
+            print(f"Truncated:    exit {result.returncode}")
+            if result.returncode == 0 or (project / ".myskillium-version").read_text().strip() != COMMIT:
+                failures.append("truncated archive did not fail cleanly")
+    finally:
+        if args.keep:
+            print(f"Kept files in {work}")
+        else:
+            shutil.rmtree(work, ignore_errors=True)
+
+    print()
+    if failures:
+        print(f"Git-less sync check failed ({len(failures)}):")
+        for failure in failures:
+            print(f"  ! {failure}")
+        sys.exit(1)
+    print("Git-less sync streams and applies the archive correctly.")
+
+
+if __name__ == "__main__":
+    main()
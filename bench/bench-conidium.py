@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Germination check for conidia built by build-conidium.py.
+
+Generates a large synthetic skill pack (text docs with duplicates, nested
+directories, a binary asset and an executable script), builds a conidium
+from it and runs it against a temporary project, verifying that:
+
+- the first germination installs every file byte-for-byte (executable bit
+  included) and the payload stores duplicate content once
+- the blobs are not code: compiling the conidium builds none of them into
+  a constant
+- an unchanged re-check reads no installed file (stat only) and no blob
+  (the conidium is opened no more often than by an apoptosis)
+- after K files are modified or deleted, a re-check reads and rewrites
+  only those K files
+- apoptosis removes every unmodified file and keeps modified ones
+
+Files read are counted with an audit hook around the conidium run.
+
+Usage:
+    python bench/bench-conidium.py [--files N] [--changes K] [--keep]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+BUILDER = REPO_ROOT / "build-conidium.py"
+
+sys.path.insert(0, str(REPO_ROOT))
+from myskillium_spore.germinate import DATA_MARKER  # noqa: E402
+
+# Runs a conidium under an audit hook that records the files it opens
+# (argv: conidium, output file, conidium args...)
+AUDIT_RUNNER = """
+import os, sys
+conidium, out = sys.argv[1:3]
+opened = []
+def audit(event, args):
+    if event == "open" and isinstance(args[0], (str, bytes)):
+        opened.append(os.fsdecode(args[0]))
+def dump():
+    with open(out, "w") as f:
+        f.write("\\n".join(sorted(opened)))
+import atexit
+atexit.register(dump)
+sys.addaudithook(audit)
+sys.argv = [conidium] + sys.argv[3:]
+import runpy
+runpy.run_path(conidium, run_name="__main__")
+"""
+
+WORDS = "spore hypha mycelium skill conidium germinate network symbiotic clone thread".split()
+
+
+def make_skill_pack(root: Path, count: int, rng: random.Random) -> Path:
+    """Create a skill dir with `count` files; returns its path."""
+    skill = root / "skills" / "pack"
+    for i in range(count):
+        path = skill / f"topic-{i % 20:02d}" / f"part-{i % 7}" / f"doc-{i:05d}.md"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if i % 10 == 9:
+            # Every tenth file duplicates an earlier one
+            shutil.copyfile(skill / f"topic-{(i - 9) % 20:02d}" / f"part-{(i - 9) % 7}" / f"doc-{i - 9:05d}.md", path)
+            continue
+        words = [rng.choice(WORDS) for _ in range(rng.randint(100, 800))]
+        path.write_text(f"# Doc {i}\n\n" + " ".join(words) + "\n", encoding="utf-8")
+    (skill / "assets").mkdir()
+    (skill / "assets" / "icon.bin").write_bytes(rng.randbytes(64 * 1024))
+    script = skill / "scripts" / "run.sh"
+    script.parent.mkdir()
+    script.write_text("#!/bin/sh\necho pack\n")
+    script.chmod(0o755)
+    return skill
+
+
+def run_conidium(conidium: Path, project: Path, work: Path, *args: str) -> tuple[subprocess.CompletedProcess, list[str], float, int]:
+    """Run the conidium; return (result, installed files it opened, seconds, times it opened itself)."""
+    opened_file = work / "opened.txt"
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", AUDIT_RUNNER, str(conidium), str(opened_file), "--project", str(project), *args],
+        capture_output=True, text=True,
+    )
+    elapsed = time.perf_counter() - start
+    skills = str(project / ".claude" / "skills") + os.sep
+    opened = opened_file.read_text().splitlines() if opened_file.exists() else []
+    # Atomic-write temp files are not reads of installed files
+    installed = [p for p in opened if p.startswith(skills) and not p.endswith(".tmp")]
+    return result, installed, elapsed, opened.count(str(conidium))
+
+
+def code_strings(code) -> set[str]:
+    """Every string constant compiled into a code object and its nested ones."""
+    found = set()
+    for const in code.co_consts:
+        if isinstance(const, str):
+            found.add(const)
+        elif hasattr(const, "co_consts"):
+            found |= code_strings(const)
+    return found
+
+
+def tree_files(root: Path) -> dict[str, tuple[bytes, bool]]:
+    return {
+        p.relative_to(root).as_posix(): (p.read_bytes(), os.access(p, os.X_OK))
+        for p in root.rglob("*") if p.is_file()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Germination check for conidia")
+    parser.add_argument("--files", type=int, default=2000, help="Files in the synthetic skill pack")
+    parser.add_argument("--changes", type=int, default=10, help="Files modified or deleted before the re-check")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--keep", action="store_true", help="Keep the generated files for inspection")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    work = Path(tempfile.mkdtemp(prefix="myskillium-conidium-"))
+    failures = []
+    try:
+        skill = make_skill_pack(work, args.files, rng)
+        conidium = work / "conidium.py"
+        build = subprocess.run([sys.executable, str(BUILDER), str(skill), "--output", str(conidium)],
+                               capture_output=True, text=True)
+        if build.returncode != 0:
+            print(build.stdout + build.stderr)
+            sys.exit(1)
+        source = tree_files(skill)
+        raw = sum(len(content) for content, _ in source.values())
+        print(build.stdout.strip())
+        print(f"Pack:              {len(source)} files, {raw} bytes; conidium {conidium.stat().st_size} bytes")
+
+        text = conidium.read_text(encoding="utf-8")
+        start = time.perf_counter()
+        constants = code_strings(compile(text, str(conidium), "exec"))
+        compile_ms = (time.perf_counter() - start) * 1000
+        _, _, data = text.partition("\n" + DATA_MARKER + "\n")
+        blobs = [line[1:] for line in data.splitlines() if " " not in line]
+        print(f"Compile:           {compile_ms:.0f}ms, {len(blobs)} blobs in the data section")
+        if not blobs:
+            failures.append("conidium has no data section")
+        elif constants & set(blobs):
+            failures.append(f"{len(constants & set(blobs))} blobs are compiled into string constants")
+
+        project = work / "project"
+        project.mkdir()
+        installed_dir = project / ".claude" / "skills" / "pack"
+
+        result, opened, first, _ = run_conidium(conidium, project, work, "--germinate")
+        print(f"First germination: {first * 1000:.0f}ms")
+        if result.returncode != 0:
+            failures.append(f"first germination failed: {result.stdout}{result.stderr}")
+        elif tree_files(installed_dir) != source:
+            failures.append("installed files differ from the skill pack")
+
+        result, opened, recheck, recheck_opens = run_conidium(conidium, project, work, "--germinate")
+        _, _, _, baseline_opens = run_conidium(conidium, project, work, "--apoptose", "--dry-run")
+        print(f"Unchanged recheck: {recheck * 1000:.0f}ms, {len(opened)} installed files read, "
+              f"conidium opened {recheck_opens}x ({baseline_opens}x by a dry-run apoptosis)")
+        if opened or "already up to date" not in result.stdout:
+            failures.append(f"unchanged re-check read {len(opened)} files: {result.stdout.strip()}")
+        if recheck_opens != baseline_opens:
+            failures.append(f"unchanged re-check opened the conidium {recheck_opens}x, "
+                            f"{baseline_opens}x without reading blobs")
+
+        docs = sorted(p for p in installed_dir.rglob("*.md"))
+        changed = rng.sample(docs, args.changes)
+        for i, path in enumerate(changed):
+            if i % 2:
+                path.unlink()
+            else:
+                path.write_text(path.read_text() + "local edit\n")
+        result, opened, partial, _ = run_conidium(conidium, project, work, "--germinate")
+        expected = {str(p) for p in changed}
+        print(f"Recheck after {args.changes} changes: {partial * 1000:.0f}ms, {len(set(opened))} installed files read")
+        if set(opened) != expected:
+            extra = sorted(set(opened) - expected)[:5]
+            failures.append(f"re-check after {args.changes} changes read {len(set(opened))} files (extra: {extra})")
+        if tree_files(installed_dir) != source:
+            failures.append("re-check did not restore the changed files")
+
+        edited = installed_dir / "scripts" / "run.sh"
+        edited.write_text(edited.read_text() + "echo local\n")
+        result, _, _, _ = run_conidium(conidium, project, work, "--apoptose")
+        left = [p.relative_to(installed_dir).as_posix() for p in installed_dir.rglob("*") if p.is_file()]
+        print(f"Apoptosis:         {len(left)} modified file(s) kept")
+        if left != ["scripts/run.sh"]:
+            failures.append(f"apoptosis left {left[:5]}, expected only the modified scripts/run.sh")
+    finally:
+        if args.keep:
+            print(f"Kept files in {work}")
+        else:
+            shutil.rmtree(work, ignore_errors=True)
+
+    print()
+    if failures:
+        print(f"Conidium check failed ({len(failures)}):")
+        for failure in failures:
+            print(f"  ! {failure}")
+        sys.exit(1)
+    print("Conidium germinates incrementally.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Skill index check for `sync-myskillium.py index` / `search`.
+
+Generates a project with thousands of synthetic skills (a SKILL.md with
+name/description frontmatter plus a few docs each), builds the index and
+verifies that:
+
+- queries return ranked hits within the latency budget (p95 over many
+  queries against the warm index)
+- field boosts work: a skill whose name and description match outranks
+  skills that only mention the words in a doc body
+- updates are incremental: after K files are edited and one is deleted,
+  `index` re-reads exactly those files, and the sync path (an explicit list
+  of changed files) re-indexes only the listed files
+- search across several projects merges their hits
+- an index file that is not a database (e.g. truncated or overwritten) is
+  rebuilt by the next update instead of failing it
+
+Usage:
+    python bench/bench-index.py [--skills N] [--queries N] [--keep]
+"""
+
+import argparse
+import importlib.util
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+
+sys.path.insert(0, str(REPO_ROOT))
+_spec = importlib.util.spec_from_file_location("sync_myskillium", REPO_ROOT / "sync-myskillium.py")
+sync_myskillium = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(sync_myskillium)
+
+# p95 query latency budget against a warm index, in milliseconds
+QUERY_BUDGET_MS = 50
+
+TOPICS = (
+    "parse render deploy test lint format migrate backup schedule monitor scrape index "
+    "search compress encrypt validate publish review summarize translate refactor profile "
+    "database markdown python shell docker kubernetes invoice calendar email image audio "
+    "video chart report story planning release changelog dependency security license"
+).split()
+
+# Doc vocabulary: generated words plus the topics, drawn with Zipf-like
+# frequencies as in real text (a few words everywhere, most words rare);
+# topic words are mid-frequency, found in roughly a fifth of the docs
+_SYLLABLES = "ka lo mi ne ru sa ti vo ze pa".split()
+_GENERATED = [a + b + c for a in _SYLLABLES for b in _SYLLABLES for c in _SYLLABLES]
+VOCABULARY = _GENERATED[:200] + TOPICS + _GENERATED[200:]
+ZIPF_WEIGHTS = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+
+
+def text(rng: random.Random, count: int) -> str:
+    return " ".join(rng.choices(VOCABULARY, ZIPF_WEIGHTS, k=count))
+
+
+def make_project(root: Path, skills: int, rng: random.Random) -> Path:
+    """Create a project with `skills` synthetic skills under .claude/skills."""
+    for i in range(skills):
+        topic = rng.sample(TOPICS, 3)
+        skill = root / ".claude" / "skills" / f"skill-{i:05d}-{topic[0]}"
+        skill.mkdir(parents=True)
+        (skill / "SKILL.md").write_text(
+            f"---\nname: {topic[0]}-{topic[1]}-{i}\n"
+            f"description: >\n  Helps {topic[0]} and {topic[1]} {topic[2]} files.\n"
+            f"tags: {rng.choice(TOPICS)}\n---\n\n" + text(rng, 150) + "\n"
+        )
+        for j in range(3):
+            (skill / f"doc-{j}.md").write_text(text(rng, 300) + "\n")
+    # One skill that is really about the boosted query; many docs mention
+    # the words in passing
+    target = root / ".claude" / "skills" / "quokka-wrangler"
+    target.mkdir(parents=True)
+    (target / "SKILL.md").write_text(
+        "---\nname: quokka-wrangler\ndescription: Wrangle quokka herds.\n---\n\nHerding guide.\n"
+    )
+    for i in range(0, skills, max(1, skills // 50)):
+        mention = next((root / ".claude" / "skills").glob(f"skill-{i:05d}-*")) / "doc-0.md"
+        mention.write_text(mention.read_text() + "quokka wrangler quokka wrangler quokka\n")
+    return root
+
+
+def timed_search(project: Path, query: str, limit: int = 10) -> tuple[list[dict], float]:
+    start = time.perf_counter()
+    hits = sync_myskillium.search_index(project, query, limit)
+    return hits, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Skill index check")
+    parser.add_argument("--skills", type=int, default=3000, help="Synthetic skills per project")
+    parser.add_argument("--queries", type=int, default=200, help="Queries for the latency measurement")
+    parser.add_argument("--changes", type=int, default=5, help="Files edited before the incremental update")
+    parser.add_argument("--keep", action="store_true", help="Keep the generated projects for inspection")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    work = Path(tempfile.mkdtemp(prefix="myskillium-index-"))
+    failures = []
+    try:
+        project = make_project(work / "a", args.skills, rng)
+        start = time.perf_counter()
+        stats = sync_myskillium.update_index(project)
+        build_ms = (time.perf_counter() - start) * 1000
+        db_size = (project / sync_myskillium.INDEX_DB).stat().st_size
+        print(f"Build:        {stats['files']} files from {args.skills + 1} skills in {build_ms:.0f}ms ({db_size / 1e6:.1f}MB)")
+
+        latencies = []
+        for _ in range(args.queries):
+            query = f"find me a skill that can {' '.join(rng.sample(TOPICS, rng.randint(1, 3)))}"
+            _, ms = timed_search(project, query)
+            latencies.append(ms)
+        latencies.sort()
+        p95 = latencies[int(0.95 * (len(latencies) - 1))]
+        print(f"Query:        p50 {statistics.median(latencies):.1f}ms  p95 {p95:.1f}ms (budget {QUERY_BUDGET_MS}ms)")
+        if p95 > QUERY_BUDGET_MS:
+            failures.append(f"query p95 {p95:.1f}ms exceeds {QUERY_BUDGET_MS}ms")
+
+        hits, _ = timed_search(project, "quokka wrangler")
+        print(f"Boost:        top hit {hits[0]['path'] if hits else None}")
+        if not hits or not hits[0]["path"].endswith("quokka-wrangler/SKILL.md"):
+            failures.append("skill named after the query does not rank first")
+
+        docs = sorted((project / ".claude" / "skills").glob("skill-*/doc-1.md"))
+        edited = rng.sample(docs, args.changes)
+        for path in edited:
+            path.write_text(path.read_text() + "zebrafish\n")
+        removed = docs[0] if docs[0] not in edited else docs[1]
+        removed.unlink()
+        start = time.perf_counter()
+        stats = sync_myskillium.update_index(project)
+        update_ms = (time.perf_counter() - start) * 1000
+        print(f"Update:       {stats['indexed']} re-indexed, {stats['removed']} removed in {update_ms:.0f}ms")
+        if (stats["indexed"], stats["removed"]) != (args.changes, 1):
+            failures.append(f"stat update re-indexed {stats['indexed']} and removed {stats['removed']}, "
+                            f"expected {args.changes} and 1")
+        hits, _ = timed_search(project, "zebrafish", 100)
+        if len(hits) != args.changes:
+            failures.append(f"edited content found in {len(hits)} files, expected {args.changes}")
+
+        changed = [path.relative_to(project).as_posix() for path in edited[:2]]
+        stats = sync_myskillium.update_index(project, changed)
+        if stats["indexed"] != len(changed):
+            failures.append(f"sync update re-indexed {stats['indexed']} files, expected {len(changed)}")
+
+        other = make_project(work / "b", 50, random.Random(7))
+        sync_myskillium.update_index(other)
+        hits = sync_myskillium.search_index(project, "quokka", 5) + sync_myskillium.search_index(other, "quokka", 5)
+        projects = {hit["project"] for hit in hits}
+        print(f"Cross-project: hits from {len(projects)} project(s)")
+        if len(projects) != 2:
+            failures.append("cross-project search did not return hits from both projects")
+
+        (other / sync_myskillium.INDEX_DB).write_bytes(b"not a database" * 100)
+        try:
+            stats = sync_myskillium.update_index(other, changed=[])
+            hits = sync_myskillium.search_index(other, "quokka", 5)
+            print(f"Corrupt:      rebuilt {stats['indexed']} files, {len(hits)} hit(s)")
+            if not hits or stats["indexed"] != stats["files"]:
+                failures.append(f"corrupt index not rebuilt ({stats})")
+        except Exception as e:
+            failures.append(f"corrupt index: {type(e).__name__}: {e}")
+    finally:
+        if args.keep:
+            print(f"Kept projects in {work}")
+        else:
+            shutil.rmtree(work, ignore_errors=True)
+
+    print()
+    if failures:
+        print(f"Skill index check failed ({len(failures)}):")
+        for failure in failures:
+            print(f"  ! {failure}")
+        sys.exit(1)
+    print("Skill index is fast and incremental.")
+
+
+if __name__ == "__main__":
+    main()
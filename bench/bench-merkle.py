@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Merkle comparison check for `sync-myskillium.py compare`.
+
+Generates a project with thousands of synthetic skills (a few docs each,
+some in subdirectories, some scripts executable), copies it, plants a known
+set of differences in the copy and verifies that:
+
+- the indexed directory hashes match a from-scratch Merkle computation in
+  the conidium format (myskillium_spore/germinate.py)
+- comparing the two indexes reports exactly the planted differences
+  (edited, added and removed files, a chmod, a new subdirectory, skills
+  present on one side only) while listing only the directories whose
+  hashes differ, a tiny fraction of the tree
+- identical trees are decided from the root hash alone
+- re-indexing one changed file recomputes only its directory's hash and
+  those of its ancestors, and a chmod alone is picked up by `index`
+
+Usage:
+    python bench/bench-merkle.py [--skills N] [--keep]
+"""
+
+import argparse
+import importlib.util
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+
+sys.path.insert(0, str(REPO_ROOT))
+from myskillium_spore.germinate import hash_file, tree_hashes  # noqa: E402
+
+_spec = importlib.util.spec_from_file_location("sync_myskillium", REPO_ROOT / "sync-myskillium.py")
+sync_myskillium = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(sync_myskillium)
+
+SKILLS = ".claude/skills"
+
+
+def make_project(root: Path, skills: int, rng: random.Random) -> Path:
+    """Create a project with `skills` synthetic skills under .claude/skills."""
+    for i in range(skills):
+        skill = root / SKILLS / f"skill-{i:05d}"
+        (skill / "docs").mkdir(parents=True)
+        (skill / "SKILL.md").write_text(f"---\nname: skill-{i}\n---\n\n{rng.random()}\n")
+        for j in range(2):
+            (skill / "docs" / f"doc-{j}.md").write_text(f"{rng.random()}\n" * 20)
+        if i % 4 == 0:
+            script = skill / "run.sh"
+            script.write_text(f"#!/bin/sh\necho {i}\n")
+            script.chmod(0o755)
+    return root
+
+
+def expected_hashes(project: Path) -> dict[str, str]:
+    """Merkle hash of every directory under .claude/skills, computed from the files."""
+    skills = project / SKILLS
+    files = {
+        path.relative_to(skills).as_posix(): (hash_file(str(path)), bool(path.stat().st_mode & 0o111))
+        for path in skills.rglob("*") if path.is_file() and path.parent != skills
+    }
+    return {f"{SKILLS}/{d}" if d else SKILLS: digest for d, digest in tree_hashes(files).items()}
+
+
+def connect(project: Path) -> sqlite3.Connection:
+    return sqlite3.connect(project / sync_myskillium.INDEX_DB)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merkle comparison check")
+    parser.add_argument("--skills", type=int, default=3000, help="Synthetic skills in the project")
+    parser.add_argument("--keep", action="store_true", help="Keep the generated projects for inspection")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    work = Path(tempfile.mkdtemp(prefix="myskillium-merkle-"))
+    failures = []
+    try:
+        a = make_project(work / "a", args.skills, rng)
+        b = work / "b"
+        shutil.copytree(a, b)
+        skills_b = b / SKILLS
+        (skills_b / "skill-00001" / "docs" / "doc-0.md").write_text("edited\n")
+        (skills_b / "skill-00002" / "SKILL.md").unlink()
+        (skills_b / "skill-00003" / "extra.md").write_text("added\n")
+        (skills_b / "skill-00004" / "run.sh").chmod(0o644)
+        (skills_b / "skill-00005" / "assets").mkdir()
+        (skills_b / "skill-00005" / "assets" / "logo.txt").write_text("logo\n")
+        shutil.rmtree(skills_b / "skill-00006")
+        (skills_b / "local-only").mkdir()
+        (skills_b / "local-only" / "SKILL.md").write_text("mine\n")
+        expected = {
+            "skill-00001": {"status": "diverged", "files": [("~", "docs/doc-0.md")]},
+            "skill-00002": {"status": "diverged", "files": [("-", "SKILL.md")]},
+            "skill-00003": {"status": "diverged", "files": [("+", "extra.md")]},
+            "skill-00004": {"status": "diverged", "files": [("~", "run.sh")]},
+            "skill-00005": {"status": "diverged", "files": [("+", "assets/logo.txt")]},
+            "skill-00006": {"status": "only-a", "files": []},
+            "local-only": {"status": "only-b", "files": []},
+        }
+
+        start = time.perf_counter()
+        sync_myskillium.update_index(a)
+        stats = sync_myskillium.update_index(b)
+        print(f"Build:        2 x {stats['files']} files, {stats['dirs']} directories in "
+              f"{(time.perf_counter() - start) * 1000:.0f}ms")
+
+        conn_a, conn_b = connect(a), connect(b)
+        try:
+            indexed = dict(conn_b.execute("SELECT path, hash FROM dirs"))
+            if indexed != expected_hashes(b):
+                failures.append("indexed directory hashes differ from a from-scratch Merkle computation")
+
+            start = time.perf_counter()
+            diverged, listed = sync_myskillium.compare_indexes(conn_a, conn_b)
+            compare_ms = (time.perf_counter() - start) * 1000
+            total = conn_a.execute("SELECT COUNT(*) FROM dirs").fetchone()[0]
+            print(f"Compare:      {len(diverged)} skills differ, {listed} of {total} directories listed "
+                  f"in {compare_ms:.1f}ms")
+            if diverged != expected:
+                failures.append(f"compare reported {diverged}, expected {expected}")
+            # The root, plus each diverged skill and subdirectory on the path to a change
+            if listed > 1 + 2 * len(expected):
+                failures.append(f"compare listed {listed} directories for {len(expected)} changed skills")
+
+            start = time.perf_counter()
+            diverged, listed = sync_myskillium.compare_indexes(conn_a, conn_a)
+            same_ms = (time.perf_counter() - start) * 1000
+            print(f"Identical:    {listed} directories listed in {same_ms:.2f}ms")
+            if diverged or listed:
+                failures.append("identical trees were not decided from the root hash")
+        finally:
+            conn_a.close()
+            conn_b.close()
+
+        changed = skills_b / "skill-00007" / "docs" / "doc-1.md"
+        changed.write_text("edited again\n")
+        stats = sync_myskillium.update_index(b, [changed.relative_to(b).as_posix()])
+        print(f"Re-index:     {stats['indexed']} file, {stats['dirs']} directory hashes recomputed")
+        if stats["dirs"] != 3:
+            failures.append(f"re-indexing one file recomputed {stats['dirs']} directory hashes, expected 3")
+        (skills_b / "skill-00008" / "run.sh").chmod(0o644)
+        stats = sync_myskillium.update_index(b)
+        if stats["indexed"] != 1:
+            failures.append(f"stat update after a chmod re-indexed {stats['indexed']} files, expected 1")
+        conn_b = connect(b)
+        try:
+            if dict(conn_b.execute("SELECT path, hash FROM dirs")) != expected_hashes(b):
+                failures.append("directory hashes are stale after the incremental update")
+        finally:
+            conn_b.close()
+    finally:
+        if args.keep:
+            print(f"Kept projects in {work}")
+        else:
+            shutil.rmtree(work, ignore_errors=True)
+
+    print()
+    if failures:
+        print(f"Merkle comparison check failed ({len(failures)}):")
+        for failure in failures:
+            print(f"  ! {failure}")
+        sys.exit(1)
+    print("Skill trees are compared by their Merkle hashes, reading only what differs.")
+
+
+if __name__ == "__main__":
+    main()
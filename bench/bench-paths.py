@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark of every spore hook path.
+
+Builds a template project for each outcome documented in
+bootstrap-workflow.md - fast path, source template, sync, worker spawn,
+network error, update available, up to date - with a fake git config
+(`.git/config` naming a dependent or the source remote, global and system
+config isolated) and the local stand-in server (standin.py) as
+REMOTE_VERSION_URL, injecting delays and errors where a scenario needs
+them. Each measured run starts from the scenario's saved `.claude` state
+(the git config, and so the cached source verdict, stays put), and
+myskillium-spore.py is run as a subprocess (`python -S -E`) from a copy of
+the spore:
+
+- cold: a fresh spore copy with no `__pycache__` (first run after install)
+- warm: the same spore copy with its bytecode cached
+
+For each scenario it reports cold and warm (p50/p95) wall-clock latency,
+the modules imported beyond a bare interpreter (`-X importtime`) and the
+files the hook touched (opened, written, renamed, removed - collected with
+an audit hook in one instrumented run, which also checks that the run took
+the expected path via the trace log). Results are compared against a
+stored baseline; regressions exit non-zero.
+
+The remote check itself runs in a detached worker and is not part of any
+session's latency; the worker-spawn scenario's stand-in delays every
+response by 0.5s, and any run that takes that long fails the benchmark.
+
+Usage:
+    python bench/bench-paths.py [--runs N] [--cold-runs N] [--scenario NAME ...]
+                                [--baseline PATH] [--update-baseline]
+                                [--tolerance RATIO] [--keep]
+"""
+
+import argparse
+import json
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+SPORE_LAUNCHER = REPO_ROOT / "myskillium-spore.py"
+SPORE_PACKAGE = "myskillium_spore"
+DEFAULT_BASELINE = BENCH_DIR / "baseline-paths.json"
+
+sys.path.insert(0, str(REPO_ROOT))
+from myskillium_spore import hook  # noqa: E402
+from standin import StandinServer  # noqa: E402
+
+# Interpreter flags the hook is run with
+PYTHON_FLAGS = ["-S", "-E"]
+
+# Git remotes written into the fake `.git/config`
+SOURCE_REMOTE = "https://github.com/Mharbulous/Myskillium.git"
+DEPENDENT_REMOTE = "https://github.com/example/dependent-app.git"
+
+# Scenario -> trace path the measured run must take
+SCENARIOS = {
+    "fast": "fast",
+    "source": "source",
+    "sync": "sync",
+    "worker-spawn": "remote-spawn",
+    "network-error": "remote-error",
+    "update-available": "remote-update",
+    "up-to-date": "remote-current",
+}
+
+# Metrics compared against the baseline and their default tolerances
+# (relative increase allowed before a scenario is flagged as a regression)
+METRIC_TOLERANCES = {
+    "cold_ms": 0.5,
+    "warm_p50_ms": 0.5,
+    "warm_p95_ms": 1.0,
+    "modules": 0.0,
+    "files_touched": 0.0,
+    "files_written": 0.0,
+}
+
+# Latency differences below this are noise and never flagged
+TIME_FLOOR_MS = 5.0
+
+# Stand-in response delay during measured runs; a session that spawns the
+# worker must return well before the worker could have heard back
+WORKER_DELAY_S = 0.5
+
+# Runs the launcher under an audit hook that records the files it touches
+# (argv: spore dir, launcher, output file)
+AUDIT_RUNNER = """
+import os, sys
+spore, launcher, out = sys.argv[1:4]
+touched = {}
+def audit(event, args):
+    if event == "open" and isinstance(args[0], (str, bytes)):
+        mode, flags = args[1], args[2]
+        write = (mode and any(c in mode for c in "wax+")) or (mode is None and flags & (os.O_WRONLY | os.O_RDWR))
+        touched[os.fsdecode(args[0])] = touched.get(os.fsdecode(args[0])) or bool(write)
+    elif event in ("os.rename", "os.remove", "os.utime", "os.mkdir"):
+        for path in args[:2] if event == "os.rename" else args[:1]:
+            if isinstance(path, (str, bytes)):
+                touched[os.fsdecode(path)] = True
+def dump():
+    with open(out, "w") as f:
+        f.write("\\n".join(f"{int(w)} {p}" for p, w in touched.items()))
+import atexit
+atexit.register(dump)
+sys.addaudithook(audit)
+sys.argv = [launcher]
+sys.path.insert(0, spore)
+import runpy
+runpy.run_path(launcher, run_name="__main__")
+"""
+
+IMPORTTIME_RE = re.compile(r"^import time:\s+\d+ \|\s+\d+ \|( *)(\S+)")
+
+# Temp files of the hook's atomic writes (`.<name>.<pid>.tmp`)
+TEMP_FILE_RE = re.compile(r"/\.[^/]+\.\d+\.tmp$")
+
+
+# ---------------------------------------------------------------------------
+# Spore copies and scenario projects
+# ---------------------------------------------------------------------------
+
+def copy_spore(dest: Path) -> Path:
+    """Copy the launcher and package (without bytecode) to dest; return the launcher path."""
+    dest.mkdir(parents=True)
+    shutil.copy2(SPORE_LAUNCHER, dest / SPORE_LAUNCHER.name)
+    shutil.copytree(REPO_ROOT / SPORE_PACKAGE, dest / SPORE_PACKAGE, ignore=shutil.ignore_patterns("__pycache__"))
+    return dest / SPORE_LAUNCHER.name
+
+
+def write_git_config(project: Path, remote_url: str) -> None:
+    """Create a minimal `.git` directory whose origin is remote_url (no git needed)."""
+    git_dir = project / ".git"
+    git_dir.mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    (git_dir / "config").write_text(
+        "[core]\n\trepositoryformatversion = 0\n\tbare = false\n"
+        f'[remote "origin"]\n\turl = {remote_url}\n\tfetch = +refs/heads/*:refs/remotes/origin/*\n'
+    )
+
+
+def base_env(work: Path, server: StandinServer) -> dict:
+    """Environment shared by every run: isolated git config, stand-in remote, bytecode enabled."""
+    env = dict(os.environ)
+    for key in list(env):
+        if key.startswith("MYSKILLIUM_SPORE_") or key in ("PYTHONDONTWRITEBYTECODE", "CLAUDE_PROJECT_DIR"):
+            del env[key]
+    (work / "gitconfig").touch()
+    env["GIT_CONFIG_NOSYSTEM"] = "1"
+    env["GIT_CONFIG_GLOBAL"] = str(work / "gitconfig")
+    env["MYSKILLIUM_SPORE_REMOTE_URL"] = server.url("/version.yml")
+    # Measure the full work of each path rather than the budget's cut-off
+    env["MYSKILLIUM_SPORE_BUDGET_MS"] = "10000"
+    return env
+
+
+def run_hook(launcher: Path, project: Path, env: dict, extra_env: dict | None = None) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *PYTHON_FLAGS, str(launcher)],
+        env=dict(env, CLAUDE_PROJECT_DIR=str(project), **(extra_env or {})),
+        capture_output=True, text=True,
+    )
+
+
+def snapshot(project: Path, dest: Path) -> None:
+    """Save a project's `.claude` state."""
+    shutil.copytree(project / ".claude", dest, symlinks=True)
+
+
+def restore(project: Path, saved: Path) -> None:
+    """Reset a project's `.claude` state to a snapshot."""
+    shutil.rmtree(project / ".claude", ignore_errors=True)
+    shutil.copytree(saved, project / ".claude", symlinks=True)
+
+
+def settle(project: Path, timeout: float = 15.0) -> None:
+    """Wait until no background worker holds the project's worker lock."""
+    lock = hook.remote_state_path(project, hook.REMOTE_WORKER_LOCK_NAME)
+    deadline = time.time() + timeout
+    while lock.exists() and time.time() < deadline:
+        time.sleep(0.02)
+
+
+def wait_for_worker(project: Path, timeout: float = 15.0) -> None:
+    """Wait until the background worker has written its result and released its lock."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if (hook.remote_state_path(project, hook.REMOTE_RESULT_NAME).exists()
+                and not hook.remote_state_path(project, hook.REMOTE_WORKER_LOCK_NAME).exists()):
+            return
+        time.sleep(0.05)
+    raise RuntimeError(f"background worker for {project} did not finish")
+
+
+def make_due(project: Path) -> None:
+    """Make the check-state marker due now, keeping its failure count."""
+    hook.write_check_state(project, time.time() - 1, hook.read_check_failures(project))
+
+
+def age_version(project: Path) -> None:
+    """Drop the marker and age version.yml so the next run does a full check."""
+    (project / hook.CHECK_STATE_FILE).unlink(missing_ok=True)
+    version = project / hook.VERSION_FILE
+    content = version.read_text(encoding="utf-8")
+    version.write_text(re.sub(r'(?m)^last_check: .*$', 'last_check: "2000-01-01T00:00:00"', content), encoding="utf-8")
+
+
+def prepare(name: str, project: Path, launcher: Path, env: dict, server: StandinServer) -> None:
+    """Set up a scenario's project so that the next hook run takes its path."""
+    embedded = hook.calculate_embedded_hash()
+    write_git_config(project, SOURCE_REMOTE if name == "source" else DEPENDENT_REMOTE)
+    if name == "sync":
+        return  # first run after install
+    if name == "source":
+        run_hook(launcher, project, env)  # caches the source verdict
+        make_due(project)
+        return
+
+    run_hook(launcher, project, env)  # first run syncs the docs
+    if name == "fast":
+        hook.write_check_state(project, time.time() + 3600)
+        return
+    age_version(project)
+    if name == "worker-spawn":
+        return
+
+    # Let a real worker produce the remote result against the stand-in
+    server.delays.clear()
+    server.errors = {"*": 503} if name == "network-error" else {}
+    remote_hash = "0" * 64 if name == "update-available" else embedded
+    server.resources["/version.yml"] = f'hash: "{remote_hash}"\n'.encode()
+    run_hook(launcher, project, env)
+    wait_for_worker(project)
+    make_due(project)
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+def imported_modules(args: list[str], env: dict) -> list[str]:
+    """Run Python with -X importtime and return the modules it imported."""
+    result = subprocess.run([sys.executable, *PYTHON_FLAGS, "-X", "importtime", *args], capture_output=True, text=True, env=env)
+    return [m.group(2) for m in map(IMPORTTIME_RE.match, result.stderr.splitlines()) if m]
+
+
+def instrumented_run(work: Path, project: Path, saved: Path, launcher: Path, env: dict, baseline_modules: set) -> dict:
+    """One run with -X importtime, an audit hook and tracing; returns path, modules and files."""
+    restore(project, saved)
+    touched_file = work / "touched.txt"
+    trace_file = work / "trace.jsonl"
+    trace_file.unlink(missing_ok=True)
+    run_env = dict(env, CLAUDE_PROJECT_DIR=str(project), MYSKILLIUM_SPORE_TRACE=str(trace_file))
+
+    loaded = imported_modules(["-c", AUDIT_RUNNER, str(launcher.parent), str(launcher), str(touched_file)], run_env)
+    settle(project)
+    # The runner itself imports runpy and friends; only count what the hook adds
+    runner_only = set(imported_modules(["-c", "import atexit, runpy"], run_env))
+    modules = [m for m in dict.fromkeys(loaded) if m not in baseline_modules and m not in runner_only]
+
+    # Only files in the project or the spore count (bytecode included);
+    # atomic-write temp files are folded into the file they replace
+    roots = (str(project), str(launcher.parent))
+    touched = {}
+    for line in touched_file.read_text().splitlines():
+        written, _, path = line.partition(" ")
+        if path.startswith(roots) and not TEMP_FILE_RE.search(path) and not os.path.isdir(path):
+            touched[path] = touched.get(path) or written == "1"
+
+    path = None
+    if trace_file.exists():
+        records = [json.loads(line) for line in trace_file.read_text().splitlines() if line.strip()]
+        path = records[-1]["path"] if records else None
+    return {
+        "path": path,
+        "modules": modules,
+        "files_touched": sorted(touched),
+        "files_written": sorted(p for p, w in touched.items() if w),
+    }
+
+
+def timed_runs(work: Path, project: Path, saved: Path, launcher: Path, env: dict, runs: int, fresh_spore: bool) -> list[float]:
+    """Run the hook `runs` times, each from the saved state; return wall-clock ms."""
+    times = []
+    for _ in range(runs):
+        restore(project, saved)
+        if fresh_spore:
+            # A spawned worker may still be running from the previous copy
+            launcher = copy_spore(Path(tempfile.mkdtemp(prefix="spore-", dir=work)) / "spore")
+        start = time.perf_counter()
+        run_hook(launcher, project, env)
+        times.append((time.perf_counter() - start) * 1000)
+        settle(project)
+    return times
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def compare(results: dict, baseline: dict, tolerance: float | None) -> list[str]:
+    """Return a list of regression descriptions (empty if none)."""
+    regressions = []
+    for name, metrics in results.items():
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            continue
+        for metric, default_tol in METRIC_TOLERANCES.items():
+            new, old = metrics.get(metric), base.get(metric)
+            if new is None or old is None:
+                continue
+            if metric.endswith("_ms") and new - old < TIME_FLOOR_MS:
+                continue
+            tol = default_tol if tolerance is None else tolerance
+            if new > old * (1 + tol):
+                pct = (new / old - 1) * 100 if old else float("inf")
+                regressions.append(f"{name}: {metric} {old} -> {new} (+{pct:.0f}%, limit +{tol * 100:.0f}%)")
+    return regressions
+
+
+def print_table(results: dict) -> None:
+    columns = ["cold_ms", "warm_p50_ms", "warm_p95_ms", "modules", "files_touched", "files_written"]
+    header = f"{'scenario':<18}" + "".join(f"{c:>15}" for c in columns)
+    print(header)
+    print("-" * len(header))
+    for name, metrics in results.items():
+        cells = "".join(
+            f"{metrics[c]:>15.1f}" if isinstance(metrics[c], float) else f"{metrics[c]:>15}" for c in columns
+        )
+        print(f"{name:<18}{cells}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end benchmark of every spore hook path")
+    parser.add_argument("--runs", type=int, default=20, help="Warm runs per scenario")
+    parser.add_argument("--cold-runs", type=int, default=5, help="Cold runs (fresh spore copy) per scenario")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="Only run this scenario (repeatable)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="Write results as the new baseline")
+    parser.add_argument("--tolerance", type=float, help="Override per-metric regression tolerance (e.g. 0.2)")
+    parser.add_argument("--keep", action="store_true", help="Keep the generated projects for inspection")
+    args = parser.parse_args()
+
+    names = [n for n in SCENARIOS if not args.scenario or n in args.scenario]
+    work = Path(tempfile.mkdtemp(prefix="myskillium-paths-"))
+    results = {}
+    details = {}
+    failures = []
+    try:
+        with StandinServer({"/version.yml": b""}) as server:
+            env = base_env(work, server)
+            launcher = copy_spore(work / "spore")
+            baseline_modules = set(imported_modules(["-c", "pass"], env))
+
+            for name in names:
+                print(f"Preparing {name}...")
+                project = work / "projects" / name
+                project.mkdir(parents=True)
+                prepare(name, project, launcher, env, server)
+                (project / ".claude").mkdir(exist_ok=True)
+                snapshot(project, work / "saved" / name)
+
+            # Measured runs see an up-to-date upstream; spawned workers are
+            # slowed down to show that sessions never wait for them
+            server.errors = {}
+            server.delays = {"*": WORKER_DELAY_S}
+            server.resources["/version.yml"] = f'hash: "{hook.calculate_embedded_hash()}"\n'.encode()
+
+            for name in names:
+                print(f"Running {name}...")
+                project, saved = work / "projects" / name, work / "saved" / name
+                timed_runs(work, project, saved, launcher, env, 1, fresh_spore=False)  # warm the bytecode
+                cold = timed_runs(work, project, saved, launcher, env, args.cold_runs, fresh_spore=True)
+                warm = timed_runs(work, project, saved, launcher, env, args.runs, fresh_spore=False)
+                info = instrumented_run(work, project, saved, launcher, env, baseline_modules)
+                if info["path"] != SCENARIOS[name]:
+                    failures.append(f"{name}: took path {info['path']!r}, expected {SCENARIOS[name]!r}")
+                if max(warm) >= WORKER_DELAY_S * 1000:
+                    failures.append(f"{name}: a run took {max(warm):.0f}ms, as long as the remote check")
+                details[name] = info
+                results[name] = {
+                    "cold_ms": round(statistics.median(cold), 1),
+                    "warm_p50_ms": round(statistics.median(warm), 1),
+                    "warm_p95_ms": round(percentile(warm, 95), 1),
+                    "modules": len(info["modules"]),
+                    "files_touched": len(info["files_touched"]),
+                    "files_written": len(info["files_written"]),
+                }
+    finally:
+        if args.keep:
+            print(f"Kept benchmark projects in {work}")
+        else:
+            shutil.rmtree(work, ignore_errors=True)
+
+    print()
+    print_table(results)
+    print()
+    for name, info in details.items():
+        project = work / "projects" / name
+        written = [os.path.relpath(p, project) if p.startswith(str(project)) else os.path.basename(p)
+                   for p in info["files_written"]]
+        print(f"{name}: writes {', '.join(written) or 'nothing'}")
+    print()
+
+    if failures:
+        print(f"Failures ({len(failures)}):")
+        for failure in failures:
+            print(f"  ! {failure}")
+        sys.exit(1)
+
+    # Module counts depend on the interpreter version
+    params = {"python": f"{sys.version_info.major}.{sys.version_info.minor}"}
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps({"params": params, "results": results}, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one.")
+        return
+
+    baseline = json.loads(args.baseline.read_text())
+    if baseline.get("params") != params:
+        print("Baseline was recorded with different parameters; skipping comparison.")
+        print(f"  baseline: {baseline.get('params')}")
+        print(f"  current:  {params}")
+        return
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"Regressions ({len(regressions)}):")
+        for r in regressions:
+            print(f"  ! {r}")
+        sys.exit(1)
+    print("No regressions against baseline.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate check for `sync-myskillium.py similar`.
+
+Generates a fleet of projects that each hold a random selection of skills
+from a shared upstream pool (unmodified copies), then plants:
+
+- a fork: a pool skill whose copy in one project has one doc edited, one
+  doc removed and a script added
+- a renamed copy: a pool skill copied under another name, files unchanged
+
+and verifies that:
+
+- looking up a skill finds every copy of it across the fleet, scores the
+  fork below 1 and the copies at 1, and lists exactly the fork's differing
+  files
+- a lookup is sub-linear: it scores only the skills sharing an LSH bucket,
+  a small fraction of the fleet, within the latency budget (p95)
+- the all-pairs scan finds the planted fork and renamed copy and pairs no
+  two different pool skills
+- editing the fork and re-indexing just that file recomputes one skill
+  signature and lowers the fork's score
+
+Usage:
+    python bench/bench-similar.py [--projects N] [--skills N] [--keep]
+"""
+
+import argparse
+import importlib.util
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+
+sys.path.insert(0, str(REPO_ROOT))
+_spec = importlib.util.spec_from_file_location("sync_myskillium", REPO_ROOT / "sync-myskillium.py")
+sync_myskillium = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(sync_myskillium)
+
+# p95 latency budget of a single-skill lookup across the fleet, in milliseconds
+QUERY_BUDGET_MS = 50
+
+# Same Zipf-like doc vocabulary as bench-index.py
+_SYLLABLES = "ka lo mi ne ru sa ti vo ze pa".split()
+VOCABULARY = [a + b + c for a in _SYLLABLES for b in _SYLLABLES for c in _SYLLABLES]
+ZIPF_WEIGHTS = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+
+
+def lines(rng: random.Random, count: int) -> list[str]:
+    return [" ".join(rng.choices(VOCABULARY, ZIPF_WEIGHTS, k=rng.randint(8, 14))) for _ in range(count)]
+
+
+def make_pool(size: int, rng: random.Random) -> dict[str, dict[str, str]]:
+    """Upstream skills: {name: {relative path: content}}."""
+    pool = {}
+    for i in range(size):
+        name = f"pool-{i:04d}"
+        files = {"SKILL.md": f"---\nname: {name}\ndescription: Pool skill {i}.\n---\n\n"
+                             + "\n".join(lines(rng, 15)) + "\n"}
+        for j in range(3):
+            files[f"doc-{j}.md"] = "\n".join(lines(rng, 25)) + "\n"
+        pool[name] = files
+    return pool
+
+
+def write_skill(project: Path, name: str, files: dict[str, str]) -> None:
+    for rel, content in files.items():
+        path = project / ".claude" / "skills" / name / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+def timed_similar(projects: list[Path], skill: str | None, threshold: float) -> tuple[list[dict], int, float]:
+    start = time.perf_counter()
+    matches, checked = sync_myskillium.similar_skills(projects, skill, threshold)
+    return matches, checked, (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Near-duplicate skill check")
+    parser.add_argument("--projects", type=int, default=20, help="Projects in the fleet")
+    parser.add_argument("--skills", type=int, default=100, help="Pool skills copied into each project")
+    parser.add_argument("--pool", type=int, default=400, help="Skills in the upstream pool")
+    parser.add_argument("--threshold", type=float, default=0.5, help="Similarity threshold")
+    parser.add_argument("--keep", action="store_true", help="Keep the generated fleet for inspection")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    pool = make_pool(args.pool, rng)
+    target, renamed_from = "pool-0000", "pool-0001"
+    work = Path(tempfile.mkdtemp(prefix="myskillium-similar-"))
+    failures = []
+    try:
+        projects = []
+        holders = set()
+        for p in range(args.projects):
+            project = work / f"project-{p:02d}"
+            chosen = set(rng.sample(sorted(pool), args.skills))
+            if p < 2:
+                chosen |= {target, renamed_from}
+            for name in chosen:
+                write_skill(project, name, pool[name])
+            if target in chosen:
+                holders.add(project)
+            projects.append(project)
+
+        # The fork lives in project 1, the renamed copy in project 0
+        fork = projects[1] / ".claude" / "skills" / target
+        edited = lines(rng, 25)
+        doc = (fork / "doc-1.md").read_text().splitlines()
+        doc[3:6] = edited[:3]
+        (fork / "doc-1.md").write_text("\n".join(doc) + "\n")
+        (fork / "doc-2.md").unlink()
+        (fork / "scripts").mkdir()
+        (fork / "scripts" / "extra.sh").write_text("#!/bin/sh\n" + "\n".join(edited[3:]) + "\n")
+        write_skill(projects[0], "renamed-copy", pool[renamed_from])
+        expected_files = [("~", "doc-1.md"), ("-", "doc-2.md"), ("+", "scripts/extra.sh")]
+
+        start = time.perf_counter()
+        for project in projects:
+            sync_myskillium.update_index(project)
+        total = sum(len(list((p / ".claude" / "skills").iterdir())) for p in projects)
+        print(f"Fleet:        {total} skills in {len(projects)} projects, indexed in "
+              f"{(time.perf_counter() - start) * 1000:.0f}ms")
+
+        matches, checked, _ = timed_similar(projects, target, args.threshold)
+        found = {match["b"][0] for match in matches if match["b"][1] == target} | {projects[0]}
+        fork_match = next((m for m in matches if m["b"] == (projects[1], target)), None)
+        print(f"Lookup:       {len(matches)} match(es) of {target}, {checked} candidate(s) scored")
+        if found != holders:
+            failures.append(f"lookup found {len(found)} of the {len(holders)} projects holding {target}")
+        if fork_match is None:
+            failures.append("lookup did not find the fork")
+        else:
+            print(f"Fork:         score {fork_match['score']:.2f}, files {fork_match['files']}")
+            if not args.threshold <= fork_match["score"] < 1:
+                failures.append(f"fork scored {fork_match['score']:.2f}")
+            if fork_match["files"] != expected_files:
+                failures.append(f"fork files {fork_match['files']}, expected {expected_files}")
+        if any(m["score"] != 1 for m in matches if m is not fork_match):
+            failures.append("an unmodified copy scored below 1")
+        if checked > total / 10:
+            failures.append(f"lookup scored {checked} of {total} skills (not sub-linear)")
+
+        own = sorted(path.name for path in (projects[0] / ".claude" / "skills").iterdir())
+        latencies = []
+        for _ in range(50):
+            _, _, ms = timed_similar(projects, rng.choice(own), args.threshold)
+            latencies.append(ms)
+        latencies.sort()
+        p95 = latencies[int(0.95 * (len(latencies) - 1))]
+        print(f"Query:        p50 {statistics.median(latencies):.1f}ms  p95 {p95:.1f}ms (budget {QUERY_BUDGET_MS}ms)")
+        if p95 > QUERY_BUDGET_MS:
+            failures.append(f"lookup p95 {p95:.1f}ms exceeds {QUERY_BUDGET_MS}ms")
+
+        matches, checked, ms = timed_similar(projects, None, args.threshold)
+        names = {frozenset((m["a"][1], m["b"][1])) for m in matches}
+        print(f"All pairs:    {len(matches)} pair(s), {checked} candidate(s) scored in {ms:.0f}ms")
+        if frozenset((renamed_from, "renamed-copy")) not in names:
+            failures.append("all-pairs scan missed the renamed copy")
+        if not any((projects[1], target) in (m["a"], m["b"]) and m["score"] < 1 for m in matches):
+            failures.append("all-pairs scan missed the fork")
+        strays = names - {frozenset((target,)), frozenset((renamed_from,)), frozenset((renamed_from, "renamed-copy"))}
+        strays = {pair for pair in strays if len(pair) > 1}
+        if strays:
+            failures.append(f"all-pairs scan paired different skills: {sorted(map(sorted, strays))[:3]}")
+
+        doc = (fork / "doc-0.md").read_text().splitlines()
+        doc[10:16] = lines(rng, 6)
+        (fork / "doc-0.md").write_text("\n".join(doc) + "\n")
+        stats = sync_myskillium.update_index(projects[1], [(fork / "doc-0.md").relative_to(projects[1]).as_posix()])
+        matches, _, _ = timed_similar(projects, target, args.threshold)
+        rescored = next((m["score"] for m in matches if m["b"] == (projects[1], target)), 0)
+        print(f"Re-index:     {stats['skills']} signature(s) recomputed, fork now scores {rescored:.2f}")
+        if stats["skills"] != 1:
+            failures.append(f"re-indexing one file recomputed {stats['skills']} skill signatures")
+        if fork_match and not 0 < rescored < fork_match["score"]:
+            failures.append("fork score did not drop after a further edit")
+    finally:
+        if args.keep:
+            print(f"Kept fleet in {work}")
+        else:
+            shutil.rmtree(work, ignore_errors=True)
+
+    print()
+    if failures:
+        print(f"Near-duplicate check failed ({len(failures)}):")
+        for failure in failures:
+            print(f"  ! {failure}")
+        sys.exit(1)
+    print("Similar skills are found by bucket lookups, with the files that differ.")
+
+
+if __name__ == "__main__":
+    main()
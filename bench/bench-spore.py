@@ -0,0 +1,652 @@
+#!/usr/bin/env python3
+"""
+Startup budget check for the Myskillium spore hook.
+
+Runs myskillium-spore.py as a subprocess (under `python -S -E`, as the hook
+is meant to be invoked) against a temporary project that is on the fast
+path (check-state marker not yet due) and verifies that:
+
+- the hook package is loaded from cached bytecode (nothing recompiled
+  except the tiny launcher script itself)
+- the hook module, the embedded doc payload and heavy modules (including
+  datetime and pathlib) are never imported
+- the number of modules imported beyond interpreter startup stays within
+  budget (`-X importtime`)
+- the wall-clock overhead over a bare `python -S -E -c pass`, measured over
+  many runs, stays within the latency budget
+
+It also runs the background remote update check against a local stand-in
+server (standin.py) and verifies that the session never waits for the
+network, that exactly one worker request is made per check, and that the
+second check is a conditional request answered with a bodyless 304.
+
+With tracing enabled (MYSKILLIUM_SPORE_TRACE) the fast path must still
+avoid the forbidden modules, every run must leave one trace record, and
+`python -m myskillium_spore.trace` must aggregate them.
+
+It also publishes a newer upstream version.yml (as build-spore.py writes it)
+on the stand-in and verifies that the worker downloads only the changed docs
+over one connection, verifies them and applies them (recorded as
+`source: upstream`), that later checks keep them, and that a doc which does
+not match its published hash is never written.
+
+It copies the spore, syncs a project with it, then rebuilds the copy's
+payload with a changed doc (as copying in a newer spore does) and verifies
+that the next due check rewrites the doc from the new payload.
+
+It checks the latency budget: a first-run sync fits the default budget, a
+step that stalls (a doc that is a FIFO, like a hung network file system) is
+interrupted by the watchdog within the budget, and the overrun is recorded
+with the step that caused it and the check deferred. With a budget too small
+for even the hook's import, the check is deferred at most
+BUDGET_MAX_DEFERRALS times in a row and then syncs under the hard cap; a
+stalled step is cut off at the cap too, releasing the lock and backing the
+check off like a failed one.
+
+It checks the scheduler against the stand-in: failed checks back off
+exponentially within their jitter bounds, an available update is re-announced
+on the reminder cadence without refetching, and an up-to-date check is
+rescheduled one (jittered) check interval ahead.
+
+Finally it launches many hooks at once (as parallel sessions opening the
+same project do) and verifies that exactly one of them syncs the docs,
+exactly one remote request is made, and no doc or state file is torn.
+
+Exits non-zero if any budget is exceeded.
+
+Usage:
+    python bench/bench-spore.py [--runs N] [--concurrency N]
+"""
+
+import argparse
+import importlib.util
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+SPORE_LAUNCHER = REPO_ROOT / "myskillium-spore.py"
+SPORE_PACKAGE = "myskillium_spore"
+
+sys.path.insert(0, str(REPO_ROOT))
+from myskillium_spore import hook  # noqa: E402
+from standin import StandinServer  # noqa: E402
+
+_spec = importlib.util.spec_from_file_location("build_spore", REPO_ROOT / "build-spore.py")
+build_spore = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(build_spore)
+
+# Interpreter flags the hook is run with
+PYTHON_FLAGS = ["-S", "-E"]
+
+# Modules that must never be imported on the fast path
+FAST_PATH_FORBIDDEN = [
+    f"{SPORE_PACKAGE}.hook",
+    f"{SPORE_PACKAGE}.payload",
+    "datetime",
+    "pathlib",
+    "hashlib",
+    "subprocess",
+    "urllib.request",
+    "json",
+    "zlib",
+    "base64",
+]
+
+# Maximum modules imported on the fast path beyond `python -S -E -c pass`
+FAST_PATH_MODULE_BUDGET = 10
+
+# Maximum median wall-clock overhead of the fast path over a bare interpreter
+FAST_PATH_OVERHEAD_BUDGET_MS = 5.0
+
+# Maximum size of the launcher script, which is recompiled on every run
+LAUNCHER_SIZE_BUDGET = 1024
+
+IMPORTTIME_RE = re.compile(r"^import time:\s+\d+ \|\s+\d+ \|( *)(\S+)")
+
+
+def hook_env(project: Path, budget_ms: float = 10000) -> dict:
+    """
+    Environment for running the hook (bytecode writing enabled).
+
+    Functional checks get a generous latency budget so that a loaded
+    machine (or dozens of hooks started at once) does not defer them;
+    check_budget() tests the real default.
+    """
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["CLAUDE_PROJECT_DIR"] = str(project)
+    env["MYSKILLIUM_SPORE_BUDGET_MS"] = f"{budget_ms:g}"
+    return env
+
+
+def make_fast_path_project(root: Path) -> Path:
+    """Create a project whose check-state marker is due in an hour."""
+    hook.write_check_state(root, time.time() + 3600)
+    return root
+
+
+def imported_modules(args: list[str], env: dict) -> list[str]:
+    """Run Python with -X importtime and return the modules it imported."""
+    result = subprocess.run(
+        [sys.executable, *PYTHON_FLAGS, "-X", "importtime", *args],
+        capture_output=True, text=True, env=env,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{args} exited {result.returncode}:\n{result.stderr}")
+    return [m.group(2) for m in map(IMPORTTIME_RE.match, result.stderr.splitlines()) if m]
+
+
+def recompiled_modules(env: dict) -> list[str]:
+    """Run the hook with -v and return spore modules not loaded from a .pyc."""
+    result = subprocess.run(
+        [sys.executable, *PYTHON_FLAGS, "-v", str(SPORE_LAUNCHER)],
+        capture_output=True, text=True, env=env,
+    )
+    recompiled = []
+    for line in result.stderr.splitlines():
+        # "# code object from '<path>.pyc'" means a cache hit
+        if line.startswith("# code object from") and SPORE_PACKAGE in line and ".pyc" not in line:
+            recompiled.append(line.split("from", 1)[1].strip(" '"))
+    return recompiled
+
+
+def run_full_check(env: dict, project: Path) -> subprocess.CompletedProcess:
+    """Force a full check (drop the marker, age version.yml) and run the hook once."""
+    (project / hook.CHECK_STATE_FILE).unlink(missing_ok=True)
+    version = project / hook.VERSION_FILE
+    if version.exists():
+        content = version.read_text(encoding="utf-8")
+        version.write_text(re.sub(r'(?m)^last_check: .*$', 'last_check: "2000-01-01T00:00:00"', content), encoding="utf-8")
+    return subprocess.run([sys.executable, *PYTHON_FLAGS, str(SPORE_LAUNCHER)], env=env, capture_output=True, text=True)
+
+
+def wait_for_worker(project: Path, timeout: float = 15.0) -> bool:
+    """Wait until the background worker has written its result and exited."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if (hook.remote_state_path(project, hook.REMOTE_RESULT_NAME).exists()
+                and not hook.remote_state_path(project, hook.REMOTE_WORKER_LOCK_NAME).exists()):
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def check_trace() -> list[str]:
+    """Trace a sync and some fast-path runs, then aggregate them with the report command."""
+    failures = []
+    with tempfile.TemporaryDirectory(prefix="myskillium-spore-bench-") as tmp:
+        project = Path(tmp)
+        env = hook_env(project)
+        env["MYSKILLIUM_SPORE_TRACE"] = "1"
+        run_full_check(env, project)
+        for _ in range(3):
+            subprocess.run([sys.executable, *PYTHON_FLAGS, str(SPORE_LAUNCHER)], env=env, capture_output=True)
+        loaded = imported_modules([str(SPORE_LAUNCHER)], env)
+        failures += [f"traced fast path imported {m}" for m in FAST_PATH_FORBIDDEN if m in loaded]
+
+        report = subprocess.run(
+            [sys.executable, "-m", f"{SPORE_PACKAGE}.trace", "--project", str(project)],
+            env=env, cwd=REPO_ROOT, capture_output=True, text=True,
+        )
+        runs = re.search(r"(\d+) run\(s\)", report.stdout)
+        print(f"Trace report:         {runs.group(0) if runs else 'failed'}")
+        if report.returncode != 0 or not runs or int(runs.group(1)) != 5:
+            failures.append(f"trace report did not cover the 5 traced runs:\n{report.stdout}{report.stderr}")
+        for path in ("sync", "fast"):
+            if not re.search(rf"^  {path} ", report.stdout, re.MULTILINE):
+                failures.append(f"trace report has no {path} runs")
+    return failures
+
+
+def check_remote() -> list[str]:
+    """Run two background remote checks against the stand-in; the second must be a 304."""
+    failures = []
+    version_yml = f'hash: "{hook.calculate_embedded_hash()}"\n'.encode()
+    with tempfile.TemporaryDirectory(prefix="myskillium-spore-bench-") as tmp, \
+            StandinServer({"/version.yml": version_yml}, delays={"*": 1.0}) as server:
+        project = Path(tmp)
+        env = hook_env(project)
+        env["MYSKILLIUM_SPORE_REMOTE_URL"] = server.url("/version.yml")
+
+        run_full_check(env, project)  # first run syncs the docs
+        if server.stats["requests"]:
+            failures.append("sync run contacted the remote")
+
+        for expected in ("200", "304"):
+            server.reset()
+            hook.remote_state_path(project, hook.REMOTE_RESULT_NAME).unlink(missing_ok=True)
+            start = time.perf_counter()
+            run_full_check(env, project)
+            session_ms = (time.perf_counter() - start) * 1000
+            if not wait_for_worker(project):
+                failures.append(f"background worker ({expected}) did not finish")
+                continue
+            stats = dict(server.stats)
+            print(f"Remote check ({expected}):   {stats['requests']} request(s), "
+                  f"{stats['connections']} connection(s), {stats['bytes_sent']} body bytes, "
+                  f"session {session_ms:.0f}ms with a 1s server delay")
+            if session_ms > 500:
+                failures.append(f"session waited {session_ms:.0f}ms on the remote check")
+            if stats["requests"] != 1 or stats["connections"] != 1:
+                failures.append(f"remote check ({expected}) made {stats['requests']} requests "
+                                f"over {stats['connections']} connections, expected 1")
+            if expected == "304" and (stats["not_modified"] != 1 or stats["bytes_sent"]):
+                failures.append("second remote check was not a bodyless 304")
+    return failures
+
+
+def read_schedule(project: Path) -> tuple[float, int]:
+    """Return (seconds until due, failures) from the check-state marker."""
+    state = project / hook.CHECK_STATE_FILE
+    return state.stat().st_mtime - time.time(), hook.read_check_failures(project)
+
+
+def run_due_check(env: dict, project: Path, refetch: bool) -> subprocess.CompletedProcess:
+    """Make the marker due (keeping its counts) and run the hook, letting a worker finish."""
+    if refetch:
+        hook.remote_state_path(project, hook.REMOTE_RESULT_NAME).unlink(missing_ok=True)
+    hook.write_check_state(project, time.time() - 1, hook.read_check_failures(project), hook.read_check_deferrals(project))
+    result = subprocess.run([sys.executable, *PYTHON_FLAGS, str(SPORE_LAUNCHER)], env=env, capture_output=True, text=True)
+    if refetch:
+        wait_for_worker(project)
+        hook.write_check_state(project, time.time() - 1, hook.read_check_failures(project), hook.read_check_deferrals(project))
+        result = subprocess.run([sys.executable, *PYTHON_FLAGS, str(SPORE_LAUNCHER)], env=env, capture_output=True, text=True)
+    return result
+
+
+def read_overruns(project: Path) -> list[list[str]]:
+    """Return the recorded budget overruns as split lines."""
+    try:
+        return [line.split() for line in (project / hook.BUDGET_LOG_FILE).read_text(encoding="utf-8").splitlines()]
+    except OSError:
+        return []
+
+
+def check_budget() -> list[str]:
+    """A sync fits the default budget; a stalled step is cut off at the budget and recorded."""
+    failures = []
+    with tempfile.TemporaryDirectory(prefix="myskillium-spore-bench-") as tmp:
+        project = Path(tmp)
+        env = hook_env(project, hook.BUDGET_MS)
+        result = run_full_check(env, project)
+        overruns = read_overruns(project)
+        print(f"Budget (sync):        {'overran at ' + overruns[-1][1] if overruns else 'within'} "
+              f"{hook.BUDGET_MS:g}ms")
+        if overruns or "Bootstrap Skill Synced" not in result.stdout:
+            failures.append(f"first-run sync did not complete within the {hook.BUDGET_MS:g}ms budget")
+
+    with tempfile.TemporaryDirectory(prefix="myskillium-spore-bench-") as tmp:
+        project = Path(tmp)
+        # Spent before the hook module has even finished importing
+        env = hook_env(project, 0.01)
+        runs, synced = 0, False
+        while runs <= hook.BUDGET_MAX_DEFERRALS and not synced:
+            runs += 1
+            result = run_due_check(env, project, refetch=False)
+            synced = "Bootstrap Skill Synced" in result.stdout
+        overruns = read_overruns(project)
+        print(f"Budget (too small):   {len(overruns)} deferral(s) at "
+              f"{sorted({o[1] for o in overruns})}, then {'synced' if synced else 'still deferred'}")
+        if not synced or len(overruns) != hook.BUDGET_MAX_DEFERRALS:
+            failures.append(f"check with a 0.01ms budget: synced={synced} after {runs} runs, "
+                            f"{len(overruns)} overruns (expected {hook.BUDGET_MAX_DEFERRALS})")
+        elif hook.read_check_deferrals(project) != 0:
+            failures.append("deferral count not reset after the capped check")
+        if (project / hook.CHECK_LOCK_FILE).exists():
+            failures.append("check lock left behind by a deferred check")
+
+    if not hasattr(os, "mkfifo"):
+        return failures
+    with tempfile.TemporaryDirectory(prefix="myskillium-spore-bench-") as tmp:
+        project = Path(tmp)
+        env = hook_env(project, hook.BUDGET_MS)
+        run_full_check(env, project)
+        stalled = hook.get_skill_dir(project) / "01-prd.md"
+        stalled.unlink()
+        os.mkfifo(stalled)
+        start = time.perf_counter()
+        result = run_full_check(env, project)
+        wall_ms = (time.perf_counter() - start) * 1000
+        overruns = read_overruns(project)
+        elapsed = float(overruns[-1][2].rstrip("ms")) if overruns else float("inf")
+        delay, _ = read_schedule(project)
+        print(f"Budget (stalled doc): cut off in {elapsed:.1f}ms at step "
+              f"{overruns[-1][1] if overruns else '?'} (session {wall_ms:.0f}ms), retry in {delay:.0f}s")
+        if result.returncode != 0 or not overruns or overruns[-1][1] != "scan":
+            failures.append(f"stalled scan was not cut off and recorded (exit {result.returncode}, {overruns})")
+        elif elapsed > hook.BUDGET_MS + 20:
+            failures.append(f"stalled scan ran {elapsed:.1f}ms, budget {hook.BUDGET_MS:g}ms")
+        if not 0 < delay <= hook.BUDGET_DEFER_DELAY + 5:
+            failures.append(f"overrun rescheduled the check {delay:.0f}s ahead, expected {hook.BUDGET_DEFER_DELAY}s")
+
+        # The same stall once the deferrals are used up: the capped run must
+        # still be cut off (at a short cap here), then back off
+        cap_ms = 1000
+        env["MYSKILLIUM_SPORE_BUDGET_CAP_MS"] = f"{cap_ms}"
+        hook.write_check_state(project, time.time() - 1, 0, hook.BUDGET_MAX_DEFERRALS)
+        start = time.perf_counter()
+        try:
+            result = subprocess.run([sys.executable, *PYTHON_FLAGS, str(SPORE_LAUNCHER)], env=env,
+                                    capture_output=True, text=True, timeout=cap_ms / 1000 + 10)
+        except subprocess.TimeoutExpired:
+            failures.append(f"stalled scan under the hard cap hung past {cap_ms / 1000 + 10:.0f}s")
+            return failures
+        wall_ms = (time.perf_counter() - start) * 1000
+        overruns = read_overruns(project)
+        elapsed = float(overruns[-1][2].rstrip("ms")) if overruns else float("inf")
+        delay, count = read_schedule(project)
+        print(f"Budget (stalled, capped): cut off in {elapsed:.0f}ms at step "
+              f"{overruns[-1][1] if overruns else '?'} (session {wall_ms:.0f}ms), "
+              f"retry in {delay / 3600:.2f}h, {count} failure(s)")
+        if result.returncode != 0 or not overruns or overruns[-1][1] != "scan":
+            failures.append(f"stalled scan was not cut off at the cap (exit {result.returncode}, {overruns})")
+        elif elapsed > cap_ms + 50:
+            failures.append(f"stalled scan ran {elapsed:.0f}ms, cap {cap_ms}ms")
+        if count != 1 or not hook.RETRY_BASE / 2 - 5 <= delay <= hook.RETRY_BASE:
+            failures.append(f"capped overrun rescheduled {delay:.0f}s ahead with {count} failure(s), "
+                            f"expected a first retry backoff")
+        if hook.read_check_deferrals(project) != 0:
+            failures.append("deferral count not reset after the capped overrun")
+        if (project / hook.CHECK_LOCK_FILE).exists():
+            failures.append("check lock left behind by the capped overrun")
+    return failures
+
+
+def check_schedule() -> list[str]:
+    """Drive failures, update reminders and an up-to-date check through the scheduler."""
+    failures = []
+    embedded = hook.calculate_embedded_hash()
+    with tempfile.TemporaryDirectory(prefix="myskillium-spore-bench-") as tmp, \
+            StandinServer({"/version.yml": f'hash: "{embedded}"\n'.encode()}, errors={"*": 503}) as server:
+        project = Path(tmp)
+        env = hook_env(project)
+        env["MYSKILLIUM_SPORE_REMOTE_URL"] = server.url("/version.yml")
+        run_full_check(env, project)  # sync
+
+        for attempt in (1, 2, 3):
+            run_due_check(env, project, refetch=True)
+            delay, count = read_schedule(project)
+            backoff = min(hook.RETRY_MAX, hook.RETRY_BASE * 2 ** (attempt - 1))
+            print(f"Schedule (failure {attempt}):  next check in {delay / 3600:.2f}h, {count} failure(s)")
+            if count != attempt or not backoff / 2 - 5 <= delay <= backoff + 5:
+                failures.append(f"failure {attempt} scheduled {delay:.0f}s with count {count}, "
+                                f"expected {backoff / 2:.0f}-{backoff:.0f}s with count {attempt}")
+
+        server.errors.clear()
+        server.resources["/version.yml"] = b'hash: "0000"\n'
+        low, high = (hook.REMINDER_INTERVAL * (1 + j * hook.CHECK_JITTER) for j in (-1, 1))
+        for refetch in (True, False):
+            server.reset()
+            result = run_due_check(env, project, refetch)
+            delay, count = read_schedule(project)
+            label = "update" if refetch else "reminder"
+            print(f"{f'Schedule ({label}):':<23}next check in {delay / 3600:.2f}h, {server.stats['requests']} request(s)")
+            if "Update Available" not in result.stdout:
+                failures.append(f"{label} run did not announce the update")
+            if count or not low - 5 <= delay <= high + 5:
+                failures.append(f"{label} scheduled {delay:.0f}s with count {count}, expected {low:.0f}-{high:.0f}s")
+            if not refetch and server.stats["requests"]:
+                failures.append("update reminder refetched the remote result")
+
+        server.resources["/version.yml"] = f'hash: "{embedded}"\n'.encode()
+        run_due_check(env, project, refetch=True)
+        delay, count = read_schedule(project)
+        low, high = (hook.CHECK_INTERVAL * (1 + j * hook.CHECK_JITTER) for j in (-1, 1))
+        print(f"Schedule (up to date): next check in {delay / 3600:.2f}h")
+        if count or not low - 5 <= delay <= high + 5:
+            failures.append(f"up-to-date check scheduled {delay:.0f}s with count {count}, expected {low:.0f}-{high:.0f}s")
+    return failures
+
+
+def upstream_resources(docs: dict[str, str]) -> dict[str, bytes]:
+    """Stand-in resources for an upstream publishing `docs` (version.yml plus each doc)."""
+    resources = {f"/{name}": content.encode("utf-8") for name, content in docs.items()}
+    resources["/version.yml"] = build_spore.render_version_yml(docs).encode("utf-8")
+    return resources
+
+
+def check_delta() -> list[str]:
+    """Delta-update the docs from a newer upstream, then reject a corrupted one."""
+    failures = []
+    upstream = dict(hook.load_embedded_docs())
+    upstream["02-architecture.md"] += "\nUpstream addition.\n"
+    upstream["08-upstream-only.md"] = "# Added upstream\n"
+    changed = ["02-architecture.md", "08-upstream-only.md"]
+
+    with tempfile.TemporaryDirectory(prefix="myskillium-spore-bench-") as tmp, \
+            StandinServer(upstream_resources(upstream)) as server:
+        project = Path(tmp)
+        env = hook_env(project)
+        env["MYSKILLIUM_SPORE_REMOTE_URL"] = server.url("/version.yml")
+        run_full_check(env, project)  # sync from the embedded payload
+        skill_dir = hook.get_skill_dir(project)
+
+        server.reset()
+        result = run_due_check(env, project, refetch=True)
+        stats = dict(server.stats)
+        print(f"Delta update:         {stats['requests']} request(s), {stats['connections']} connection(s), "
+              f"{stats['bytes_sent']} body bytes for {len(changed)} changed doc(s)")
+        if sorted(server.paths) != sorted(["/version.yml"] + [f"/{name}" for name in changed]):
+            failures.append(f"delta update fetched {server.paths}, expected version.yml and {changed}")
+        if stats["connections"] != 1:
+            failures.append(f"delta update used {stats['connections']} connections, expected 1")
+        if "Bootstrap Skill Updated" not in result.stdout or not all(name in result.stdout for name in changed):
+            failures.append("session after the delta update did not report the updated docs")
+        on_disk = {p.name: p.read_text(encoding="utf-8") for p in skill_dir.glob("*.md")}
+        if on_disk != upstream:
+            failures.append("docs on disk do not match upstream after the delta update")
+        version = (project / hook.VERSION_FILE).read_text(encoding="utf-8")
+        if "source: upstream" not in version:
+            failures.append("version.yml does not record source: upstream")
+
+        server.reset()
+        result = run_due_check(env, project, refetch=False)
+        if result.stdout.strip() or server.stats["requests"]:
+            failures.append("check after the delta update was not silent and offline")
+
+        # A newer upstream whose doc does not match its published hash
+        corrupt = dict(upstream, **{"03-bootstrap-plan.md": "# Changed\n"})
+        server.resources.update(upstream_resources(corrupt))
+        server.resources["/03-bootstrap-plan.md"] = b"# Tampered\n"
+        result = run_due_check(env, project, refetch=True)
+        on_disk = {p.name: p.read_text(encoding="utf-8") for p in skill_dir.glob("*.md")}
+        print(f"Corrupted delta:      {'rejected' if on_disk == upstream else 'APPLIED'}, "
+              f"{'Update Available shown' if 'Update Available' in result.stdout else 'no notice'}")
+        if on_disk != upstream:
+            failures.append("a doc that did not match its published hash was written")
+        if "Update Available" not in result.stdout:
+            failures.append("failed delta update did not fall back to the Update Available notice")
+    return failures
+
+
+def check_upgrade() -> list[str]:
+    """A newer spore payload replaces docs an older payload deployed."""
+    failures = []
+    with tempfile.TemporaryDirectory(prefix="myskillium-spore-bench-") as tmp, \
+            StandinServer({"/version.yml": b'hash: "0000"\n'}) as server:
+        spore = Path(tmp) / "spore"
+        spore.mkdir()
+        launcher = spore / SPORE_LAUNCHER.name
+        shutil.copy2(SPORE_LAUNCHER, launcher)
+        shutil.copytree(REPO_ROOT / SPORE_PACKAGE, spore / SPORE_PACKAGE, ignore=shutil.ignore_patterns("__pycache__"))
+        project = Path(tmp) / "project"
+        project.mkdir()
+        env = hook_env(project)
+        env["MYSKILLIUM_SPORE_REMOTE_URL"] = server.url("/version.yml")
+        subprocess.run([sys.executable, *PYTHON_FLAGS, str(launcher)], env=env, capture_output=True, text=True)
+
+        docs = dict(hook.load_embedded_docs())
+        docs["03-bootstrap-plan.md"] += "\nAdded in the newer spore.\n"
+        (spore / SPORE_PACKAGE / "payload.py").write_text(build_spore.render_module(docs), encoding="utf-8")
+        shutil.rmtree(spore / SPORE_PACKAGE / "__pycache__", ignore_errors=True)
+        hook.write_check_state(project, time.time() - 1)
+        result = subprocess.run([sys.executable, *PYTHON_FLAGS, str(launcher)], env=env, capture_output=True, text=True)
+        doc = (hook.get_skill_dir(project) / "03-bootstrap-plan.md").read_text(encoding="utf-8")
+        upgraded = doc == docs["03-bootstrap-plan.md"]
+        print(f"Payload upgrade:      {'docs rewritten' if upgraded else 'docs LEFT OLD'}")
+        if not upgraded or "Bootstrap Skill Synced" not in result.stdout:
+            failures.append("spore payload upgraded: the next check did not sync the newer embedded docs")
+    return failures
+
+
+def launch_concurrently(env: dict, count: int) -> list[subprocess.CompletedProcess]:
+    """Start `count` hooks at once and wait for all of them."""
+    command = [sys.executable, *PYTHON_FLAGS, str(SPORE_LAUNCHER)]
+    procs = [subprocess.Popen(command, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+             for _ in range(count)]
+    results = []
+    for proc in procs:
+        out, err = proc.communicate()
+        results.append(subprocess.CompletedProcess(command, proc.returncode, out, err))
+    return results
+
+
+def torn_files(project: Path) -> list[str]:
+    """Return docs or state files whose content is not what the hook writes."""
+    torn = []
+    docs = hook.load_embedded_docs()
+    skill_dir = hook.get_skill_dir(project)
+    for name, content in docs.items():
+        path = skill_dir / name
+        if not path.exists() or path.read_text(encoding="utf-8") != content:
+            torn.append(str(path.relative_to(project)))
+    recorded = hook.read_version_yml(project)
+    if recorded["hash"] != hook.calculate_embedded_hash() or sorted(recorded["docs"]) != sorted(docs):
+        torn.append(hook.VERSION_FILE)
+    state = project / hook.CHECK_STATE_FILE
+    if not re.fullmatch(r"MSKS1 \d{10} \d{3} \d{3}\n", state.read_text(encoding="ascii")):
+        torn.append(hook.CHECK_STATE_FILE)
+    leftovers = [p.name for p in project.rglob(".*.tmp")]
+    torn.extend(f"temp file {name}" for name in leftovers)
+    return torn
+
+
+def check_concurrency(count: int) -> list[str]:
+    """Launch `count` hooks at once, twice: a first-run sync, then a remote check."""
+    failures = []
+    version_yml = f'hash: "{hook.calculate_embedded_hash()}"\n'.encode()
+    with tempfile.TemporaryDirectory(prefix="myskillium-spore-bench-") as tmp, \
+            StandinServer({"/version.yml": version_yml}, delays={"*": 0.2}) as server:
+        project = Path(tmp)
+        env = hook_env(project)
+        env["MYSKILLIUM_SPORE_REMOTE_URL"] = server.url("/version.yml")
+        results = launch_concurrently(env, count)
+        synced = sum("Bootstrap Skill Synced" in r.stdout for r in results)
+        errors = [r.stderr.strip() for r in results if r.returncode != 0]
+        torn = torn_files(project)
+        print(f"Concurrent sync ({count}):  {synced} synced, {len(errors)} failed, {len(torn)} torn file(s)")
+        if synced != 1:
+            failures.append(f"{synced} of {count} concurrent hooks synced the docs, expected 1")
+        failures += [f"concurrent hook failed: {e.splitlines()[-1] if e else 'no output'}" for e in errors[:3]]
+        failures += [f"torn after concurrent sync: {t}" for t in torn]
+
+        # Age the check so every hook finds it due, then launch them together
+        run_full_check(env, project)
+        wait_for_worker(project)
+        server.reset()
+        hook.remote_state_path(project, hook.REMOTE_RESULT_NAME).unlink(missing_ok=True)
+        (project / hook.CHECK_STATE_FILE).unlink()
+        results = launch_concurrently(env, count)
+        if not wait_for_worker(project):
+            failures.append("background worker did not finish after concurrent launch")
+        errors = [r.stderr.strip() for r in results if r.returncode != 0]
+        torn = torn_files(project)
+        print(f"Concurrent check ({count}): {server.stats['requests']} request(s), "
+              f"{len(errors)} failed, {len(torn)} torn file(s)")
+        if server.stats["requests"] != 1:
+            failures.append(f"{count} concurrent hooks made {server.stats['requests']} remote requests, expected 1")
+        failures += [f"concurrent hook failed: {e.splitlines()[-1] if e else 'no output'}" for e in errors[:3]]
+        failures += [f"torn after concurrent check: {t}" for t in torn]
+    return failures
+
+
+def wall_times_ms(args: list[str], env: dict, runs: int) -> list[float]:
+    """Run Python `runs` times and return each wall-clock duration in ms."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *PYTHON_FLAGS, *args], env=env, capture_output=True)
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup budget check for the spore hook")
+    parser.add_argument("--runs", type=int, default=50, help="Wall-clock runs per measurement")
+    parser.add_argument("--concurrency", type=int, default=32, help="Hooks launched at once in the stress check")
+    args = parser.parse_args()
+
+    failures = []
+    with tempfile.TemporaryDirectory(prefix="myskillium-spore-bench-") as tmp:
+        env = hook_env(make_fast_path_project(Path(tmp)))
+
+        # Warm run populates __pycache__; the budget applies to warm starts
+        subprocess.run([sys.executable, *PYTHON_FLAGS, str(SPORE_LAUNCHER)], env=env, capture_output=True)
+
+        baseline = set(imported_modules(["-c", "pass"], env))
+        loaded = imported_modules([str(SPORE_LAUNCHER)], env)
+        extra = [m for m in dict.fromkeys(loaded) if m not in baseline]
+        recompiled = recompiled_modules(env)
+
+        # Compare medians to cancel out interpreter startup, which the hook
+        # cannot influence
+        bare = wall_times_ms(["-c", "pass"], env, args.runs)
+        spore = wall_times_ms([str(SPORE_LAUNCHER)], env, args.runs)
+
+    launcher_size = SPORE_LAUNCHER.stat().st_size
+    overhead = statistics.median(spore) - statistics.median(bare)
+
+    print(f"Launcher size:        {launcher_size} bytes (budget {LAUNCHER_SIZE_BUDGET})")
+    print(f"Modules beyond start: {len(extra)} (budget {FAST_PATH_MODULE_BUDGET})")
+    for module in extra:
+        print(f"  {module}")
+    print(f"Recompiled modules:   {len(recompiled)}")
+    print(f"Bare interpreter:     p50 {statistics.median(bare):.1f}ms  p95 {percentile(bare, 95):.1f}ms")
+    print(f"Fast path:            p50 {statistics.median(spore):.1f}ms  p95 {percentile(spore, 95):.1f}ms")
+    print(f"Fast path overhead:   {overhead:.2f}ms (budget {FAST_PATH_OVERHEAD_BUDGET_MS}ms)")
+
+    if launcher_size > LAUNCHER_SIZE_BUDGET:
+        failures.append(f"launcher is {launcher_size} bytes, budget {LAUNCHER_SIZE_BUDGET}")
+    if len(extra) > FAST_PATH_MODULE_BUDGET:
+        failures.append(f"{len(extra)} modules imported, budget {FAST_PATH_MODULE_BUDGET}")
+    for module in FAST_PATH_FORBIDDEN:
+        if module in loaded:
+            failures.append(f"fast path imported {module}")
+    for path in recompiled:
+        failures.append(f"fast path compiled {path} from source")
+    if overhead > FAST_PATH_OVERHEAD_BUDGET_MS:
+        failures.append(f"fast path overhead {overhead:.2f}ms, budget {FAST_PATH_OVERHEAD_BUDGET_MS}ms")
+
+    failures += check_trace()
+    failures += check_remote()
+    failures += check_delta()
+    failures += check_upgrade()
+    failures += check_budget()
+    failures += check_schedule()
+    failures += check_concurrency(args.concurrency)
+
+    print()
+    if failures:
+        print(f"Budget exceeded ({len(failures)}):")
+        for failure in failures:
+            print(f"  ! {failure}")
+        sys.exit(1)
+    print("Fast path within budget.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+Benchmark sync-myskillium.py against synthetic skill trees.
+
+Generates a synthetic upstream Myskillium repository as a local bare repo
+(via `git fast-import`, so 100k-file trees build in seconds), plus
+destination projects in several drift states, then measures:
+
+- `sync_directory()` alone, against a pre-made checkout
+- the full `main()` flow, cloning from a `file://` remote
+
+Each case runs in a fresh subprocess so peak RSS and I/O counters are not
+polluted by other cases. Results are compared against a stored baseline and
+regressions are flagged with a non-zero exit code. Only machine-independent
+metrics (I/O calls and bytes, files written, peak RSS) are gated; wall time
+is reported for information.
+
+Usage:
+    python bench/bench-sync.py [--files N] [--depth D] [--size-dist NAME]
+                               [--churn RATIO] [--commits N] [--repeat N]
+                               [--case NAME ...] [--baseline PATH]
+                               [--update-baseline] [--tolerance RATIO]
+                               [--keep]
+"""
+
+import argparse
+import importlib.util
+import io
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+SYNC_SCRIPT = REPO_ROOT / "sync-myskillium.py"
+DEFAULT_BASELINE = BENCH_DIR / "baseline-sync.json"
+
+# Synced root inside the synthetic upstream (matches SYNC_DIRS)
+SKILLS_ROOT = ".claude/skills"
+
+# File size distributions: list of (weight, min_bytes, max_bytes)
+SIZE_DISTRIBUTIONS = {
+    "tiny": [(1, 16, 256)],
+    "docs": [(70, 256, 4096), (25, 4096, 32768), (5, 32768, 131072)],
+    "mixed": [(60, 64, 2048), (30, 2048, 65536), (9, 65536, 524288), (1, 524288, 4194304)],
+}
+
+# Destination drift states
+#   empty    - project has never been synced
+#   synced   - project matches upstream HEAD exactly
+#   stale    - project matches the first upstream commit (behind by churn)
+#   modified - synced, then local edits, local-only files and preserved files
+DRIFT_STATES = ["empty", "synced", "stale", "modified"]
+
+# Cases: (name, runner, drift state)
+CASES = [(f"{runner}-{state}", runner, state) for runner in ("sync_directory", "main") for state in DRIFT_STATES]
+
+# Metrics compared against the baseline and their default tolerances
+# (relative increase allowed before a case is flagged as a regression).
+# rw_syscalls is syscr + syscw from /proc/self/io: read- and write-family
+# calls only, so stat, open, mkdir and the like are not counted.
+# files_written counts project files created or replaced by the sync.
+# wall_s is reported but not gated: the baseline may come from another
+# machine, and there disk speed alone moves it well past any tolerance.
+METRIC_TOLERANCES = {
+    "rw_syscalls": 0.10,
+    "bytes_read": 0.10,
+    "bytes_written": 0.10,
+    "files_written": 0.0,
+    "peak_rss_kb": 0.25,
+}
+
+
+def load_sync_module():
+    """Import sync-myskillium.py as a module."""
+    # As when it runs as a script: its directory (with the myskillium_spore
+    # package it imports) is on sys.path
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+    spec = importlib.util.spec_from_file_location("sync_myskillium", SYNC_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_git(args: list[str], cwd: Path | None = None, stdin: bytes | None = None) -> bytes:
+    """Run git, raising on failure."""
+    result = subprocess.run(["git", *args], cwd=cwd, input=stdin, capture_output=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"git {' '.join(args)} failed: {result.stderr.decode(errors='replace')}")
+    return result.stdout
+
+
+# ---------------------------------------------------------------------------
+# Synthetic tree generation
+# ---------------------------------------------------------------------------
+
+def pick_size(rng: random.Random, dist: list[tuple[int, int, int]]) -> int:
+    """Pick a file size from a weighted bucket distribution."""
+    weights = [w for w, _, _ in dist]
+    _, low, high = rng.choices(dist, weights=weights)[0]
+    return rng.randint(low, high)
+
+
+def make_content(rng: random.Random, size: int) -> bytes:
+    """Generate text-like content of the given size."""
+    line = f"{rng.getrandbits(64):016x} synthetic skill content\n".encode()
+    return (line * (size // len(line) + 1))[:size]
+
+
+def make_paths(rng: random.Random, files: int, depth: int) -> list[str]:
+    """Generate relative file paths spread over skills and nested dirs."""
+    skills = max(1, files // 20)
+    paths = []
+    for i in range(files):
+        skill = f"skill-{i % skills:05d}"
+        if i < skills:
+            paths.append(f"{skill}/SKILL.md")
+            continue
+        levels = rng.randint(0, max(0, depth - 1))
+        dirs = [f"d{rng.randint(0, 9)}" for _ in range(levels)]
+        paths.append("/".join([skill, *dirs, f"f{i:06d}.md"]))
+    return paths
+
+
+def build_upstream(work: Path, args: argparse.Namespace) -> dict:
+    """
+    Build a bare upstream repo with `commits` commits.
+
+    Returns the tree state of the first and last commit as
+    {"first": {path: bytes}, "head": {path: bytes}, "url": file_url}.
+    """
+    rng = random.Random(args.seed)
+    dist = SIZE_DISTRIBUTIONS[args.size_dist]
+    bare = work / "upstream.git"
+    run_git(["init", "--bare", "--quiet", "--initial-branch", "main", str(bare)])
+
+    tree = {p: make_content(rng, pick_size(rng, dist)) for p in make_paths(rng, args.files, args.depth)}
+    first = dict(tree)
+
+    stream = io.BytesIO()
+    for n in range(args.commits):
+        if n > 0:
+            changed = rng.sample(sorted(tree), max(1, int(len(tree) * args.churn)))
+            for path in changed:
+                tree[path] = make_content(rng, pick_size(rng, dist))
+            targets = changed
+        else:
+            targets = sorted(tree)
+        stamp = 1700000000 + n * 3600
+        message = f"synthetic commit {n}\n".encode()
+        stream.write(b"commit refs/heads/main\n")
+        stream.write(f"committer Bench <bench@example.invalid> {stamp} +0000\n".encode())
+        stream.write(b"data %d\n%s" % (len(message), message))
+        for path in targets:
+            data = tree[path]
+            stream.write(f"M 100644 inline {SKILLS_ROOT}/{path}\n".encode())
+            stream.write(b"data %d\n%s\n" % (len(data), data))
+        stream.write(b"\n")
+    run_git(["fast-import", "--quiet"], cwd=bare, stdin=stream.getvalue())
+
+    return {"first": first, "head": dict(tree), "url": bare.as_uri()}
+
+
+def write_tree(root: Path, tree: dict) -> None:
+    """Materialise a {path: bytes} tree under root/SKILLS_ROOT."""
+    base = root / SKILLS_ROOT
+    for rel, data in tree.items():
+        path = base / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+
+def build_destination(root: Path, state: str, upstream: dict, args: argparse.Namespace) -> None:
+    """Create a destination project in the given drift state."""
+    root.mkdir(parents=True)
+    if state == "empty":
+        return
+    if state == "stale":
+        write_tree(root, upstream["first"])
+        (root / ".myskillium-version").write_text("0" * 40 + "\n")
+        return
+
+    write_tree(root, upstream["head"])
+    if state == "modified":
+        rng = random.Random(args.seed + 1)
+        tree = upstream["head"]
+        for rel in rng.sample(sorted(tree), max(1, int(len(tree) * args.churn))):
+            (root / SKILLS_ROOT / rel).write_bytes(b"locally edited\n")
+        for i in range(max(1, len(tree) // 100)):
+            local_only = root / SKILLS_ROOT / f"local-skill-{i:04d}" / "SKILL.md"
+            local_only.parent.mkdir(parents=True, exist_ok=True)
+            local_only.write_text("project-specific skill\n")
+        (root / ".claude" / "local").mkdir(parents=True, exist_ok=True)
+        (root / ".claude" / "local" / "notes.md").write_text("preserved\n")
+        (root / ".claude" / "settings.local.json").write_text("{}\n")
+
+
+# ---------------------------------------------------------------------------
+# Measurement (runs inside the per-case subprocess)
+# ---------------------------------------------------------------------------
+
+def read_proc_io() -> dict | None:
+    """Read this process's I/O counters (Linux only)."""
+    try:
+        with open("/proc/self/io") as f:
+            fields = dict(line.split(":", 1) for line in f.read().splitlines())
+    except OSError:
+        return None
+    return {k: int(v) for k, v in fields.items()}
+
+
+def peak_rss_kb() -> dict:
+    """Peak RSS of this process and of its (waited-for) children, in KiB."""
+    try:
+        import resource
+    except ImportError:
+        return {"self": None, "children": None}
+    scale = 1024 if sys.platform == "darwin" else 1  # macOS reports bytes
+    peak_self = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // scale
+    # Linux carries ru_maxrss across exec (so it would include the harness
+    # parent's footprint); VmHWM is reset on exec and is the accurate figure
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    peak_self = int(line.split()[1])
+                    break
+    except OSError:
+        pass
+    return {
+        "self": peak_self,
+        "children": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss // scale,
+    }
+
+
+def file_stamps(project: Path) -> dict[str, tuple[int, int]]:
+    """
+    (inode, ctime_ns) of every file in the project: writing a file changes
+    one of them (mtime would not do, as shutil.copy2 copies it over).
+    """
+    stamps = {}
+    for root, _, files in os.walk(project):
+        for name in files:
+            st = os.stat(os.path.join(root, name))
+            stamps[os.path.join(root, name)] = (st.st_ino, st.st_ctime_ns)
+    return stamps
+
+
+def run_case(spec: dict) -> dict:
+    """Run one case in this process and return its metrics."""
+    sync = load_sync_module()
+    project = Path(spec["project"])
+    io_before = read_proc_io()
+
+    start = time.perf_counter()
+    if spec["runner"] == "sync_directory":
+        src_dir = Path(spec["checkout"]) / SKILLS_ROOT
+        dst_dir = project / SKILLS_ROOT
+        stats = sync.sync_directory(src_dir, dst_dir, project, dry_run=False)
+    else:
+        sync.MYSKILLIUM_REPO = spec["url"]
+        os.chdir(project)
+        sys.argv = ["sync-myskillium.py"]
+        with redirect_stdout(io.StringIO()):
+            sync.main()
+        stats = None
+    wall = time.perf_counter() - start
+
+    io_after = read_proc_io()
+    rss = peak_rss_kb()
+    result = {
+        "wall_s": round(wall, 4),
+        "rw_syscalls": None,
+        "bytes_read": None,
+        "bytes_written": None,
+        "files_written": None,  # filled in by measure(), so as not to skew this process's RSS
+        "peak_rss_kb": rss["self"],
+        "children_peak_rss_kb": rss["children"],
+    }
+    if io_before and io_after:
+        result["rw_syscalls"] = (io_after["syscr"] - io_before["syscr"]) + (io_after["syscw"] - io_before["syscw"])
+        result["bytes_read"] = io_after["rchar"] - io_before["rchar"]
+        result["bytes_written"] = io_after["wchar"] - io_before["wchar"]
+    if stats is not None:
+        result["counts"] = {k: len(v) for k, v in stats.items()}
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Orchestration
+# ---------------------------------------------------------------------------
+
+def measure(work: Path, name: str, runner: str, state: str, upstream: dict, checkout: Path,
+            args: argparse.Namespace) -> dict:
+    """Run a case `repeat` times in fresh subprocesses; keep the fastest run."""
+    best = None
+    for i in range(args.repeat):
+        project = work / f"{name}-{i}"
+        build_destination(project, state, upstream, args)
+        spec = {"runner": runner, "project": str(project), "checkout": str(checkout), "url": upstream["url"]}
+        files_before = file_stamps(project)
+        proc = subprocess.run(
+            [sys.executable, __file__, "--run-case", json.dumps(spec)],
+            capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"case {name} failed:\n{proc.stderr}")
+        result = json.loads(proc.stdout)
+        result["files_written"] = sum(stamp != files_before.get(path) for path, stamp in file_stamps(project).items())
+        if best is None or result["wall_s"] < best["wall_s"]:
+            best = result
+        if not args.keep:
+            shutil.rmtree(project, ignore_errors=True)
+    return best
+
+
+def compare(results: dict, baseline: dict, tolerance: float | None) -> list[str]:
+    """Return a list of regression descriptions (empty if none)."""
+    regressions = []
+    for name, metrics in results.items():
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            continue
+        for metric, default_tol in METRIC_TOLERANCES.items():
+            new, old = metrics.get(metric), base.get(metric)
+            if new is None or old is None:
+                continue
+            tol = default_tol if tolerance is None else tolerance
+            if new > old * (1 + tol):
+                pct = (new / old - 1) * 100 if old else float("inf")
+                regressions.append(f"{name}: {metric} {old} -> {new} (+{pct:.0f}%, limit +{tol * 100:.0f}%)")
+    return regressions
+
+
+def format_value(value) -> str:
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return f"{value:.3f}"
+    return str(value)
+
+
+def print_table(results: dict) -> None:
+    columns = ["wall_s", "rw_syscalls", "bytes_read", "bytes_written", "files_written",
+               "peak_rss_kb", "children_peak_rss_kb"]
+    header = f"{'case':<24}" + "".join(f"{c:>22}" for c in columns)
+    print(header)
+    print("-" * len(header))
+    for name, metrics in results.items():
+        print(f"{name:<24}" + "".join(f"{format_value(metrics.get(c)):>22}" for c in columns))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sync-myskillium.py against synthetic skill trees")
+    parser.add_argument("--files", type=int, default=2000, help="Number of files in the upstream tree (up to 100000)")
+    parser.add_argument("--depth", type=int, default=3, help="Maximum directory depth below each skill")
+    parser.add_argument("--size-dist", choices=sorted(SIZE_DISTRIBUTIONS), default="docs", help="File size distribution")
+    parser.add_argument("--churn", type=float, default=0.05, help="Fraction of files changed between commits")
+    parser.add_argument("--commits", type=int, default=2, help="Number of upstream commits")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for reproducible trees")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case (fastest is kept)")
+    parser.add_argument("--case", action="append", help="Only run cases whose name contains this (repeatable)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="Write results as the new baseline")
+    parser.add_argument("--tolerance", type=float, help="Override per-metric regression tolerance (e.g. 0.2)")
+    parser.add_argument("--keep", action="store_true", help="Keep generated trees for inspection")
+    parser.add_argument("--run-case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        print(json.dumps(run_case(json.loads(args.run_case))))
+        return
+
+    if not 1 <= args.files <= 100_000:
+        parser.error("--files must be between 1 and 100000")
+    if args.commits < 1:
+        parser.error("--commits must be at least 1")
+
+    params = {k: getattr(args, k) for k in ("files", "depth", "size_dist", "churn", "commits", "seed")}
+    cases = [c for c in CASES if not args.case or any(f in c[0] for f in args.case)]
+
+    work = Path(tempfile.mkdtemp(prefix="myskillium-bench-"))
+    try:
+        print(f"Generating upstream ({args.files} files, {args.commits} commits, {args.size_dist})...")
+        upstream = build_upstream(work, args)
+        checkout = work / "checkout"
+        run_git(["clone", "--quiet", "--depth", "1", "--branch", "main", upstream["url"], str(checkout)])
+
+        results = {}
+        for name, runner, state in cases:
+            print(f"Running {name}...")
+            results[name] = measure(work, name, runner, state, upstream, checkout, args)
+    finally:
+        if args.keep:
+            print(f"Kept benchmark trees in {work}")
+        else:
+            shutil.rmtree(work, ignore_errors=True)
+
+    print()
+    print_table(results)
+    print()
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps({"params": params, "results": results}, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one.")
+        return
+
+    baseline = json.loads(args.baseline.read_text())
+    if baseline.get("params") != params:
+        print("Baseline was recorded with different parameters; skipping comparison.")
+        print(f"  baseline: {baseline.get('params')}")
+        print(f"  current:  {params}")
+        return
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"Regressions ({len(regressions)}):")
+        for r in regressions:
+            print(f"  ! {r}")
+        sys.exit(1)
+    print("No regressions against baseline (wall_s is informational only).")
+
+
+if __name__ == "__main__":
+    main()
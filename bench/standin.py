@@ -0,0 +1,122 @@
+"""
+Local stand-in HTTP server for exercising the spore's remote checks.
+
+Serves in-memory resources over HTTP/1.1 with keep-alive, ETag and
+Last-Modified validators (answering conditional requests with 304), and
+counts requests, connections and body bytes sent so benchmarks can assert
+on network cost. Per-path delays and error statuses can be injected.
+
+Usage (from a benchmark script in this directory):
+
+    from standin import StandinServer
+
+    with StandinServer({"/version.yml": b'hash: "abc"\\n'}) as server:
+        url = server.url("/version.yml")
+        ...
+        assert server.stats["requests"] == 1
+"""
+
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+LAST_MODIFIED = "Wed, 15 Jan 2025 12:00:00 GMT"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.standin.count("connections")
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        standin = self.server.standin
+        standin.count("requests")
+        path = self.path.split("?", 1)[0]
+        standin.record(path)
+
+        delay = standin.delays.get(path, standin.delays.get("*", 0))
+        if delay:
+            time.sleep(delay)
+
+        status = standin.errors.get(path, standin.errors.get("*"))
+        if status:
+            self._send(status, b"error\n")
+            return
+
+        body = standin.resources.get(path)
+        if body is None:
+            self._send(404, b"not found\n")
+            return
+
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            standin.count("not_modified")
+            self._send(304, b"", {"ETag": etag, "Last-Modified": LAST_MODIFIED})
+            return
+        self._send(200, body, {"ETag": etag, "Last-Modified": LAST_MODIFIED})
+
+    def _send(self, status: int, body: bytes, headers: dict | None = None):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        if status != 304:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body and status != 304:
+            self.wfile.write(body)
+            self.server.standin.count("bytes_sent", len(body))
+
+
+class StandinServer:
+    """
+    Threaded stand-in server bound to 127.0.0.1 on a free port.
+
+    `resources` maps URL paths to bodies; `delays` maps paths (or "*") to
+    seconds to sleep before answering; `errors` maps paths (or "*") to an
+    HTTP status to return instead. All three may be changed while running.
+    """
+
+    def __init__(self, resources: dict[str, bytes] | None = None,
+                 delays: dict[str, float] | None = None, errors: dict[str, int] | None = None):
+        self.resources = dict(resources or {})
+        self.delays = dict(delays or {})
+        self.errors = dict(errors or {})
+        self.paths = []
+        self.stats = {"requests": 0, "connections": 0, "not_modified": 0, "bytes_sent": 0}
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.standin = self
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def url(self, path: str) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{path}"
+
+    def count(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[key] += amount
+
+    def record(self, path: str) -> None:
+        with self._lock:
+            self.paths.append(path)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.paths.clear()
+            for key in self.stats:
+                self.stats[key] = 0
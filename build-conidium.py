@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Build a conidium: a self-contained spore for any skill directories.
+
+Packs one or more `.claude/skills/<name>` trees (any files, binary assets
+included) into a single `conidium.py` that can be copied to another repo
+and run there:
+
+    python conidium.py --germinate     # install or update the skills
+    python conidium.py --apoptose      # remove them again
+
+The output is the germination runtime (`myskillium_spore/germinate.py`,
+stdlib only) followed by the payload: a manifest of every file's SHA-256,
+size and executable bit and the manifest's Merkle root, as code, then a
+data section of comment lines holding one zlib-compressed blob per distinct
+content (identical files are stored once) and an index of their offsets. Use
+`--verify` to check that an existing conidium still matches its skill
+directories.
+
+Usage:
+    python build-conidium.py SKILL_DIR [SKILL_DIR ...] [--output PATH] [--name NAME] [--verify]
+"""
+
+import argparse
+import base64
+import hashlib
+import os
+import sys
+import zlib
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent
+RUNTIME = REPO_DIR / "myskillium_spore" / "germinate.py"
+DEFAULT_OUTPUT = Path("conidium.py")
+
+sys.path.insert(0, str(REPO_DIR))
+from myskillium_spore.germinate import DATA_MARKER, manifest_root  # noqa: E402
+
+# Files never packed (caches and editor droppings)
+SKIP_NAMES = {"__pycache__", ".DS_Store", "Thumbs.db"}
+SKIP_SUFFIXES = (".pyc", ".pyo", "~")
+
+
+def read_skill(skill_dir: Path) -> dict[str, tuple[bytes, bool]]:
+    """Return {path: (content, executable)} for a skill dir, paths prefixed with its name."""
+    files = {}
+    for dirpath, dirnames, filenames in os.walk(skill_dir):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_NAMES)
+        for filename in sorted(filenames):
+            if filename in SKIP_NAMES or filename.endswith(SKIP_SUFFIXES):
+                continue
+            full = Path(dirpath) / filename
+            if not full.is_file():
+                continue
+            rel = full.relative_to(skill_dir.parent).as_posix()
+            if "\n" in rel or "\\" in rel:
+                raise ValueError(f"unsupported file name: {rel!r}")
+            files[rel] = (full.read_bytes(), os.access(full, os.X_OK) and os.name != "nt")
+    return files
+
+
+def build_payload(files: dict[str, tuple[bytes, bool]]) -> tuple[dict, dict, str]:
+    """Return (FILES, BLOBS, ROOT_HASH) for {path: (content, executable)}."""
+    manifest = {}
+    blobs = {}
+    for path in sorted(files):
+        content, executable = files[path]
+        digest = hashlib.sha256(content).hexdigest()
+        manifest[path] = (digest, len(content), executable)
+        if digest not in blobs:
+            blobs[digest] = base64.b64encode(zlib.compress(content, 9)).decode("ascii")
+    return manifest, blobs, manifest_root(manifest)
+
+
+def render_conidium(files: dict[str, tuple[bytes, bool]], name: str) -> str:
+    """Render the conidium source: runtime, payload constants, entry point and data section."""
+    manifest, blobs, root = build_payload(files)
+    entries = "".join(f"    {path!r}: {entry!r},\n" for path, entry in manifest.items())
+    # Each blob is a `#<blob>` line; its index entry points past the `#`
+    index = []
+    offset = 0
+    for digest, blob in blobs.items():
+        index.append(f"#{digest} {offset + 1} {len(blob)}\n")
+        offset += len(blob) + 2
+    index = "".join(index)
+    data = index + "".join(f"#{blob}\n" for blob in blobs.values())
+    return (
+        "#!/usr/bin/env python3\n"
+        f"# Myskillium conidium: {name}\n"
+        "# Generated by build-conidium.py - do not edit manually.\n"
+        "#\n"
+        "# Usage: python conidium.py --germinate | --apoptose [--project DIR] [--dry-run]\n"
+        "\n"
+        + RUNTIME.read_text(encoding="utf-8")
+        + "\n\n"
+        "# ---- Payload ----\n"
+        "\n"
+        f"NAME = {name!r}\n"
+        "\n"
+        "# Merkle root of FILES (see tree_hashes)\n"
+        f"ROOT_HASH = {root!r}\n"
+        "\n"
+        "# {path: (sha256, size, executable)}, paths relative to .claude/skills/\n"
+        f"FILES = {{\n{entries}}}\n"
+        "\n"
+        "# Lengths in bytes of the data section (after its marker line) and of\n"
+        "# the blob index it starts with\n"
+        f"DATA_SIZE = {len(data)}\n"
+        f"INDEX_SIZE = {len(index)}\n"
+        "\n"
+        "\n"
+        'if __name__ == "__main__":\n'
+        "    main(FILES, Blobs(__file__, DATA_SIZE, INDEX_SIZE), ROOT_HASH, NAME)\n"
+        "\n"
+        f"{DATA_MARKER}\n"
+        f"{data}"
+    )
+
+
+def verify(output: Path, skill_dirs: list[Path]) -> list[str]:
+    """Check an existing conidium against the skill dirs. Returns problems found."""
+    namespace = {"__name__": "conidium"}
+    try:
+        exec(compile(output.read_text(encoding="utf-8"), str(output), "exec"), namespace)
+        manifest, root = namespace["FILES"], namespace["ROOT_HASH"]
+        blobs = namespace["Blobs"](str(output), namespace["DATA_SIZE"], namespace["INDEX_SIZE"])
+    except (OSError, SyntaxError, KeyError) as e:
+        return [f"cannot load conidium {output}: {e}"]
+
+    problems = []
+    if manifest_root(manifest) != root:
+        problems.append("ROOT_HASH does not match the manifest")
+    for path, (digest, size, _) in manifest.items():
+        try:
+            namespace["decode_blob"](blobs, digest, size)
+        except namespace["SporeError"] as e:
+            problems.append(f"{path}: {e}")
+
+    source = {}
+    for skill_dir in skill_dirs:
+        source.update(read_skill(skill_dir.resolve()))
+    expected, _, _ = build_payload(source)
+    if expected != manifest:
+        changed = sorted(set(expected) ^ set(manifest) | {p for p in expected if p in manifest and expected[p] != manifest[p]})
+        problems.append(f"conidium is stale: {', '.join(changed)} (run build-conidium.py)")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a self-contained conidium from skill directories")
+    parser.add_argument("skills", nargs="+", type=Path, help="Skill directories (e.g. .claude/skills/bootstrap)")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Conidium to write (default: conidium.py)")
+    parser.add_argument("--name", default=None, help="Spore name (default: the skill names joined with '+')")
+    parser.add_argument("--verify", action="store_true", help="Check the existing conidium instead of building it")
+    args = parser.parse_args()
+
+    for skill_dir in args.skills:
+        if not skill_dir.is_dir():
+            print(f"Error: {skill_dir} is not a directory")
+            sys.exit(1)
+    names = [skill_dir.resolve().name for skill_dir in args.skills]
+    if len(set(names)) != len(names):
+        print(f"Error: skill names must be unique: {', '.join(names)}")
+        sys.exit(1)
+
+    if args.verify:
+        problems = verify(args.output, args.skills)
+        if problems:
+            print(f"Conidium verification failed ({len(problems)}):")
+            for problem in problems:
+                print(f"  ! {problem}")
+            sys.exit(1)
+        print(f"Conidium {args.output} verified")
+        return
+
+    files = {}
+    for skill_dir in args.skills:
+        files.update(read_skill(skill_dir.resolve()))
+    if not files:
+        print(f"Error: no files found in {', '.join(map(str, args.skills))}")
+        sys.exit(1)
+
+    name = args.name or "+".join(names)
+    source = render_conidium(files, name)
+    args.output.write_text(source, encoding="utf-8", newline="\n")
+    distinct = len({hashlib.sha256(content).digest() for content, _ in files.values()})
+    raw = sum(len(content) for content, _ in files.values())
+    print(f"Wrote {len(files)} files ({distinct} distinct, {raw} bytes) to {args.output} ({len(source)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Build the Myskillium spore payload from the bootstrap docs.
+
+Packs the bootstrap skill docs into `myskillium_spore/payload.py` as a
+compressed blob. The spore hook imports that module (from cached bytecode)
+and decodes it only when it needs to sync docs.
+
+The combined hash and a per-doc hash manifest are stamped into the payload
+as constants, so the hook never hashes its embedded docs at runtime. The
+same hashes are published in `version.yml` next to the docs; spores fetch
+that file to detect updates and download only the docs that changed. Use
+`--verify` (e.g. in CI) to check that the stamped constants match the
+payload and that the payload and version.yml match the source docs.
+
+Usage:
+    python build-spore.py [--docs DIR] [--output PATH] [--verify]
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import sys
+import zlib
+from pathlib import Path
+
+# Source docs and generated payload (relative to this script)
+REPO_DIR = Path(__file__).resolve().parent
+DEFAULT_DOCS_DIR = REPO_DIR / ".claude" / "skills" / "bootstrap"
+DEFAULT_OUTPUT = REPO_DIR / "myskillium_spore" / "payload.py"
+
+# Only markdown docs are embedded (version.yml etc. are not)
+DOC_GLOB = "*.md"
+
+# Published manifest, written next to the docs
+VERSION_FILE_NAME = "version.yml"
+
+# Width of the base64 lines in the generated module
+LINE_WIDTH = 76
+
+
+def read_docs(docs_dir: Path) -> dict[str, str]:
+    """Read all docs from the source directory, sorted by filename."""
+    docs = {}
+    for path in sorted(docs_dir.glob(DOC_GLOB)):
+        with open(path, encoding="utf-8", newline="") as f:
+            docs[path.name] = f.read()
+    return docs
+
+
+def calculate_hash(content: str) -> str:
+    """Calculate SHA-256 hash of content (same as the hook's calculate_hash)."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def calculate_manifest(docs: dict[str, str]) -> dict[str, str]:
+    """Return {filename: sha256} for each doc, sorted by filename."""
+    return {name: calculate_hash(docs[name]) for name in sorted(docs)}
+
+
+def calculate_combined_hash(manifest: dict[str, str]) -> str:
+    """Combine per-doc hashes the same way the hook's calculate_local_hash() does."""
+    return calculate_hash("".join(f"{name}:{digest}" for name, digest in sorted(manifest.items())))
+
+
+def encode_payload(docs: dict[str, str]) -> str:
+    """Compress docs into a base64 text blob."""
+    raw = json.dumps(docs, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return base64.b64encode(zlib.compress(raw, 9)).decode("ascii")
+
+
+def render_module(docs: dict[str, str]) -> str:
+    """Render the payload module source."""
+    blob = encode_payload(docs)
+    lines = [blob[i:i + LINE_WIDTH] for i in range(0, len(blob), LINE_WIDTH)]
+    manifest = calculate_manifest(docs)
+    entries = "".join(f"    {name!r}: {digest!r},\n" for name, digest in manifest.items())
+    return (
+        '"""\n'
+        "Embedded bootstrap docs for the Myskillium spore.\n"
+        "\n"
+        "Generated by build-spore.py - do not edit manually.\n"
+        '"""\n'
+        "\n"
+        "# Combined SHA-256 of all docs (see calculate_local_hash in hook.py)\n"
+        f"EMBEDDED_HASH = {calculate_combined_hash(manifest)!r}\n"
+        "\n"
+        "# Per-doc SHA-256 of the UTF-8 content, sorted by filename\n"
+        f"EMBEDDED_MANIFEST = {{\n{entries}}}\n"
+        "\n"
+        "# zlib-compressed JSON {filename: content}, base64-encoded\n"
+        'PAYLOAD = """\n' + "\n".join(lines) + '\n"""\n'
+    )
+
+
+def render_version_yml(docs: dict[str, str]) -> str:
+    """Render the published version.yml: combined hash plus per-doc size and hash."""
+    manifest = calculate_manifest(docs)
+    entries = "".join(
+        f'  {name}: {{size: {len(docs[name].encode("utf-8"))}, sha256: "{digest}"}}\n'
+        for name, digest in manifest.items()
+    )
+    return (
+        "# Myskillium Bootstrap Version\n"
+        "# Generated by build-spore.py - do not edit manually\n"
+        f'hash: "{calculate_combined_hash(manifest)}"\n'
+        f"docs:\n{entries}"
+    )
+
+
+def load_payload_module(path: Path) -> dict:
+    """Execute a generated payload module and return its namespace."""
+    namespace = {}
+    exec(compile(path.read_text(encoding="utf-8"), str(path), "exec"), namespace)
+    return namespace
+
+
+def verify(payload_path: Path, docs_dir: Path) -> list[str]:
+    """Check the stamped constants against the payload and source docs. Returns problems found."""
+    try:
+        module = load_payload_module(payload_path)
+        docs = json.loads(zlib.decompress(base64.b64decode(module["PAYLOAD"])))
+        stamped_hash = module["EMBEDDED_HASH"]
+        stamped_manifest = module["EMBEDDED_MANIFEST"]
+    except (OSError, KeyError, ValueError, zlib.error) as e:
+        return [f"cannot load payload {payload_path}: {e}"]
+
+    problems = []
+    manifest = calculate_manifest(docs)
+    if list(stamped_manifest) != list(manifest):
+        problems.append(f"manifest lists {sorted(stamped_manifest)}, payload contains {sorted(manifest)}")
+    for name, digest in manifest.items():
+        if name in stamped_manifest and stamped_manifest[name] != digest:
+            problems.append(f"manifest hash for {name} does not match payload")
+    if stamped_hash != calculate_combined_hash(manifest):
+        problems.append("EMBEDDED_HASH does not match payload")
+
+    source = read_docs(docs_dir)
+    if source != docs:
+        changed = sorted(set(source) ^ set(docs) | {n for n in source if n in docs and source[n] != docs[n]})
+        problems.append(f"payload is stale against {docs_dir}: {', '.join(changed)} (run build-spore.py)")
+
+    version_path = docs_dir / VERSION_FILE_NAME
+    try:
+        published = version_path.read_text(encoding="utf-8")
+    except OSError:
+        published = None
+    if published != render_version_yml(source):
+        problems.append(f"{version_path} is missing or stale (run build-spore.py)")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the Myskillium spore payload")
+    parser.add_argument("--docs", type=Path, default=DEFAULT_DOCS_DIR, help="Directory containing the bootstrap docs")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Payload module to write")
+    parser.add_argument("--verify", action="store_true", help="Check the existing payload instead of building it")
+    args = parser.parse_args()
+
+    if args.verify:
+        problems = verify(args.output, args.docs)
+        if problems:
+            print(f"Spore payload verification failed ({len(problems)}):")
+            for problem in problems:
+                print(f"  ! {problem}")
+            sys.exit(1)
+        print(f"Spore payload {args.output} verified")
+        return
+
+    docs = read_docs(args.docs)
+    if not docs:
+        print(f"Error: no {DOC_GLOB} docs found in {args.docs}")
+        sys.exit(1)
+
+    args.output.write_text(render_module(docs), encoding="utf-8", newline="\n")
+    version_path = args.docs / VERSION_FILE_NAME
+    version_path.write_text(render_version_yml(docs), encoding="utf-8", newline="\n")
+    print(f"Wrote {len(docs)} docs to {args.output}")
+    print(f"Wrote {version_path}")
+
+
+if __name__ == "__main__":
+    main()
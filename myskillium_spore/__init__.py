@@ -0,0 +1,115 @@
+"""
+Myskillium Spore - importable hook package.
+
+This module holds only the stat-only fast path, so that the common case
+costs one small cached-bytecode load and a single `os.stat`. The hook itself
+lives in `hook` (imported only when a full check is due), and the embedded
+bootstrap docs in the generated `payload` module (see build-spore.py).
+
+The fast path deliberately avoids `datetime` and `pathlib` and works under
+`python -S -E`. With tracing enabled (MYSKILLIUM_SPORE_TRACE, see `trace`)
+it also appends one record per run, still without importing `json`.
+"""
+
+import os
+import time
+
+# Check-state marker (relative to the project root). Its mtime is the time
+# the next full check is due; the file body repeats it in a fixed-format
+# header for humans and for the scheduler (see hook.write_check_state).
+CHECK_STATE_FILE = os.path.join(".claude", "local", "myskillium-spore", "check-state")
+
+# A due time further out than this is treated as bogus (clock changes,
+# copied files) and triggers a full check
+MAX_CHECK_HORIZON = 8 * 24 * 3600
+
+# When the hook started (the launcher imports this package first): the
+# full check's latency budget is measured from here
+STARTED_AT = time.monotonic()
+
+# Opt-in tracing: MYSKILLIUM_SPORE_TRACE=1 appends a JSON line per run to
+# TRACE_FILE in the project; any other non-false value is a log file path
+# (e.g. one file shared by many projects). The log rotates to `<path>.1`
+# once it exceeds TRACE_MAX_BYTES.
+TRACE_ENV = "MYSKILLIUM_SPORE_TRACE"
+TRACE_FILE = os.path.join(".claude", "local", "myskillium-spore", "trace.jsonl")
+TRACE_MAX_BYTES = 1024 * 1024
+
+
+def get_project_root_str() -> str:
+    """Get the project root directory from environment or fallback to cwd."""
+    return os.environ.get("CLAUDE_PROJECT_DIR") or os.getcwd()
+
+
+def check_due(project_root: str | None = None) -> bool:
+    """
+    Return True if a full check is due, from a single stat of the marker.
+
+    Missing marker, a due time in the past, or one implausibly far in the
+    future all mean a full check is due.
+    """
+    root = project_root or get_project_root_str()
+    try:
+        due = os.stat(os.path.join(root, CHECK_STATE_FILE)).st_mtime
+    except OSError:
+        return True
+    now = time.time()
+    return not (now < due <= now + MAX_CHECK_HORIZON)
+
+
+def trace_path(project_root: str) -> str | None:
+    """Return the trace log path if tracing is enabled, else None."""
+    value = os.environ.get(TRACE_ENV, "").strip()
+    if value.lower() in ("", "0", "false", "no", "off"):
+        return None
+    if value.lower() in ("1", "true", "yes", "on"):
+        return os.path.join(project_root, TRACE_FILE)
+    return os.path.expanduser(value)
+
+
+def read_bytes() -> int | None:
+    """Bytes this process has read so far (`rchar`, Linux only), else None."""
+    try:
+        with open("/proc/self/io", "rb") as f:
+            for line in f:
+                if line.startswith(b"rchar:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def append_trace(path: str, line: str) -> None:
+    """Append one record (a single write with O_APPEND), rotating a full log first."""
+    try:
+        if os.stat(path).st_size > TRACE_MAX_BYTES:
+            os.replace(path, path + ".1")
+    except OSError:
+        pass
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line.encode("utf-8"))
+        finally:
+            os.close(fd)
+    except OSError:
+        pass  # Tracing must never break the hook
+
+
+def trace_fast_path(project_root: str | None = None) -> None:
+    """Record a fast-path run if tracing is enabled (the JSON is built by hand)."""
+    if TRACE_ENV not in os.environ:
+        return
+    root = project_root or get_project_root_str()
+    path = trace_path(root)
+    if path is None:
+        return
+    total_ms = (time.monotonic() - STARTED_AT) * 1000
+    read = read_bytes()
+    project = root.replace("\\", "\\\\").replace('"', '\\"')
+    append_trace(path, (
+        f'{{"ts": {time.time():.3f}, "project": "{project}", "path": "fast", '
+        f'"total_ms": {total_ms:.3f}, "steps": {{"stat": {total_ms:.3f}}}, '
+        f'"bytes_read": {"null" if read is None else read}}}\n'
+    ))
@@ -0,0 +1,383 @@
+"""
+Germination runtime for conidia (self-contained skill spores).
+
+`build-conidium.py` packs one or more `.claude/skills/<name>` trees into a
+single `conidium.py`: the source of this module followed by the payload
+constants it runs on and a data section. This module therefore uses only
+the standard library and never imports the rest of the package.
+
+Payload:
+- FILES: {path: (sha256, size, executable)} for every file, with paths
+  relative to `.claude/skills/` and `/`-separated
+- ROOT_HASH: Merkle root of FILES (see tree_hashes)
+- DATA_SIZE, INDEX_SIZE: lengths in bytes of the data section and of the
+  blob index that starts it
+
+The data section ends the file: a DATA_MARKER line, then the blob index -
+one `#<sha256> <offset> <length>` line per blob - then one `#<blob>` line
+per blob: its content zlib-compressed and base64-encoded (files with the
+same content share one blob). All comments, so running the conidium only
+has the tokenizer skim them; they are read by offset (see Blobs) when a
+file is written.
+
+Germination (`--germinate`) checks the manifest against ROOT_HASH, then
+compares it with the installed files. Files are stat-checked against the
+state recorded by the previous germination and only rehashed if their stat
+data changed, so a re-check costs parsing one manifest entry and one stat
+per file (and the tokenizer's pass over the data section) plus work
+proportional to what changed. Only missing or changed files are read from
+the data section, decoded and written (atomically, each verified against
+its hash before it replaces anything); files a previous version of the spore installed but this one no longer
+contains are removed if they were not modified. Apoptosis (`--apoptose`)
+removes the installed files that are still unmodified.
+"""
+
+import argparse
+import base64
+import hashlib
+import os
+import sys
+import zlib
+
+# Skills are installed here (relative to the project root)
+SKILLS_DIR = ".claude/skills"
+
+# Germination state, one file per spore (gitignored with .claude/local/)
+STATE_DIR = ".claude/local/conidium"
+
+# First line of a state file: format version and installed Merkle root
+STATE_HEADER = "MSKC1 {}\n"
+
+# Line that starts a conidium's data section
+DATA_MARKER = "# ---- Data: blob index, then one blob per line (see Blobs) ----"
+
+
+class SporeError(Exception):
+    """The spore's payload does not match its manifest."""
+
+
+def hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path: str) -> str:
+    """SHA-256 of a file's content, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def tree_hashes(files: dict[str, tuple[str, bool]]) -> dict[str, str]:
+    """
+    Return the Merkle hash of every directory of a file tree.
+
+    `files` maps `/`-separated paths to (sha256, executable). A directory's
+    hash is the SHA-256 of its entries sorted by name, one
+    `<kind> <hash> <name>\\n` line each, where kind is `f` (file), `x`
+    (executable file) or `d` (directory). The root directory is "".
+    """
+    entries = {"": []}
+    for path in files:
+        parent = path.rpartition("/")[0]
+        while parent not in entries:
+            entries[parent] = []
+            parent = parent.rpartition("/")[0]
+    for path, (digest, executable) in files.items():
+        parent, _, name = path.rpartition("/")
+        entries[parent].append((name, "x" if executable else "f", digest))
+
+    hashes = {}
+    # Deepest directories first, so every child is hashed before its parent
+    for directory in sorted(entries, key=lambda d: d.count("/") + bool(d), reverse=True):
+        lines = "".join(f"{kind} {digest} {name}\n" for name, kind, digest in sorted(entries[directory]))
+        hashes[directory] = hash_bytes(lines.encode("utf-8"))
+        if directory:
+            parent, _, name = directory.rpartition("/")
+            entries[parent].append((name, "d", hashes[directory]))
+    return hashes
+
+
+def manifest_root(files: dict[str, tuple[str, int, bool]]) -> str:
+    """Merkle root of a FILES manifest."""
+    return tree_hashes({path: (digest, executable) for path, (digest, _, executable) in files.items()})[""]
+
+
+class Blobs:
+    """
+    The blobs of a conidium, by sha256, read from the data section at the
+    end of its file (`size` bytes, the first `index_size` of them the blob
+    index; offsets in the index count from its end).
+
+    The index is read on the first lookup and each lookup seeks to its blob
+    and reads just that. If the file's length no longer matches (line
+    endings converted on checkout, say), the section is located by its
+    marker and read whole, line endings normalised.
+    """
+
+    def __init__(self, path: str, size: int, index_size: int):
+        self.path = path
+        self.size = size
+        self.index_size = index_size
+        self._index = None
+        self._section = None
+
+    def __getitem__(self, digest: str) -> bytes:
+        if self._index is None:
+            index = {}
+            for line in self._read(0, self.index_size).decode("ascii").splitlines():
+                blob, offset, length = line[1:].split()
+                index[blob] = (self.index_size + int(offset), int(length))
+            self._index = index
+        return self._read(*self._index[digest])
+
+    def _read(self, offset: int, length: int) -> bytes:
+        """Return `length` bytes at `offset` in the data section."""
+        if self._section is None:
+            marker = DATA_MARKER.encode("ascii") + b"\n"
+            with open(self.path, "rb") as f:
+                start = f.seek(0, os.SEEK_END) - self.size
+                if start >= len(marker):
+                    f.seek(start - len(marker))
+                    if f.read(len(marker)) == marker:
+                        f.seek(start + offset)
+                        return f.read(length)
+                f.seek(0)
+                content = f.read().replace(b"\r\n", b"\n")
+            start = content.rfind(b"\n" + marker)
+            if start < 0:
+                raise ValueError("data section not found")
+            self._section = content[start + 1 + len(marker):]
+        return self._section[offset:offset + length]
+
+
+def decode_blob(blobs: Blobs, digest: str, size: int) -> bytes:
+    """Decompress a blob and check it against its hash and size."""
+    try:
+        data = zlib.decompress(base64.b64decode(blobs[digest]))
+    except (KeyError, ValueError, zlib.error) as e:
+        raise SporeError(f"blob {digest[:12]} is missing or corrupt: {e}") from e
+    if len(data) != size or hash_bytes(data) != digest:
+        raise SporeError(f"blob {digest[:12]} does not match its hash")
+    return data
+
+
+def _stat_key(st: os.stat_result) -> str:
+    return f"{st.st_size}:{st.st_mtime_ns}:{st.st_ino}"
+
+
+def state_path(project_root: str, name: str) -> str:
+    return os.path.join(project_root, STATE_DIR, name)
+
+
+def read_state(project_root: str, name: str) -> tuple[str | None, dict[str, tuple[str, str]]]:
+    """Return (installed root, {path: (sha256, stat key)}) from the last germination."""
+    try:
+        with open(state_path(project_root, name), encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except (OSError, UnicodeDecodeError):
+        return None, {}
+    if not lines or not lines[0].startswith("MSKC1 "):
+        return None, {}
+    installed = {}
+    for line in lines[1:]:
+        parts = line.split("\t")
+        if len(parts) == 3:
+            installed[parts[0]] = (parts[1], parts[2])
+    return lines[0][len("MSKC1 "):], installed
+
+
+def _write_atomic(path: str, data: bytes, executable: bool = False) -> None:
+    """Write a file via a temp file and rename, so readers never see it half-written."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        if executable:
+            os.chmod(tmp, os.stat(tmp).st_mode | 0o111)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def write_state(project_root: str, name: str, root: str, installed: dict[str, tuple[str, str]]) -> None:
+    lines = [STATE_HEADER.format(root)]
+    lines += [f"{path}\t{digest}\t{key}\n" for path, (digest, key) in sorted(installed.items())]
+    _write_atomic(state_path(project_root, name), "".join(lines).encode("utf-8"))
+
+
+def scan_installed(project_root: str, paths, recorded: dict[str, tuple[str, str]]) -> dict[str, tuple[str, bool, str]]:
+    """
+    Return {path: (sha256, executable, stat key)} for the given paths that exist.
+
+    Files whose stat data matches the recorded state keep their recorded
+    hash; only the others are read.
+    """
+    skills = os.path.join(project_root, SKILLS_DIR)
+    found = {}
+    for path in paths:
+        full = os.path.join(skills, path)
+        try:
+            st = os.stat(full)
+        except OSError:
+            continue
+        key = _stat_key(st)
+        previous = recorded.get(path)
+        digest = previous[0] if previous and previous[1] == key else None
+        if digest is None:
+            try:
+                digest = hash_file(full)
+            except OSError:
+                continue
+        found[path] = (digest, bool(st.st_mode & 0o111) and os.name != "nt", key)
+    return found
+
+
+def germinate(project_root: str, name: str, files: dict, blobs: Blobs, root: str, dry_run: bool = False) -> dict:
+    """
+    Install the spore's files into the project. Returns lists of paths by
+    outcome: added, updated, removed, kept (modified files no longer in the
+    spore) and unchanged.
+    """
+    if manifest_root(files) != root:
+        raise SporeError("manifest does not match the spore's root hash")
+    for path in files:
+        if path.startswith("/") or "\\" in path or any(part in ("", ".", "..") for part in path.split("/")):
+            raise SporeError(f"unsafe path in manifest: {path!r}")
+
+    stats = {"added": [], "updated": [], "removed": [], "kept": [], "unchanged": []}
+    _, recorded = read_state(project_root, name)
+    local = scan_installed(project_root, list(files) + [p for p in recorded if p not in files], recorded)
+
+    # Same Merkle root as the manifest: nothing to write
+    wanted = {path: (local[path][0], local[path][1]) for path in files if path in local}
+    if len(wanted) == len(files) and tree_hashes(wanted)[""] == root:
+        to_write = []
+    else:
+        to_write = [path for path, (digest, _, executable) in files.items()
+                    if wanted.get(path) != (digest, executable and os.name != "nt")]
+    stats["unchanged"] = [path for path in files if path not in to_write]
+
+    skills = os.path.join(project_root, SKILLS_DIR)
+    decoded = {}
+    for path in to_write:
+        stats["updated" if path in local else "added"].append(path)
+        if dry_run:
+            continue
+        digest, size, executable = files[path]
+        if digest not in decoded:
+            decoded[digest] = decode_blob(blobs, digest, size)
+        _write_atomic(os.path.join(skills, path), decoded[digest], executable)
+
+    # Files an earlier version installed that this one does not contain
+    for path in sorted(p for p in recorded if p not in files):
+        if path not in local:
+            continue
+        if local[path][0] != recorded[path][0]:
+            stats["kept"].append(path)
+            continue
+        stats["removed"].append(path)
+        if not dry_run:
+            _remove(skills, path)
+
+    if not dry_run:
+        # Verify what was written, then record it for the next re-check
+        verified = scan_installed(project_root, to_write, {})
+        bad = [path for path in to_write if verified.get(path, (None,))[0] != files[path][0]]
+        if bad:
+            raise SporeError(f"written files do not match the manifest: {', '.join(bad)}")
+        installed = {path: (local[path][0], local[path][2]) for path in stats["unchanged"]}
+        installed.update({path: (digest, key) for path, (digest, _, key) in verified.items()})
+        installed.update({path: recorded[path] for path in stats["kept"]})
+        write_state(project_root, name, root, installed)
+    return stats
+
+
+def apoptose(project_root: str, name: str, dry_run: bool = False) -> dict:
+    """
+    Remove the files the spore installed. Files modified since germination
+    are kept. Returns lists of paths: removed and kept.
+    """
+    stats = {"removed": [], "kept": []}
+    _, recorded = read_state(project_root, name)
+    local = scan_installed(project_root, recorded, recorded)
+    skills = os.path.join(project_root, SKILLS_DIR)
+    for path in sorted(local):
+        if local[path][0] != recorded[path][0]:
+            stats["kept"].append(path)
+            continue
+        stats["removed"].append(path)
+        if not dry_run:
+            _remove(skills, path)
+    if not dry_run:
+        try:
+            os.unlink(state_path(project_root, name))
+            os.rmdir(os.path.join(project_root, STATE_DIR))
+        except OSError:
+            pass  # other spores are still installed
+    return stats
+
+
+def _remove(skills_dir: str, path: str) -> None:
+    """Remove an installed file and any directories it leaves empty."""
+    full = os.path.join(skills_dir, path)
+    try:
+        os.unlink(full)
+    except OSError:
+        return
+    parent = os.path.dirname(full)
+    while os.path.normpath(parent) != os.path.normpath(skills_dir):
+        try:
+            os.rmdir(parent)
+        except OSError:
+            break
+        parent = os.path.dirname(parent)
+
+
+def _print_stats(stats: dict) -> None:
+    labels = {"added": ("Added", "+"), "updated": ("Updated", "~"), "removed": ("Removed", "-"),
+              "kept": ("Kept (modified locally)", "*")}
+    for key, (label, mark) in labels.items():
+        if stats.get(key):
+            print(f"{label} ({len(stats[key])}):")
+            for path in stats[key]:
+                print(f"  {mark} {SKILLS_DIR}/{path}")
+            print()
+    if stats.get("unchanged"):
+        print(f"Unchanged: {len(stats['unchanged'])} files")
+        print()
+
+
+def main(files: dict, blobs: Blobs, root: str, name: str) -> None:
+    """Command line of a built conidium.py."""
+    parser = argparse.ArgumentParser(description=f"Myskillium conidium: {name}")
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument("--germinate", action="store_true", help="Install or update the skills")
+    action.add_argument("--apoptose", action="store_true", help="Remove the installed skills")
+    parser.add_argument("--project", default=None, help="Project root (default: $CLAUDE_PROJECT_DIR or cwd)")
+    parser.add_argument("--dry-run", action="store_true", help="Show what would be done without making changes")
+    args = parser.parse_args()
+
+    project_root = args.project or os.environ.get("CLAUDE_PROJECT_DIR") or os.getcwd()
+    if args.dry_run:
+        print("=== DRY RUN (no changes made) ===")
+        print()
+    try:
+        if args.germinate:
+            stats = germinate(project_root, name, files, blobs, root, args.dry_run)
+            changed = stats["added"] or stats["updated"] or stats["removed"]
+            print(f"Germinated {name} ({root[:12]})" if changed else f"{name} already up to date ({root[:12]})")
+        else:
+            stats = apoptose(project_root, name, args.dry_run)
+            print(f"Removed {name}")
+    except (SporeError, OSError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    print()
+    _print_stats(stats)
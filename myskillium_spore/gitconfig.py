@@ -0,0 +1,290 @@
+"""
+Minimal in-process reader for git remote URLs.
+
+Lets the spore decide whether a project is the Myskillium source template
+without spawning `git remote -v`. Handles what affects remote URLs in
+practice:
+
+- `.git` files pointing elsewhere (`gitdir: ...`), for worktrees (via
+  `commondir`) and submodules
+- system, global (`~/.gitconfig`, `$XDG_CONFIG_HOME/git/config`), local and
+  per-worktree config files
+- `[include]` and `[includeIf "gitdir:..."|"gitdir/i:..."|"onbranch:..."]`
+  (`hasconfig:` conditions are treated as not matching)
+- `url.<base>.insteadOf` / `pushInsteadOf` rewrites
+
+Every file that was consulted (read or found missing) is reported, so
+callers can cache a verdict keyed on those files' stat data.
+"""
+
+import os
+import re
+
+# Maximum include depth (git uses 10 as well)
+MAX_INCLUDE_DEPTH = 10
+
+_SECTION_RE = re.compile(r'^\[\s*([A-Za-z0-9.-]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]')
+
+
+def find_git_dir(start: str) -> tuple[str, str] | None:
+    """
+    Locate the repository for `start` like git does (walking upwards).
+
+    Returns (dot_git_path, git_dir): the `.git` entry that was found and the
+    directory it resolves to, or None if `start` is not inside a repository.
+    """
+    current = os.path.abspath(start)
+    while True:
+        dot_git = os.path.join(current, ".git")
+        if os.path.isdir(dot_git):
+            return dot_git, dot_git
+        if os.path.isfile(dot_git):
+            try:
+                with open(dot_git, encoding="utf-8") as f:
+                    line = f.readline().strip()
+            except (OSError, UnicodeDecodeError):
+                return None
+            if not line.startswith("gitdir:"):
+                return None
+            target = line[len("gitdir:"):].strip()
+            return dot_git, os.path.normpath(os.path.join(current, target))
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def common_dir(git_dir: str) -> str:
+    """Return the common git dir (differs from git_dir for linked worktrees)."""
+    try:
+        with open(os.path.join(git_dir, "commondir"), encoding="utf-8") as f:
+            target = f.readline().strip()
+    except OSError:
+        return git_dir
+    return os.path.normpath(os.path.join(git_dir, target))
+
+
+def _parse_value(raw: str) -> str:
+    """Parse a config value: quotes, escapes, inline comments."""
+    out = []
+    quoted = False
+    i = 0
+    while i < len(raw):
+        c = raw[i]
+        if c == '"':
+            quoted = not quoted
+        elif c == "\\" and i + 1 < len(raw):
+            i += 1
+            out.append({"n": "\n", "t": "\t", "b": "\b"}.get(raw[i], raw[i]))
+        elif c in ";#" and not quoted:
+            break
+        else:
+            out.append(c)
+        i += 1
+    return "".join(out).strip()
+
+
+def _read_entries(path: str) -> list[tuple[str, str, str, str]] | None:
+    """
+    Read a config file into (section, subsection, key, value) tuples.
+
+    Section and key are lower-cased; subsection keeps its case. Returns
+    None if the file cannot be read.
+    """
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return None
+
+    entries = []
+    section = subsection = ""
+    pending = ""
+    for line in lines:
+        # Continuation lines (value ending in a backslash)
+        if pending:
+            line = pending + line
+            pending = ""
+        stripped = line.strip()
+        if not stripped or stripped[0] in ";#":
+            continue
+        if stripped.startswith("["):
+            match = _SECTION_RE.match(stripped)
+            if not match:
+                continue
+            name, sub = match.group(1), match.group(2)
+            if sub is not None:
+                section, subsection = name.lower(), re.sub(r"\\(.)", r"\1", sub)
+            elif "." in name:
+                # Deprecated [section.subsection] syntax (subsection lower-cased)
+                section, _, subsection = name.lower().partition(".")
+            else:
+                section, subsection = name.lower(), ""
+            stripped = stripped[match.end():].strip()
+            if not stripped or stripped[0] in ";#":
+                continue
+        if stripped.endswith("\\") and not stripped.endswith("\\\\"):
+            pending = stripped[:-1]
+            continue
+        key, eq, raw = stripped.partition("=")
+        value = _parse_value(raw) if eq else "true"
+        entries.append((section, subsection, key.strip().lower(), value))
+    return entries
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a git wildmatch pattern (with `**`) to a regex."""
+    out = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            out.append("[^/]")
+            i += 1
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return "".join(out)
+
+
+def _gitdir_matches(pattern: str, git_dir: str, config_path: str, ignore_case: bool) -> bool:
+    """Evaluate an `includeIf "gitdir:<pattern>"` condition."""
+    if pattern.startswith("~/"):
+        pattern = os.path.expanduser("~") + pattern[1:]
+    elif pattern.startswith("./"):
+        pattern = os.path.join(os.path.dirname(config_path), pattern[2:])
+    pattern = pattern.replace("\\", "/")
+    if not (pattern.startswith("/") or re.match(r"^[A-Za-z]:/", pattern)):
+        pattern = "**/" + pattern
+    if pattern.endswith("/"):
+        pattern += "**"
+    target = os.path.realpath(git_dir).replace("\\", "/")
+    flags = re.IGNORECASE if ignore_case else 0
+    candidates = {target, git_dir.replace("\\", "/")}
+    return any(re.fullmatch(_glob_to_regex(pattern), c, flags) for c in candidates)
+
+
+def _current_branch(git_dir: str) -> str | None:
+    try:
+        with open(os.path.join(git_dir, "HEAD"), encoding="utf-8") as f:
+            head = f.readline().strip()
+    except OSError:
+        return None
+    prefix = "ref: refs/heads/"
+    return head[len(prefix):] if head.startswith(prefix) else None
+
+
+def _include_applies(subsection: str, git_dir: str, config_path: str, consulted: list) -> bool:
+    """Evaluate an includeIf condition."""
+    kind, _, arg = subsection.partition(":")
+    if kind in ("gitdir", "gitdir/i"):
+        return _gitdir_matches(arg, git_dir, config_path, kind == "gitdir/i")
+    if kind == "onbranch":
+        # The verdict now also depends on the checked-out branch
+        consulted.append(os.path.join(git_dir, "HEAD"))
+        branch = _current_branch(git_dir)
+        if branch is None:
+            return False
+        if arg.endswith("/"):
+            arg += "**"
+        return re.fullmatch(_glob_to_regex(arg), branch) is not None
+    return False  # hasconfig: and unknown conditions
+
+
+def _collect(path: str, git_dir: str, depth: int, entries: list, consulted: list) -> None:
+    """Read a config file and, recursively, the files it includes."""
+    consulted.append(path)
+    file_entries = _read_entries(path)
+    if file_entries is None or depth > MAX_INCLUDE_DEPTH:
+        return
+    for entry in file_entries:
+        section, subsection, key, value = entry
+        if key == "path" and (
+            (section == "include" and not subsection)
+            or (section == "includeif" and _include_applies(subsection, git_dir, path, consulted))
+        ):
+            target = os.path.expanduser(value)
+            if not os.path.isabs(target):
+                target = os.path.join(os.path.dirname(path), target)
+            _collect(os.path.normpath(target), git_dir, depth + 1, entries, consulted)
+        else:
+            entries.append(entry)
+
+
+def config_files(git_dir: str) -> list[str]:
+    """
+    Return the top-level config files git reads for this repository, in order.
+
+    The per-worktree `config.worktree` is not included; it only applies when
+    `extensions.worktreeConfig` is enabled (see read_remote_urls).
+    """
+    files = []
+    if not os.environ.get("GIT_CONFIG_NOSYSTEM"):
+        files.append(os.environ.get("GIT_CONFIG_SYSTEM") or "/etc/gitconfig")
+    if os.environ.get("GIT_CONFIG_GLOBAL"):
+        files.append(os.environ["GIT_CONFIG_GLOBAL"])
+    else:
+        xdg = os.environ.get("XDG_CONFIG_HOME") or os.path.join(os.path.expanduser("~"), ".config")
+        files.append(os.path.join(xdg, "git", "config"))
+        files.append(os.path.join(os.path.expanduser("~"), ".gitconfig"))
+    files.append(os.path.join(common_dir(git_dir), "config"))
+    return files
+
+
+def _rewrite(url: str, rules: list[tuple[str, str]]) -> str:
+    """Apply the longest matching insteadOf prefix rule."""
+    best = None
+    for prefix, base in rules:
+        if url.startswith(prefix) and (best is None or len(prefix) > len(best[0])):
+            best = (prefix, base)
+    return best[1] + url[len(best[0]):] if best else url
+
+
+def read_remote_urls(project_root: str) -> tuple[list[str], list[str], str | None]:
+    """
+    Return (urls, consulted_files, dot_git) for the repository at project_root.
+
+    `urls` are all fetch and push URLs after insteadOf rewriting (what
+    `git remote -v` prints). `consulted_files` lists every config file that
+    was read or looked for. `dot_git` is the `.git` entry found, or None if
+    project_root is not inside a repository.
+    """
+    found = find_git_dir(project_root)
+    if found is None:
+        return [], [], None
+    dot_git, git_dir = found
+
+    entries = []
+    consulted = []
+    for path in config_files(git_dir):
+        _collect(path, git_dir, 0, entries, consulted)
+
+    # config.worktree only applies with extensions.worktreeConfig enabled
+    if any(
+        s == "extensions" and k == "worktreeconfig" and v.lower() in ("true", "yes", "on", "1")
+        for s, _, k, v in entries
+    ):
+        _collect(os.path.join(git_dir, "config.worktree"), git_dir, 0, entries, consulted)
+
+    fetch_rules = [(v, sub) for s, sub, k, v in entries if s == "url" and k == "insteadof"]
+    push_rules = [(v, sub) for s, sub, k, v in entries if s == "url" and k == "pushinsteadof"]
+
+    urls = []
+    for section, _, key, value in entries:
+        if section != "remote":
+            continue
+        if key == "url":
+            urls.append(_rewrite(value, fetch_rules))
+            if push_rules:
+                urls.append(_rewrite(value, push_rules))
+        elif key == "pushurl":
+            urls.append(value)
+    return urls, consulted, dot_git
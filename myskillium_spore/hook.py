@@ -0,0 +1,1380 @@
+"""
+Myskillium Spore - Bootstrap Hook
+
+A self-bootstrapping SessionStart hook that syncs and checks for updates to
+the Myskillium bootstrap skill docs. Embeds all 7 planning docs and writes
+them to .claude/skills/bootstrap/ when needed.
+
+Workflow (optimized for minimal intrusion - fastest checks first):
+1. Fast path → silent exit until the scheduled next check (most common;
+   handled by `myskillium_spore.check_due()` before this module is imported)
+2. Source template check → silent exit if git remote is Mharbulous/Myskillium
+3. Hash comparison → sync docs if any difference (missing, added, or modified)
+4. Remote check → a detached background worker fetches the upstream hash;
+   a later session notifies if an update is available
+
+Scheduling: each full check stores the next due time in the check-state
+marker - the check interval (24h by default) after a successful check, a
+shorter reminder interval while an update is available (reusing the cached
+result), and exponential backoff after failed remote checks. All intervals
+are jittered and configurable (see CHECK_INTERVAL and friends).
+
+Performance: The fast path (~99% of invocations) is a single stat of the
+check-state marker in the package `__init__`; this module, and with it
+datetime and pathlib, is only imported by the tiny `myskillium-spore.py`
+launcher when a full check is due, and then from cached bytecode. The
+embedded docs live in the generated `payload` module as a compressed blob
+and are only imported and decoded when a sync runs. Heavy modules (hashlib,
+http.client) are imported only when needed (once per check at most), and git
+remotes are read from the repository config without a subprocess. The
+network request runs in a detached background process, so SessionStart
+never waits on it.
+"""
+
+# Imports for the full check - this module is never loaded on the fast path
+import os
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+from . import (
+    CHECK_STATE_FILE,
+    MAX_CHECK_HORIZON,
+    STARTED_AT,
+    append_trace,
+    check_due,
+    get_project_root_str,
+    read_bytes,
+    trace_path,
+)
+
+# Lazy imports - these are only loaded when actually needed (once per check)
+# This keeps the full check as light as possible
+hashlib = None
+
+
+def _import_hashlib():
+    global hashlib
+    if hashlib is None:
+        import hashlib as _hashlib
+        hashlib = _hashlib
+    return hashlib
+
+# Source template identifier - split to resist simple text searches
+# Assembled at runtime: "Mharbulous/Myskillium"
+_SOURCE_OWNER = "Mharbulous"
+_SOURCE_REPO = "Myskillium"
+
+# Remote version.yml for update checks (same format as local, just need the hash).
+# MYSKILLIUM_SPORE_REMOTE_URL overrides it (e.g. a local stand-in server).
+REMOTE_VERSION_URL = os.environ.get("MYSKILLIUM_SPORE_REMOTE_URL") or (
+    f"https://raw.githubusercontent.com/{_SOURCE_OWNER}/{_SOURCE_REPO}/main/.claude/skills/bootstrap/version.yml"
+)
+
+# Byte cap for the remote version.yml response
+REMOTE_MAX_BYTES = 64 * 1024
+
+# Target directory for bootstrap skill docs
+BOOTSTRAP_SKILL_DIR = ".claude/skills/bootstrap"
+
+# Version file for tracking last check (replaces self-modifying timestamp)
+VERSION_FILE = ".claude/skills/bootstrap/version.yml"
+
+# Cached source-template verdict (see is_source_template)
+SOURCE_VERDICT_FILE = os.path.join(os.path.dirname(CHECK_STATE_FILE), "source-verdict")
+
+# Remote-check state lives in the project's state dir, or - when
+# MYSKILLIUM_SPORE_SHARED_CACHE is set - in a machine-wide cache dir shared
+# by every project (see remote_state_path). Set it to 1/true/yes for the
+# platform cache dir, or to a directory path.
+SHARED_CACHE_ENV = "MYSKILLIUM_SPORE_SHARED_CACHE"
+
+# Stored response validators (ETag, Last-Modified) and hash of the last
+# successful remote fetch, for conditional requests
+REMOTE_CACHE_NAME = "remote-cache"
+
+# Result of the last background remote check, written by the worker:
+# "MSKR1 <checked_at epoch> <ok|error> <remote hash or ->"
+REMOTE_RESULT_NAME = "remote-result"
+
+# Held (O_EXCL-created) by a running background worker
+REMOTE_WORKER_LOCK_NAME = "remote-worker.lock"
+
+# Hard limit on a worker's lifetime; a lock older than this belongs to an
+# orphaned (hung or killed) worker and may be reclaimed
+REMOTE_WORKER_TIMEOUT = 30
+
+# Byte cap for each bootstrap doc downloaded by a delta update
+REMOTE_DOC_MAX_BYTES = 256 * 1024
+
+# Outcome of the last delta update (per project, even with the shared cache)
+DELTA_STATE_FILE = os.path.join(os.path.dirname(CHECK_STATE_FILE), "delta-state")
+
+# Upstream doc names a delta update may write (no paths, no dotfiles)
+_DOC_NAME_PATTERN = r"[A-Za-z0-9][A-Za-z0-9._-]*\.md"
+
+# Single-flight lock for the full check: concurrent sessions that cannot
+# take it exit immediately. Older than this many seconds means orphaned.
+CHECK_LOCK_FILE = os.path.join(os.path.dirname(CHECK_STATE_FILE), "check.lock")
+CHECK_LOCK_STALE_AFTER = 60
+
+
+def _env_hours(name: str, default: float) -> float:
+    """Read an interval in hours from the environment, returning seconds."""
+    try:
+        hours = float(os.environ.get(name, ""))
+    except ValueError:
+        hours = default
+    if not 0 < hours < float("inf"):
+        hours = default
+    return hours * 3600
+
+
+# Scheduler intervals (seconds), configurable in hours via the environment.
+# CHECK_INTERVAL: between full checks after a successful (or source) check
+# REMINDER_INTERVAL: between "Update Available" reminders, which reuse the
+#   cached remote result instead of refetching it
+# RETRY_BASE / RETRY_MAX: exponential backoff after failed remote checks
+CHECK_INTERVAL = _env_hours("MYSKILLIUM_SPORE_CHECK_HOURS", 24)
+REMINDER_INTERVAL = _env_hours("MYSKILLIUM_SPORE_REMINDER_HOURS", 4)
+RETRY_BASE = _env_hours("MYSKILLIUM_SPORE_RETRY_HOURS", 1)
+RETRY_MAX = _env_hours("MYSKILLIUM_SPORE_RETRY_MAX_HOURS", 96)
+
+# Regular intervals are spread by +/- this fraction so that machines which
+# started together do not all check at the same hour
+CHECK_JITTER = 0.1
+
+# Latency budget for one hook run (ms from the launcher's start, interpreter
+# startup excluded); 0 or less disables it. When the budget is spent the
+# full check stops, records the step that overran and is retried after
+# BUDGET_DEFER_DELAY seconds, by when the caches it filled make it cheaper.
+# After BUDGET_MAX_DEFERRALS overruns in a row the check runs under the
+# much larger BUDGET_CAP_MS instead, so a machine too slow for the budget
+# (e.g. the import alone overruns it) still syncs. The cap cannot be
+# disabled and stays below CHECK_LOCK_STALE_AFTER: a step that stalls for
+# good is still cut off, and the check then backs off like a failed one.
+try:
+    BUDGET_MS = float(os.environ.get("MYSKILLIUM_SPORE_BUDGET_MS", "150"))
+except ValueError:
+    BUDGET_MS = 150.0
+try:
+    BUDGET_CAP_MS = float(os.environ.get("MYSKILLIUM_SPORE_BUDGET_CAP_MS", "20000"))
+except ValueError:
+    BUDGET_CAP_MS = 20000.0
+if not 0 < BUDGET_CAP_MS < CHECK_LOCK_STALE_AFTER * 1000:
+    BUDGET_CAP_MS = 20000.0
+BUDGET_DEFER_DELAY = 60
+BUDGET_LOG_FILE = os.path.join(os.path.dirname(CHECK_STATE_FILE), "budget-overruns")
+BUDGET_LOG_LINES = 20
+BUDGET_MAX_DEFERRALS = 3
+
+# Fixed-format check-state header: magic, 10-digit epoch of the next due
+# time, the number of consecutive failed remote checks and the number of
+# consecutive budget deferrals
+CHECK_STATE_HEADER = "MSKS1 {:010d} {:03d} {:03d}\n"
+
+# Embedded docs - decoded lazily from the compressed payload on first use
+_EMBEDDED_DOCS = None
+
+
+def load_embedded_docs() -> dict[str, str]:
+    """
+    Return the embedded docs as {filename: content} (decoded once, then cached).
+
+    The payload module holds the docs as a zlib-compressed JSON blob so that
+    importing this module stays cheap; nothing is decompressed until a sync
+    or hash check actually needs the content.
+    """
+    global _EMBEDDED_DOCS
+    if _EMBEDDED_DOCS is None:
+        import base64
+        import json
+        import zlib
+        from . import payload
+        _EMBEDDED_DOCS = json.loads(zlib.decompress(base64.b64decode(payload.PAYLOAD)))
+    return _EMBEDDED_DOCS
+
+
+def embedded_doc_names() -> tuple[str, ...]:
+    """Return the embedded doc filenames without decoding the payload."""
+    from . import payload
+    return tuple(payload.EMBEDDED_MANIFEST)
+
+
+def _extract_hash_from_yml(content: str) -> str | None:
+    """Extract hash value from version.yml content. Returns None if not found."""
+    for line in content.splitlines():
+        line = line.strip()
+        if line.startswith("hash:"):
+            return line.split(":", 1)[1].strip().strip('"\'')
+    return None
+
+
+def _extract_doc_fields_from_yml(content: str) -> dict[str, dict[str, str]]:
+    """
+    Extract the raw per-doc fields from the `docs:` section of version.yml.
+
+    Each entry is a flow mapping on one line, e.g.
+    `  01-prd.md: {size: 1763, mtime_ns: 1736942400000000000, sha256: "abc..."}`.
+    Lines that are not flow mappings are skipped.
+    """
+    docs = {}
+    in_docs = False
+    for line in content.splitlines():
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        if not line.startswith(" "):
+            in_docs = line.strip() == "docs:"
+            continue
+        if not in_docs:
+            continue
+        name, _, mapping = line.strip().partition(": ")
+        mapping = mapping.strip()
+        if not mapping.startswith("{") or not mapping.endswith("}"):
+            continue
+        fields = {}
+        for part in mapping[1:-1].split(","):
+            key, _, value = part.partition(":")
+            fields[key.strip()] = value.strip().strip('"\'')
+        docs[name] = fields
+    return docs
+
+
+def _extract_docs_from_yml(content: str) -> dict:
+    """
+    Extract the local per-doc entries ({"size", "mtime_ns", "sha256"}) from
+    version.yml content. Malformed entries are skipped (they will simply be
+    rehashed).
+    """
+    docs = {}
+    for name, fields in _extract_doc_fields_from_yml(content).items():
+        try:
+            docs[name] = {
+                "size": int(fields["size"]),
+                "mtime_ns": int(fields["mtime_ns"]),
+                "sha256": fields["sha256"],
+            }
+        except (KeyError, ValueError):
+            continue
+    return docs
+
+
+def _extract_manifest_from_yml(content: str) -> dict[str, str]:
+    """
+    Extract the published {filename: sha256} manifest from an upstream
+    version.yml (as written by build-spore.py). Entries with a malformed
+    hash are skipped.
+    """
+    return {
+        name: fields["sha256"]
+        for name, fields in _extract_doc_fields_from_yml(content).items()
+        if len(fields.get("sha256", "")) == 64
+    }
+
+
+def calculate_embedded_hash() -> str:
+    """
+    Return the combined SHA-256 hash of all embedded docs.
+
+    Stamped into the payload by build-spore.py, so no hashing (or payload
+    decoding) happens at runtime. Used to detect when local files differ
+    from what's embedded in this hook.
+    """
+    from . import payload
+    return payload.EMBEDDED_HASH
+
+
+def get_project_root() -> Path:
+    """Get the project root directory from environment or fallback to cwd."""
+    return Path(get_project_root_str())
+
+
+def get_skill_dir(project_root: Path) -> Path:
+    """Get the bootstrap skill directory path."""
+    return project_root / BOOTSTRAP_SKILL_DIR
+
+
+def write_embedded_docs(skill_dir: Path, names: list[str] | None = None) -> None:
+    """Write embedded docs to the skill directory (all of them, or just `names`)."""
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    docs = load_embedded_docs()
+    for filename in names if names is not None else docs:
+        _write_atomic(skill_dir / filename, docs[filename])
+
+
+def calculate_hash(content: str) -> str:
+    """Calculate SHA-256 hash of content."""
+    _hashlib = _import_hashlib()
+    return _hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def scan_local_docs(skill_dir: Path, recorded: dict, names: list[str] | None = None) -> dict:
+    """
+    Return {filename: entry} for each embedded doc (or each of `names`),
+    where entry is {"size", "mtime_ns", "sha256"} or None if the file is
+    missing.
+
+    Files whose size and mtime match their `recorded` entry (from version.yml)
+    reuse the recorded hash; only files whose stat data changed are read and
+    rehashed.
+    """
+    entries = {}
+    for name in names if names is not None else embedded_doc_names():
+        filepath = skill_dir / name
+        try:
+            st = filepath.stat()
+        except OSError:
+            entries[name] = None
+            continue
+        entry = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        previous = recorded.get(name)
+        if previous and previous["size"] == st.st_size and previous["mtime_ns"] == st.st_mtime_ns:
+            entry["sha256"] = previous["sha256"]
+        else:
+            try:
+                entry["sha256"] = calculate_hash(filepath.read_text(encoding="utf-8"))
+            except (OSError, UnicodeDecodeError):
+                entries[name] = None
+                continue
+        entries[name] = entry
+    return entries
+
+
+def record_written_docs(skill_dir: Path, local_docs: dict, written: list[str], manifest: dict | None = None) -> dict:
+    """
+    Return local_docs with fresh entries for docs just written from the
+    payload (or from `manifest`, {filename: sha256}, for upstream docs).
+    """
+    if manifest is None:
+        from . import payload
+        manifest = payload.EMBEDDED_MANIFEST
+    entries = dict(local_docs)
+    for name in written:
+        try:
+            st = (skill_dir / name).stat()
+        except OSError:
+            entries[name] = None
+            continue
+        entries[name] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": manifest[name]}
+    return entries
+
+
+def calculate_local_hash(local_docs: dict) -> str:
+    """Calculate combined hash of all local docs from their scanned entries."""
+    return calculate_manifest_hash({
+        # File missing - use empty hash
+        name: entry["sha256"] if entry else calculate_hash("")
+        for name, entry in local_docs.items()
+    })
+
+
+def calculate_manifest_hash(manifest: dict[str, str]) -> str:
+    """Combine {filename: sha256} into the single hash published in version.yml."""
+    return calculate_hash("".join(f"{name}:{manifest[name]}" for name in sorted(manifest)))
+
+
+def changed_docs(local_docs: dict) -> list[str]:
+    """Return the docs that are missing or differ from the embedded version."""
+    from . import payload
+    return [
+        name for name, digest in payload.EMBEDDED_MANIFEST.items()
+        if not local_docs.get(name) or local_docs[name]["sha256"] != digest
+    ]
+
+
+def _stat_key(path: str) -> str:
+    """Identity of a file for cache validation ("-" if it does not exist)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return "-"
+    return f"{st.st_dev}:{st.st_ino}:{st.st_size}:{st.st_mtime_ns}"
+
+
+def _read_source_verdict(project_root: Path, dot_git: str | None) -> bool | None:
+    """
+    Return the cached source-template verdict, or None if it is stale.
+
+    The cache records the `.git` entry and the identity (device, inode,
+    size, mtime) of every config file consulted; if any of them changed,
+    the verdict is recomputed.
+    """
+    try:
+        lines = (project_root / SOURCE_VERDICT_FILE).read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if len(lines) < 2 or not lines[0].startswith("MSKV1 ") or lines[1] != (dot_git or "-"):
+        return None
+    for line in lines[2:]:
+        path, _, key = line.rpartition("\t")
+        if _stat_key(path) != key:
+            return None
+    return lines[0] == "MSKV1 1"
+
+
+def _write_source_verdict(project_root: Path, dot_git: str | None, consulted: list[str], verdict: bool) -> None:
+    """Cache the source-template verdict keyed on the consulted files."""
+    lines = [f"MSKV1 {int(verdict)}", dot_git or "-"]
+    lines += [f"{path}\t{_stat_key(path)}" for path in dict.fromkeys(consulted)]
+    try:
+        _write_atomic(project_root / SOURCE_VERDICT_FILE, "\n".join(lines) + "\n")
+    except (OSError, IOError):
+        pass  # Non-fatal - will just re-read the git config next time
+
+
+def is_source_template(project_root: Path) -> bool:
+    """
+    Check if this is the Myskillium source template by examining git remotes.
+
+    Returns True if any remote URL contains the source template identifier.
+    This prevents the source template from trying to update from itself.
+
+    Remote URLs are read in-process from the repository's git config (no
+    `git` subprocess), and the verdict is cached keyed on the identity of
+    every config file consulted, so re-checks are stat-only until the
+    config changes.
+    """
+    from . import gitconfig
+    found = gitconfig.find_git_dir(str(project_root))
+    dot_git = found[0] if found else None
+
+    cached = _read_source_verdict(project_root, dot_git)
+    if cached is not None:
+        return cached
+
+    source_pattern = f"{_SOURCE_OWNER}/{_SOURCE_REPO}"
+    urls, consulted, _ = gitconfig.read_remote_urls(str(project_root))
+    verdict = any(source_pattern in url for url in urls)
+    _write_source_verdict(project_root, dot_git, consulted, verdict)
+    return verdict
+
+
+def read_version_yml(project_root: Path) -> dict:
+    """
+    Read version.yml file and return parsed data.
+
+    Returns dict with 'last_check' (datetime or None), 'hash' (the deployed
+    docs' combined hash, str or None), 'source' ("embedded", "upstream" or
+    None) and 'docs' ({filename: {"size", "mtime_ns", "sha256"}}, empty if
+    absent).
+    """
+    version_path = project_root / VERSION_FILE
+    result = {"last_check": None, "hash": None, "source": None, "docs": {}}
+
+    if not version_path.exists():
+        return result
+
+    try:
+        content = version_path.read_text(encoding="utf-8")
+        # Extract hash and per-doc entries using shared helpers
+        result["hash"] = _extract_hash_from_yml(content)
+        result["docs"] = _extract_docs_from_yml(content)
+        # Parse source and the last_check timestamp
+        for line in content.splitlines():
+            line = line.strip()
+            if line.startswith("source:"):
+                result["source"] = line.split(":", 1)[1].strip().strip('"\'') or None
+            elif line.startswith("last_check:"):
+                ts_str = line.split(":", 1)[1].strip().strip('"\'')
+                try:
+                    dt = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
+                    if dt.tzinfo is None:
+                        dt = dt.replace(tzinfo=timezone.utc)
+                    result["last_check"] = dt
+                except ValueError:
+                    pass
+    except (OSError, IOError):
+        pass
+
+    return result
+
+
+def write_version_yml(project_root: Path, deployed_hash: str, local_docs: dict | None = None) -> None:
+    """
+    Write version.yml with current timestamp, the deployed docs' hash, where
+    they came from (`source: embedded` - this spore's payload - or
+    `upstream` - a delta update) and per-doc entries.
+    """
+    version_path = project_root / VERSION_FILE
+    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+    source = "embedded" if deployed_hash == calculate_embedded_hash() else "upstream"
+    content = f"""# Myskillium Bootstrap Version Tracking
+# Auto-generated - do not edit manually
+last_check: "{timestamp}"
+hash: "{deployed_hash}"
+source: {source}
+"""
+    entries = {name: entry for name, entry in (local_docs or {}).items() if entry}
+    if entries:
+        content += "docs:\n"
+        for name, entry in sorted(entries.items()):
+            content += (
+                f"  {name}: {{size: {entry['size']}, mtime_ns: {entry['mtime_ns']}, "
+                f"sha256: \"{entry['sha256']}\"}}\n"
+            )
+    try:
+        _write_atomic(version_path, content)
+    except (OSError, IOError):
+        pass  # Non-fatal - will just recheck next time
+
+
+def write_check_state(project_root: Path, next_due: float, failures: int = 0, deferrals: int = 0) -> None:
+    """
+    Write the check-state marker so the fast path skips until `next_due`.
+
+    The due time is stored as the file's mtime (read with a single stat by
+    `myskillium_spore.check_due()`) and repeated in a fixed-offset header,
+    together with the counts of consecutive failed remote checks and of
+    consecutive budget deferrals.
+    """
+    header = CHECK_STATE_HEADER.format(int(next_due), min(failures, 999), min(deferrals, 999))
+    try:
+        _write_atomic(project_root / CHECK_STATE_FILE, header, mtime=next_due)
+    except (OSError, IOError):
+        pass  # Non-fatal - will just recheck next time
+
+
+def _read_check_counts(project_root: Path) -> tuple[int, int]:
+    """Return (failures, deferrals) from the check-state header (0 if absent)."""
+    try:
+        # Bytes, not text: this runs at the start of every full check and
+        # need not load a codec
+        fields = (project_root / CHECK_STATE_FILE).read_bytes().split()
+    except OSError:
+        return 0, 0
+    # Markers written before deferrals were counted have three fields
+    if len(fields) in (3, 4) and fields[0] == b"MSKS1" and all(f.isdigit() for f in fields[2:]):
+        return int(fields[2]), int(fields[3]) if len(fields) == 4 else 0
+    return 0, 0
+
+
+def read_check_failures(project_root: Path) -> int:
+    """Return the consecutive failure count from the check-state header (0 if absent)."""
+    return _read_check_counts(project_root)[0]
+
+
+def read_check_deferrals(project_root: Path) -> int:
+    """Return the consecutive budget deferral count from the check-state header (0 if absent)."""
+    return _read_check_counts(project_root)[1]
+
+
+def next_check_delay(outcome: str, failures: int = 0) -> float:
+    """
+    Return the jittered delay (seconds) until the next full check.
+
+    `outcome` is "check" (checked, synced or source template), "reminder"
+    (update available) or "retry" (remote check failed `failures` times in a
+    row). Retries back off exponentially from RETRY_BASE up to RETRY_MAX with
+    "equal jitter" (uniform between half and all of the backoff); the other
+    intervals get +/- CHECK_JITTER. Delays are kept inside the fast path's
+    plausibility horizon.
+    """
+    import random
+    if outcome == "retry":
+        backoff = min(RETRY_MAX, RETRY_BASE * 2 ** max(failures - 1, 0))
+        delay = random.uniform(backoff / 2, backoff)
+    else:
+        interval = REMINDER_INTERVAL if outcome == "reminder" else CHECK_INTERVAL
+        delay = interval * random.uniform(1 - CHECK_JITTER, 1 + CHECK_JITTER)
+    return min(delay, MAX_CHECK_HORIZON - 60)
+
+
+def schedule_next_check(project_root: Path, outcome: str, failures: int = 0) -> None:
+    """Push the check-state marker to the next due time for `outcome`."""
+    import time
+    write_check_state(project_root, time.time() + next_check_delay(outcome, failures), failures)
+
+
+def hours_since_last_check(project_root: Path) -> float:
+    """Calculate hours since the last hash check from version.yml."""
+    version_data = read_version_yml(project_root)
+    last_check = version_data.get("last_check")
+
+    if last_check is None:
+        return float("inf")  # Never checked - trigger full check
+
+    now = datetime.now(timezone.utc)
+    delta = now - last_check
+    return delta.total_seconds() / 3600
+
+
+def shared_cache_dir() -> Path | None:
+    """
+    Return the machine-wide cache dir if MYSKILLIUM_SPORE_SHARED_CACHE
+    enables it, else None.
+
+    Defaults to $XDG_CACHE_HOME/myskillium (~/.cache/myskillium),
+    ~/Library/Caches/myskillium on macOS and %LOCALAPPDATA%\\myskillium\\Cache
+    on Windows.
+    """
+    value = os.environ.get(SHARED_CACHE_ENV, "").strip()
+    if value.lower() in ("", "0", "false", "no", "off"):
+        return None
+    if value.lower() not in ("1", "true", "yes", "on"):
+        return Path(os.path.expanduser(value))
+    if os.name == "nt" and os.environ.get("LOCALAPPDATA"):
+        return Path(os.environ["LOCALAPPDATA"]) / "myskillium" / "Cache"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "myskillium"
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "myskillium"
+
+
+def remote_state_path(project_root: Path, name: str) -> Path:
+    """
+    Return the path of a remote-check state file.
+
+    Per project by default. With the shared cache enabled, the file lives in
+    the shared cache dir instead, keyed by the remote URL, so every project
+    on the machine reuses one result and one worker lock; per-project state
+    is then only what is truly project-specific (version.yml's doc hashes,
+    the check-state marker and the source verdict).
+    """
+    shared = shared_cache_dir()
+    if shared is None:
+        return project_root / os.path.dirname(CHECK_STATE_FILE) / name
+    url_key = _import_hashlib().sha256(REMOTE_VERSION_URL.encode("utf-8")).hexdigest()[:16]
+    return shared / f"{name}-{url_key}"
+
+
+def read_remote_cache(project_root: Path) -> dict[str, str]:
+    """Read the remote cache ("key: value" lines). Returns {} if missing."""
+    cache = {}
+    try:
+        content = remote_state_path(project_root, REMOTE_CACHE_NAME).read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return cache
+    for line in content.splitlines():
+        key, sep, value = line.partition(": ")
+        if sep:
+            cache[key.strip()] = value
+    return cache
+
+
+def write_remote_cache(project_root: Path, cache: dict[str, str]) -> None:
+    """Write the remote cache. Non-fatal on error (next fetch is unconditional)."""
+    content = "".join(f"{key}: {value}\n" for key, value in cache.items() if value)
+    try:
+        _write_atomic(remote_state_path(project_root, REMOTE_CACHE_NAME), content)
+    except (OSError, IOError):
+        pass
+
+
+def fetch_remote_hash(project_root: Path, client=None, timeout: float = 5.0) -> str | None:
+    """
+    Fetch the remote hash from version.yml on GitHub. Returns None on any error.
+
+    Sends the ETag / Last-Modified validators stored from the previous fetch;
+    a 304 means unchanged and the cached hash is returned without a body.
+    Pass a `remote.RemoteClient` to reuse its keep-alive connection.
+    """
+    from . import remote
+
+    cache = read_remote_cache(project_root)
+    if cache.get("url") != REMOTE_VERSION_URL or not cache.get("hash"):
+        cache = {}
+
+    own_client = client is None
+    if own_client:
+        client = remote.RemoteClient(timeout=timeout)
+    try:
+        response = client.get(REMOTE_VERSION_URL, remote.conditional_headers(cache), max_bytes=REMOTE_MAX_BYTES)
+    except remote.RemoteError:
+        return None
+    finally:
+        if own_client:
+            client.close()
+
+    if response.not_modified:
+        return cache.get("hash")
+
+    try:
+        content = response.body.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+    remote_hash = _extract_hash_from_yml(content)
+    if remote_hash:
+        manifest = _extract_manifest_from_yml(content)
+        write_remote_cache(project_root, {
+            "url": REMOTE_VERSION_URL,
+            **remote.response_validators(response),
+            "hash": remote_hash,
+            "docs": " ".join(f"{name}={digest}" for name, digest in sorted(manifest.items())),
+        })
+    return remote_hash
+
+
+def read_remote_manifest(project_root: Path) -> dict[str, str]:
+    """
+    Return the upstream {filename: sha256} manifest stored with the last
+    fetch ({} if upstream publishes none, or for another remote URL).
+    """
+    cache = read_remote_cache(project_root)
+    if cache.get("url") != REMOTE_VERSION_URL:
+        return {}
+    manifest = {}
+    for item in cache.get("docs", "").split():
+        name, _, digest = item.rpartition("=")
+        if name:
+            manifest[name] = digest
+    return manifest
+
+
+def _write_atomic(path: Path, content: str, mtime: float | None = None) -> None:
+    """
+    Write a file via a temp file plus rename, so readers never see it torn.
+
+    If `mtime` is given it is set on the temp file before the rename, so the
+    file appears with its content and mtime at once.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(content, encoding="utf-8")
+        if mtime is not None:
+            os.utime(tmp, (mtime, mtime))
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def _try_lock(lock_path: Path, stale_after: float) -> bool:
+    """
+    Try to take a lock file without blocking. Returns True if acquired.
+
+    The lock is created with O_EXCL, so exactly one process wins. A lock
+    whose mtime is older than `stale_after` seconds is treated as orphaned
+    and reclaimed.
+    """
+    import time
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    for _ in range(2):
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            try:
+                age = time.time() - lock_path.stat().st_mtime
+            except OSError:
+                continue  # Released meanwhile - retry
+            if age < stale_after:
+                return False
+            try:
+                lock_path.unlink()  # Orphaned - reclaim
+            except OSError:
+                return False
+            continue
+        except OSError:
+            return False
+        with os.fdopen(fd, "w") as f:
+            f.write(f"{os.getpid()}\n")
+        return True
+    return False
+
+
+def _release_lock(lock_path: Path) -> None:
+    try:
+        lock_path.unlink()
+    except OSError:
+        pass
+
+
+def deployed_hash(project_root: Path) -> str:
+    """Return the hash of the deployed docs as recorded in version.yml (embedded hash if none)."""
+    return read_version_yml(project_root)["hash"] or calculate_embedded_hash()
+
+
+def remote_result_max_age(result: dict, deployed: str) -> float:
+    """
+    Return how long a remote result may be reused.
+
+    An "update available" result stays valid for a whole check interval so
+    reminders never refetch it; an up-to-date result for half of one (so it
+    is stale by the next scheduled check, but can be shared meanwhile); an
+    error only for half the first retry delay, so every retry refetches.
+    """
+    if result["status"] == "error":
+        return RETRY_BASE / 2
+    if result["hash"] != deployed:
+        return CHECK_INTERVAL
+    return CHECK_INTERVAL / 2
+
+
+def read_remote_result(project_root: Path) -> dict | None:
+    """
+    Return the background worker's result if it is fresh, else None.
+
+    Returns {"checked_at", "status", "hash"} where status is "ok" (hash is
+    the upstream hash) or "error" (network failure, hash is None). Missing,
+    malformed or stale (see remote_result_max_age) results give None.
+    """
+    import time
+    try:
+        fields = remote_state_path(project_root, REMOTE_RESULT_NAME).read_text(encoding="utf-8").split()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if len(fields) != 4 or fields[0] != "MSKR1" or not fields[1].isdigit() or fields[2] not in ("ok", "error"):
+        return None
+    result = {"checked_at": int(fields[1]), "status": fields[2], "hash": None if fields[3] == "-" else fields[3]}
+    if not 0 <= time.time() - result["checked_at"] < remote_result_max_age(result, deployed_hash(project_root)):
+        return None
+    return result
+
+
+def write_remote_result(project_root: Path, remote_hash: str | None) -> None:
+    """Record a remote check result (None means the fetch failed)."""
+    import time
+    status = "error" if remote_hash is None else "ok"
+    try:
+        _write_atomic(remote_state_path(project_root, REMOTE_RESULT_NAME), f"MSKR1 {int(time.time())} {status} {remote_hash or '-'}\n")
+    except OSError:
+        pass
+
+
+def read_delta_state(project_root: Path) -> dict | None:
+    """
+    Return the last delta update attempt, or None.
+
+    Returns {"checked_at", "hash", "status", "docs"}: the remote result it
+    was made for (its check time and upstream hash), "applied" or "failed",
+    and the docs written or removed.
+    """
+    try:
+        fields = (project_root / DELTA_STATE_FILE).read_text(encoding="utf-8").split()
+    except (OSError, UnicodeDecodeError):
+        return None
+    if len(fields) != 5 or fields[0] != "MSKD1" or not fields[1].isdigit() or fields[3] not in ("applied", "failed"):
+        return None
+    docs = [] if fields[4] == "-" else fields[4].split(",")
+    return {"checked_at": int(fields[1]), "hash": fields[2], "status": fields[3], "docs": docs}
+
+
+def write_delta_state(project_root: Path, result: dict, docs: list[str] | None) -> None:
+    """Record a delta update attempt for `result` (docs is None if it failed)."""
+    status = "failed" if docs is None else "applied"
+    content = f"MSKD1 {result['checked_at']} {result['hash']} {status} {','.join(docs or []) or '-'}\n"
+    try:
+        _write_atomic(project_root / DELTA_STATE_FILE, content)
+    except OSError:
+        pass
+
+
+def delta_update_due(project_root: Path, result: dict, deployed: str) -> bool:
+    """
+    Return True if the deployed docs should be delta-updated to `result`.
+
+    Each remote result gets one attempt: after a failure the hook falls back
+    to the Update Available notice until a newer result arrives.
+    """
+    if result["status"] != "ok" or not result["hash"] or result["hash"] == deployed:
+        return False
+    state = read_delta_state(project_root)
+    return not (state and state["hash"] == result["hash"] and state["checked_at"] == result["checked_at"])
+
+
+def apply_remote_docs(project_root: Path, client, remote_hash: str, deadline: float) -> list[str] | None:
+    """
+    Update the bootstrap docs to the upstream version `remote_hash`.
+
+    Uses the per-doc manifest published in the upstream version.yml (stored
+    with the last fetch): only docs whose hash differs from the local copy
+    are downloaded, over `client`'s keep-alive connection, and each must
+    match its published hash. Nothing is written unless every download
+    verified; the docs are then renamed into place under the full-check lock
+    and version.yml records the new hash (`source: upstream`).
+
+    Returns the docs written or removed, or None if the update could not be
+    applied (no manifest, a failed or mismatched download, or `deadline` -
+    a `time.monotonic()` value - reached).
+    """
+    import re
+    import time
+    from urllib.parse import quote
+    from . import remote
+
+    manifest = read_remote_manifest(project_root)
+    if not manifest or calculate_manifest_hash(manifest) != remote_hash:
+        return None
+    if not all(re.fullmatch(_DOC_NAME_PATTERN, name) for name in manifest):
+        return None
+
+    skill_dir = get_skill_dir(project_root)
+    recorded = read_version_yml(project_root)["docs"]
+    names = sorted(set(manifest) | set(recorded) | set(embedded_doc_names()))
+    local_docs = scan_local_docs(skill_dir, recorded, names)
+    needed = [n for n in sorted(manifest) if not local_docs.get(n) or local_docs[n]["sha256"] != manifest[n]]
+    removed = [n for n in names if local_docs.get(n) and n not in manifest]
+
+    base_url = REMOTE_VERSION_URL.rsplit("/", 1)[0] + "/"
+    fetched = {}
+    for name in needed:
+        if time.monotonic() + client.timeout > deadline:
+            return None
+        try:
+            body = client.get(base_url + quote(name), max_bytes=REMOTE_DOC_MAX_BYTES).body
+        except remote.RemoteError:
+            return None
+        if _import_hashlib().sha256(body).hexdigest() != manifest[name]:
+            return None
+        try:
+            fetched[name] = body.decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+
+    # The session that started this worker holds the lock until it exits
+    lock_path = project_root / CHECK_LOCK_FILE
+    while not _try_lock(lock_path, CHECK_LOCK_STALE_AFTER):
+        if time.monotonic() > deadline:
+            return None
+        time.sleep(0.05)
+    try:
+        for name, content in fetched.items():
+            _write_atomic(skill_dir / name, content)
+        for name in removed:
+            try:
+                (skill_dir / name).unlink()
+            except OSError:
+                pass
+        entries = record_written_docs(skill_dir, {n: local_docs.get(n) for n in manifest}, list(fetched), manifest)
+        write_version_yml(project_root, remote_hash, entries)
+    finally:
+        _release_lock(lock_path)
+    return needed + removed
+
+
+def start_remote_worker(project_root: Path) -> bool:
+    """
+    Start a detached background process that runs the remote check.
+
+    Returns False if a worker is already in flight (its lock is held and not
+    older than REMOTE_WORKER_TIMEOUT) or the process could not be started.
+    The lock is taken here, before spawning, so concurrent sessions cannot
+    start duplicate workers; the worker releases it when done.
+    """
+    import subprocess
+    lock_path = remote_state_path(project_root, REMOTE_WORKER_LOCK_NAME)
+    if not _try_lock(lock_path, REMOTE_WORKER_TIMEOUT):
+        return False
+
+    package_parent = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = (
+        f"import sys; sys.path.insert(0, {package_parent!r}); "
+        "from myskillium_spore.hook import remote_worker; remote_worker()"
+    )
+    env = dict(os.environ, CLAUDE_PROJECT_DIR=str(project_root))
+    kwargs = {}
+    if os.name == "nt":
+        kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs["start_new_session"] = True
+    try:
+        subprocess.Popen(
+            [sys.executable, "-S", "-E", "-c", code],
+            env=env,
+            cwd=str(project_root),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            **kwargs,
+        )
+    except OSError:
+        _release_lock(lock_path)
+        return False
+    return True
+
+
+def remote_worker() -> None:
+    """
+    Background worker entry point: fetch the remote hash, record it, and
+    delta-update the docs if upstream has moved on.
+
+    Network timeouts and a deadline keep the worker well inside
+    REMOTE_WORKER_TIMEOUT, and the lock is always released, so workers
+    cannot pile up. If another worker (e.g. for another project sharing the
+    cache) wrote a fresh result in the meantime, the version.yml request is
+    skipped. After a delta update the check-state marker is made due, so
+    the next session reports the updated docs.
+    """
+    import time
+    from . import remote
+
+    project_root = get_project_root()
+    deadline = time.monotonic() + REMOTE_WORKER_TIMEOUT - 5
+    try:
+        with remote.RemoteClient(timeout=REMOTE_WORKER_TIMEOUT / 6) as client:
+            result = read_remote_result(project_root)
+            if result is None:
+                write_remote_result(project_root, fetch_remote_hash(project_root, client))
+                result = read_remote_result(project_root)
+            if result and delta_update_due(project_root, result, deployed_hash(project_root)):
+                updated = apply_remote_docs(project_root, client, result["hash"], deadline)
+                write_delta_state(project_root, result, updated)
+                if updated is not None:
+                    write_check_state(project_root, time.time())
+    finally:
+        _release_lock(remote_state_path(project_root, REMOTE_WORKER_LOCK_NAME))
+
+
+class BudgetExceeded(BaseException):
+    """
+    Raised when the hook's latency budget is spent, with the step that was
+    running. A BaseException (like KeyboardInterrupt), as the watchdog can
+    raise it anywhere and it must not be swallowed by `except Exception`.
+    """
+
+    def __init__(self, step: str):
+        super().__init__(step)
+        self.step = step
+
+
+class Budget:
+    """
+    Deadline for one hook run, and the timings of its steps.
+
+    `enter(step)` marks the start of each step and raises BudgetExceeded
+    (naming the step that used up the time) if nothing is left. `arm()`
+    installs a watchdog so that a step that stalls part-way is interrupted
+    too: SIGALRM where available, else a timer thread that records the
+    overrun and exits the process. `cap(ms)` swaps the budget for a hard
+    cap, overrunning which backs the check off instead of deferring it.
+
+    Each step's duration is kept in `steps` and the outcome of the run in
+    `path` (for tracing, see write_trace).
+    """
+
+    def __init__(self, started: float, budget_ms: float):
+        self.started = started
+        self.budget_ms = budget_ms
+        self.deadline = started + budget_ms / 1000 if budget_ms > 0 else None
+        self.step = "import"
+        self.steps = {}
+        self.path = "unknown"
+        self.project_root = None
+        self.lock_path = None
+        self.capped = False
+        self._step_started = started
+        self._timer = None
+
+    def elapsed_ms(self) -> float:
+        import time
+        return (time.monotonic() - self.started) * 1000
+
+    def remaining(self) -> float:
+        """Seconds left (infinite if the budget is disabled)."""
+        import time
+        return float("inf") if self.deadline is None else self.deadline - time.monotonic()
+
+    def enter(self, step: str) -> None:
+        self.finish_step()
+        if self.remaining() <= 0:
+            raise BudgetExceeded(self.step)
+        self.step = step
+
+    def finish_step(self) -> None:
+        """Add the time since the current step started to its duration."""
+        import time
+        now = time.monotonic()
+        self.steps[self.step] = self.steps.get(self.step, 0.0) + (now - self._step_started) * 1000
+        self._step_started = now
+
+    def arm(self) -> None:
+        remaining = self.remaining()
+        if remaining == float("inf"):
+            return
+        if remaining <= 0:
+            raise BudgetExceeded(self.step)
+        import signal
+        if hasattr(signal, "setitimer"):
+            def on_alarm(signum, frame):
+                raise BudgetExceeded(self.step)
+            signal.signal(signal.SIGALRM, on_alarm)
+            signal.setitimer(signal.ITIMER_REAL, remaining)
+        else:
+            import threading
+
+            def on_timeout():
+                if self.project_root is not None:
+                    defer_check(self.project_root, self)
+                if self.lock_path is not None:
+                    _release_lock(self.lock_path)
+                os._exit(0)
+            self._timer = threading.Timer(remaining, on_timeout)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def cap(self, cap_ms: float) -> None:
+        """Replace the budget with the (larger) hard cap `cap_ms`, also counted from the start."""
+        self.disarm()
+        self.budget_ms = cap_ms
+        self.deadline = self.started + cap_ms / 1000
+        self.capped = True
+
+    def disarm(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        elif self.deadline is not None:
+            import signal
+            if hasattr(signal, "setitimer"):
+                signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def defer_check(project_root: Path, budget: Budget) -> None:
+    """
+    Record a budget overrun and reschedule the check BUDGET_DEFER_DELAY
+    seconds ahead (keeping the failure count, counting the deferral). An
+    overrun of the hard cap is rescheduled as a failed check instead: the
+    retry backoff grows with each one and the deferral count starts over.
+
+    The last BUDGET_LOG_LINES overruns are kept in BUDGET_LOG_FILE as
+    `<UTC time> <step> <elapsed>ms budget <budget>ms` lines.
+    """
+    import time
+    line = (
+        f"{datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')} {budget.step} "
+        f"{budget.elapsed_ms():.1f}ms budget {budget.budget_ms:g}ms\n"
+    )
+    log_path = project_root / BUDGET_LOG_FILE
+    try:
+        lines = log_path.read_text(encoding="utf-8").splitlines(keepends=True)
+    except (OSError, UnicodeDecodeError):
+        lines = []
+    try:
+        _write_atomic(log_path, "".join((lines + [line])[-BUDGET_LOG_LINES:]))
+    except OSError:
+        pass
+    failures, deferrals = _read_check_counts(project_root)
+    if budget.capped:
+        schedule_next_check(project_root, "retry", failures + 1)
+    else:
+        write_check_state(project_root, time.time() + BUDGET_DEFER_DELAY, failures, deferrals + 1)
+
+
+def write_trace(project_root: Path, budget: Budget) -> None:
+    """
+    Append this run's trace record if tracing is enabled (see
+    `myskillium_spore.TRACE_ENV`): outcome path, total and per-step
+    milliseconds, and bytes read by the process.
+    """
+    import json
+    import time
+    path = trace_path(str(project_root))
+    if path is None:
+        return
+    budget.finish_step()
+    record = {
+        "ts": round(time.time(), 3),
+        "project": str(project_root),
+        "path": budget.path,
+        "total_ms": round(budget.elapsed_ms(), 3),
+        "steps": {step: round(ms, 3) for step, ms in budget.steps.items()},
+        "bytes_read": read_bytes(),
+    }
+    append_trace(path, json.dumps(record, separators=(", ", ": ")) + "\n")
+
+
+def main():
+    """
+    Main entry point for the bootstrap check hook.
+
+    Optimized workflow (fastest checks first):
+    1. Fast path → silent exit if the next check is not due (most common case)
+    2. Source template check → silent exit if source (never syncs)
+    3. Hash comparison → sync docs if mismatch
+    4. Remote update check → notify if available (fetched by a detached
+       background worker; the notice appears in a later session)
+
+    The due check comes first because:
+    - It's just a stat (~0.1ms) vs reading the git config
+    - Dependents are the common case (many repos vs one source)
+    - If the check-state marker is not yet due, files must exist and it's
+      not source
+
+    The launcher only calls this when `myskillium_spore.check_due()` says
+    the marker is missing or due.
+
+    The whole run is bounded by BUDGET_MS: each step starts only if budget
+    is left and a watchdog interrupts one that overruns. The check is then
+    deferred (see defer_check) - the network is never waited on anyway, as
+    the remote check runs in a background worker. After
+    BUDGET_MAX_DEFERRALS deferrals in a row it runs under BUDGET_CAP_MS.
+    """
+    project_root = get_project_root()
+    budget = Budget(STARTED_AT, BUDGET_MS)
+    budget.project_root = project_root
+
+    try:
+        _run(project_root, budget)
+    finally:
+        write_trace(project_root, budget)
+
+
+def _run(project_root: Path, budget: Budget) -> None:
+    """main() under the latency budget."""
+    if read_check_deferrals(project_root) >= BUDGET_MAX_DEFERRALS:
+        # The budget keeps cutting the check off (a slow machine or file
+        # system): give it enough time to finish this once, but not
+        # forever - a step that hangs must not hang the session with it
+        budget.cap(BUDGET_CAP_MS)
+    try:
+        # ==== Single flight ====
+        # Sessions opened together (parallel agents, several terminals)
+        # all find the marker due at once. Exactly one takes the lock
+        # and runs the full check; the others exit as if on the fast path.
+        # The lock is taken before the watchdog is armed, so an overrun
+        # can never interrupt it between creating and releasing the file.
+        budget.enter("lock")
+        lock_path = project_root / CHECK_LOCK_FILE
+        budget.path = "busy"
+        if not _try_lock(lock_path, CHECK_LOCK_STALE_AFTER):
+            sys.exit(0)
+        budget.lock_path = lock_path
+        try:
+            budget.arm()
+            try:
+                # Another instance may have finished the check between our
+                # stat and taking the lock
+                if check_due(str(project_root)):
+                    _full_check(project_root, budget)
+            finally:
+                # Disarm first, so the watchdog cannot fire after the lock
+                # is released
+                budget.disarm()
+        finally:
+            _release_lock(lock_path)
+            budget.lock_path = None
+    except BudgetExceeded:
+        budget.path = "capped" if budget.capped else "deferred"
+        defer_check(project_root, budget)
+        sys.exit(0)
+
+
+def _full_check(project_root: Path, budget: Budget) -> None:
+    """Steps 1-4 of main(), run while holding the single-flight lock."""
+    skill_dir = get_skill_dir(project_root)
+
+    # ==== STEP 1: Fast Path (most common case for dependents) ====
+    # The hot path (marker not yet due) never reaches this module. Here we
+    # only cover a missing marker with a recent version.yml (e.g. written
+    # by an older spore): recreate the marker and exit.
+    if not (project_root / CHECK_STATE_FILE).exists():
+        remaining = CHECK_INTERVAL - hours_since_last_check(project_root) * 3600
+        if remaining > 0:
+            budget.path = "recent"
+            write_check_state(project_root, datetime.now(timezone.utc).timestamp() + remaining)
+            sys.exit(0)
+
+    # ==== STEP 2: Source Template Detection ====
+    budget.enter("source")
+    # Only reached once the check is due or on first run. Source template
+    # never syncs or checks for updates (and never writes version.yml); it
+    # only pushes the check-state marker ahead so that it also gets the
+    # stat-only fast path.
+    if is_source_template(project_root):
+        budget.path = "source"
+        schedule_next_check(project_root, "check")
+        sys.exit(0)
+
+    # ==== STEP 3: Hash Comparison (sync if any difference) ====
+    budget.enter("scan")
+    # Only docs whose stat data changed since version.yml are rehashed,
+    # and only docs that differ from the embedded version are rewritten.
+    # Docs from a delta update (`source: upstream`) are kept as long as
+    # they still match the hash version.yml recorded for them; a recorded
+    # embedded hash is not trusted, as it may be an older spore's payload.
+    embedded_hash = calculate_embedded_hash()
+    recorded = read_version_yml(project_root)
+    local_docs = scan_local_docs(skill_dir, recorded["docs"], list(recorded["docs"]) or None)
+    local_hash = calculate_local_hash(local_docs)
+    accepted = {embedded_hash}
+    if recorded["source"] == "upstream" and recorded["hash"]:
+        accepted.add(recorded["hash"])
+
+    if local_hash not in accepted:
+        budget.enter("sync")
+        if set(local_docs) != set(embedded_doc_names()):
+            # Drop docs that only upstream had, then compare the embedded set
+            for name in set(local_docs) - set(embedded_doc_names()):
+                try:
+                    (skill_dir / name).unlink()
+                except OSError:
+                    pass
+            local_docs = scan_local_docs(skill_dir, recorded["docs"])
+        updated = changed_docs(local_docs)
+        write_embedded_docs(skill_dir, updated)
+        local_docs = record_written_docs(skill_dir, local_docs, updated)
+        write_version_yml(project_root, embedded_hash, local_docs)
+        schedule_next_check(project_root, "check", read_check_failures(project_root))
+        budget.path = "sync"
+
+        print("## Bootstrap Skill Synced")
+        print()
+        print(f"Bootstrap docs written to `{BOOTSTRAP_SKILL_DIR}/`:")
+        for name in updated:
+            print(f"- `{name}`")
+        print()
+        print("This skill contains 7 planning documents for setting up Myskillium.")
+        print("Read `03-bootstrap-plan.md` to begin the bootstrap process.")
+        sys.exit(0)
+
+    # ==== STEP 4: Remote Update Check (in the background) ====
+    # The network is never touched here. Without a fresh result (or with
+    # one whose delta update has not been attempted yet), start a detached
+    # worker (unless one is in flight) and exit; the marker is set to
+    # re-check once the worker has had time to finish.
+    budget.enter("remote")
+    failures = read_check_failures(project_root)
+    result = read_remote_result(project_root)
+    if result is None or delta_update_due(project_root, result, local_hash):
+        import time
+        budget.path = "remote-spawn"
+        start_remote_worker(project_root)
+        write_check_state(project_root, time.time() + REMOTE_WORKER_TIMEOUT, failures)
+        sys.exit(0)
+
+    remote_hash = result["hash"]
+    if result["status"] == "error":
+        # Network error - back off exponentially (with jitter) so outages
+        # are not made worse by every machine retrying at once
+        budget.path = "remote-error"
+        write_version_yml(project_root, local_hash, local_docs)
+        schedule_next_check(project_root, "retry", failures + 1)
+        sys.exit(0)
+
+    if remote_hash != local_hash:
+        # Update available but the delta update failed (or upstream
+        # publishes no per-doc hashes) - don't update version.yml; remind
+        # again on the short reminder cadence, from the same cached result
+        budget.path = "remote-update"
+        schedule_next_check(project_root, "reminder")
+        print("## Myskillium Update Available")
+        print()
+        print("A new version of Myskillium is available upstream.")
+        print()
+        print("To update, run:")
+        print("```")
+        print("python sync-myskillium.py")
+        print("```")
+        print()
+        print("This will fetch the latest skills, commands, and docs from Myskillium.")
+        print("Without git, run `python -m myskillium_spore.sync` instead.")
+        sys.exit(0)
+
+    # ==== Everything up to date ====
+    budget.path = "remote-current"
+    delta = read_delta_state(project_root)
+    if delta and delta["status"] == "applied" and delta["hash"] == local_hash:
+        (project_root / DELTA_STATE_FILE).unlink(missing_ok=True)
+        budget.path = "remote-delta"
+        print("## Bootstrap Skill Updated")
+        print()
+        print(f"Bootstrap docs updated from upstream in `{BOOTSTRAP_SKILL_DIR}/`:")
+        for name in delta["docs"]:
+            print(f"- `{name}`" + ("" if (skill_dir / name).exists() else " (removed)"))
+    write_version_yml(project_root, local_hash, local_docs)
+    schedule_next_check(project_root, "check")
+    sys.exit(0)
+
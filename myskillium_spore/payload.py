@@ -0,0 +1,117 @@
+"""
+Embedded bootstrap docs for the Myskillium spore.
+
+Generated by build-spore.py - do not edit manually.
+"""
+
+# Combined SHA-256 of all docs (see calculate_local_hash in hook.py)
+EMBEDDED_HASH = 'c51e2649f11559a008b90ed4341670a91d1441b9507dfeddc2b90d9e44250c6a'
+
+# Per-doc SHA-256 of the UTF-8 content, sorted by filename
+EMBEDDED_MANIFEST = {
+    '01-prd.md': '5df7592be546a7b99f3156de03f337deabbc11f1cee64dd1a86c3e3eacc722de',
+    '02-architecture.md': '1924c0ecf11921b82f03daf360046eb962df6edec466d9a025c6ea6a19b31257',
+    '03-bootstrap-plan.md': 'dbe534dd05cfd02f5c4a81c20a614db0f5029ff4542500ac24a7b93aa33a2b42',
+    '04-sync-script-spec.md': '3d82fcb154b9aca70834f82f7ed0283e680565b0c49335f325755e2c3b62d91b',
+    '05-scrape-plan.md': '8a862be94126b86c00a37438b5d454b3730132144244495c25457901e627dd2d',
+    '06-migration-checklist.md': '891d2bf06165816f4603d6689b17f260477855d0fa1684ae2a46588970a87e54',
+    '07-testing-plan.md': 'bf63c3dee2abdfc3a387c65bc27eea83cd8732ba05e89a5275410dd3cc2de76a',
+}
+
+# zlib-compressed JSON {filename: content}, base64-encoded
+PAYLOAD = """
+eNq1W+tu20iWfpWCA0wkjSnl1ukdYXsWju0kxvgGy0m2txVENFmSqkORHBZpW9NuYDE/9gEWjf21
+TzKP00+y51JVLF6UBLvYxky3Rdbl1Ll+59ThL3tPngZ5EY838d5U7D0SZ1v9WSWJqjbi8upIDC6L
+LK6iUlzJv1aqkBuZllocZVGFfw3n6Tx99Ei8V1plKf44EG9U+ba6EaXc5ElYSlHIPNOqzIqtWGaF
+0OuwUOlKHCZhFUtxmMG/aEe9L6JsswnTGP6Cf4twRXuFUZFpLTZVUqo8kSIvsp9lVOqx+JAVn7XI
+UnF4ekIz7uTNvkgzoaubDVCdSM0/t5tEpZ/12FALR7pJ5EbMSqAPj4HPZ0jhdSHlY13PF3+0k0VY
+RGtVwsZVIcUyVImMp/M0EDOzuFgW4QqeIj0fVBpndxpf+8cE8kQUpo9LYESSZHeOMBz4GuZqsZKl
+yG5lcVeospSpiCtilt6mEQ66zjJkErDhXpSZ2IQqLeH/5lxvsjDR+PfTsZgBmy1jJ5avHV4aWZGI
+5ukzZime4P2MSfbJRy4PzNEmZ2E0OVVpdQ8q8Lye1zruPH0xFsexKoVKPc3apwPhCWKZyzRGOc/T
+74BqhWcTMs2q1VqU67AEuW6zVCLfRAUjC12ipFVpznyepYE7dwBaGiZBqTaSdxjAsasw4R8Kzx/J
+vAxB+kMc/UrFoNJRCbprBw1gs+AuBF0tso1vDA1iafZlGH0GHQUppPCfQsRKl4W6qXA5MUjzzSRX
++VAEYlmR0kRZqhWcICyNrQD57zRMRNVT0kruAMiErW5lkuWy2Bcn4i5MS9w/KiQaVChSeWfNoEun
+tTudwVTUpzBJOoqgNhsZKxiWbEnuuzctqhReEW90VKicHuKy5VoK3EiXndVbNJGG0A5WYZtbSFQQ
+XqOpJ2TU6/BWeqwXeQXnqfIYtyb9opXRtirtrWvWg+XvUDdVRzfFYEkmh1SjscV0WrAE69RmFWgL
+WMuZBLFGRsHOPdZrWVb5VPyz+E5swBSIHnQIwCrkIskZXz9/AkNB+jG9/zdZ1C4J6QINp33xpXNp
+xs7EnSrXWVWKIysbcQb0GwoPwRWAviJXgPaTNEoqfhf0uFcx0OjighJ8HBgg/S3vZUT6ig9Au5Ao
+eCnLaEwqfljBuI3QSajXzjuLQaSC0T7IRKtVGtBK3py3MkEyWVnoxMbLoByWifGLRyGYYaiBuGgt
+N6FPHK3yr/RbvHl3Ys56AUzIlmIWARPE4PbpkM95UAGBIUrv8irABWNjx2x0U1AfYCR4VPHk6Us2
+26RaAdc3YfFZlmAqkWxYLg45O7wEiRU4K8xB2mG0nqd7+2LvybPAjwN9QfPAe+/EBNZ/CY48QqeL
+D0ejD+jbtlkF+0j0THf2N5jWeDQCvwaq4bwTGNoWXF8jmrUinQ1uRzQHeTcri8qRsVgs5mlN5mSe
+/v7bf//+27/D/8Q4ImWZiJ5/HjU0KaoVbsDEIRWlpUnGQ1z37zCvXt04h/pF67WT+1eGOF3tjPvN
+jbMqPOmSYbV35y6g1OxgA1CKFET7hYEUphA57BprSfJtpDHMnY3NZOeZRuN8W79zy4L1uCmiyQSy
+p7H+a+ILsWtuYCRGXE4NVuBrqptJdztnuTv2HI1B/v5Sq0r1ahMTU9s2mleiIhMR27y5Z7b5DLCv
+Cg+Njsv7skvzeDz2KcLzBhun/2PwZx5Fr9C/eTHuSzPzrT/zcgv+Od01d1zPC8CbIEj25r43T8oC
+kATAPH/m4enBu6NjUJmv2qRKNRk6rKRxBcuAq+ODo7NjUjoyfvIOf5Fb8BDLpSwkyN9Eagd9cdBD
+/VM8+I7tAd4F9T/+3wG+EwvnRhFgARxgr7IQv//HfzoYjX8vxu7Vg/+DPUqyFb3LGe3k5SAKbM1a
+7vmD/6O51swBevD8Dksw7oV51xYzYX7iIR2ae2jwtvN9QXYHAEavVR6AR1FLREAPBrpOBcTpAnQC
+UTvshTuge8esB0LTg4UWuAkG8qTHN4NxZlURyWFT6keO7EEZFhAmwHitIf5dfOUfGNIc/SWtbo42
++vT/8r//+oe/F/4DggUo7ELSaNcp/LFG6LWXGnXH5oWkiK7BWcU3gqHfjnUNuOy3XhpbG9QlY8Fg
+lstILVVk8rjBOeoByZm87Dy9XgMBIg/LNcDVQjqCYj/Ho4zSWQR5eSR3ITzARKQ3xiVZFCaTEY66
+An0LtKWFqKdg0RgPuLWEHfWYJo5/1lmKc0/xl7AvzfmcadxqOg0d5Q5Adbgl0AmY23MSU5PDjEZ2
+HkCZgZeu6OEUnJeKPov5HuQ+kESAcdiUZb6HyJfRImUloxFuiUvIe3AGyCVvnSvITBZ57X+b6kwC
+epWVa7BBDfkuWiOmLDrcMA+FtvhobMDd8+Amy0p4HOY2rnfg3Ss7AnBkaLO4C5D1rZJ3+PNKYpJD
+Ai1lDrJelqAIkB9CikBxjjI58imlzzrOJiyKm8Fc8RR4xSkf+YuZRdRwrkolMR8H32xkBDBXaXQd
+4LYXT14ExBB2Y6QPcJbFkNWrh1cgfRPIBlQhwOOXy6zYDHtn6DXOoKA5yHJOn4c+5c+m4kytCiT9
+MEtLU2I5vsdIV/ookuJPR7j2GN/hCcLcIbLFsMGf51NxnGJwcFqKby+sCk3FzOiy+LN4I8Fng3r/
+WRyuJanfdbdANd/zl38xFe/DRMVm3Wv088RyFJQl8fsAM2DYpEEjqVOvEFihPHkK6zn8soCvUGht
+XlDSXBZZQr61tvl3K2Nm/yXIui1Pp18VJFVzsK4z/AYtsWWgjrYQ+X6tkB89Eq+r1BRanI94TWfg
+YDcaoWPASo93GIqeA4idWC3bR8NBV2FiO8hraLzEIaKBWqtgLXLnvsvjJGTE6IE50365aE9yKUP/
+NPe6M9GC+h3bmbedaeTva/zeO7k9xq3RDYLN+Z33CyrLjEaXJhBZTanDB0WaHmZ6cQl8O8Y5W7KU
+w/ZYF5vMyDKronVnVG9E6ln7BRL8jtXbRGRUnA/42hRyxOztAWrKoid6L6jIOBphlCzAD4HTXNEJ
+xSl4IM7B70Lw2XEs4wmbEfw35YEApF/ybHDlMVWbcCom9iX4EwhHUwFcxtliLP7wB/phiAo24jG7
+akfUY+ttuIjZYx/ndckxUkinGHCiQgqElcWfKyAbttkXUb4vio2xhzMIQBuQens2Wy9OpCpqWMQi
+UTdFCMlYlmIlkBTisGHTzXm2LIU4hkorCeUtJJeTGIwzQ2cPc2CLcCltAdEVnLE0q40UXofajGQD
+FxHaP5U1lljjA2hATtkWUdKlWlV19RQwGAd/wM4/zv5ycnp68u7s09Xx5YX4AcSxLstcTycmbRiD
+HCZnAMJvqiSr9KR2MmgYKAlvjVdXB+eHb2kVjOX4tgZ8B8kqA3VbQ6y91LKKswhg/LBFUCyX5LMH
+QzYe8lufwG/Bolxk+GSfsCcb0Aqc3JFb5B9A2yfiyqB1xH23Itbh8nL9w9N9AZIEVf2hcxJv7Tey
+tIbDjwCbfbLY9gfar5C3n/Kw0HJQbzHfewvZ5HzPpBxZEnuT4DzxJ/QVg/lej9HBLMyr5nspnIN1
+3iSx6LUHWOAEBBAlFQ7WZgfM7z5hUWiwnO/9Ygn5ddJ02fM9JK397BuXsO67uUj99FspMaisSYp9
+6C9CLOpfpOXVm4t1Xn6NsrarN8t1H3uKcXQhzi+uac2pfRaIjsfvvmIHXz+n0o9DhfAA/SToaKRi
+qb0Nm16cn5Kb/6Iq7fsK6612mMgwrXL+CcgDgoZnXJY33gQOAfwrRw+OTGSaYkalv3ha/tP0+4+/
+ojP7xdueHjpp8CLfEAaidYZ16W40GPpu5rgowGjeOg9bhwRYDsPO8T2sR8azlkkODhOyAK3DlTQx
+4FyWdPEhcaHmhEKW4PF1tVohdEXmPzdru0qw4x3hMk5C8M6NHP0lJjOarL9ndXmPSNhHs3hxeEEK
+Acj+NdXlrcOEjBZcXU8x4qcgiIttAMHjI/6t+G4jAO2i30YEHw3LCG+3swUDtekZZWtIJWcgh60M
+pFEBa+FvO+c2TCpKNqJdkyHFBBWpQ8tjTTd1fp7J2QUhXsq3DVPcEkNXD3KPGqX6Vk2sp8zNAtxZ
+Smeo65VUACK2cPDOurfFu31zv1pet6i3f+evVMEb9e6vVr39ldvOs1MnbhW9xY7Ct090B0r7Zded
+pW+cii99K3d6KE7SW/iPgzugJO7+0mTSpjhLJZ0HcVkVkLVSiZZf/4tfoH3oK9NSNbO+bhGm0mvu
+rzFZIz5TkcndX2J59EephTfZXcS4FSwnhP/Km2WvZcSDuZC0TzDph/GJKrGQ5835KYNMu9Af4dmV
+REukxJajCBZsXx3ZWioxke8l27wyL77KrS/xq3MrhGc4EfiDqPdo7rsX4tHucdjmTet+yHGUn/9v
+OTKzlYIGQ8y0bh5KK+2o3rtBVEA4wfqzWoLE1wpSd6xjrrCworDVgnca7hjn/FmdXw4gaN/KoaX6
+g7WnXXR3U9heyrvDiPaLArwAlu6AEKexdMl90ryatpy2dOE9VZOi6zX2qJQQI8UCTXpRx0sx4Nst
+rrV5N1hBz51VIGZVjjgENcnVdbHQZMuvdE2MwKxJAGEB/1JjWYQuzIxGNr3WRTThsiJWbwbmDmZS
+tzcl2UpFLhv/0g0H5+Rm5JF3g7JSxFNFRVgNSAvp49ptV+KQLemavFB9wgfAvoG9pdeukYCG+Jfp
+pOsEOoDVWYHdTDfYGVFfgc8tkmnWyusNuWbBtf9Bu9zh2GDL0XpSO0uYOIbHJbIRtmdARNGfYwsp
+8QuuWPP1vNv1IN3W9+NOUajfh95TGoR1RQAZ2KsUccGU7vUgszKKwMLH02NtUjslcHHDVTGw3YeP
+qACfha7CRpUgRmVcNIMjYCr7N6q9vTFmjGX+jtxsYQAoxbFnICln97xVA/fUiMfw5D2MXNLU41Sj
+KCHFvymyzxJlae8iTVUAtR9HYnW/07WUNrqK+AIm02VQc8clAvP0JG3eTAC/TNKBHTfrsIgxdY8h
+Narh316DoGemIw09GeXU6KKN+nCS4bUKktzuS+6HMxt5sAQPQZhRLQEVylhayR7JRIHmk+/inpaf
+xEdz64io2wqYul8c1KxBqJ1R88AaiqaGS1IBN7w5Wsa1qvTLj0fbxKhmjhiADJucw+OZFJ7w+Mtg
+Y0kKIiy6J6Ce9Z1KLTL7zl2pyVqgNUfadWE2wti/MuKBdQeMO4cApQIGK71GtvOwmV9Tt/2WGE+w
+pO4NcywPqR1MYQqAfHW8sKieAVsP5Quvx2VhLuXo7jJujahbXHYOcx0u/SMuMHTZhq+CAiewCE/F
+40SonfaZ8zX12hQ9e/S7lv3Qzj13ZkwXar7pWHjLhtvHlA6yWrRP2weoOoNaCGrRyxDnQb6JJec9
+3gk9XK0KdI1r5W5UqOeM1qlaLVMMi1Rj/46iefe3Zl4il6W4kWuV1qOt4mKOb5sEO87IogiHrHqI
+7MVFLdp8iNR6ZdcWAMFWK4jgToU8R+f42mToYlxnuYsWU6lNqdeYvAsSI0Fayk/4FjWbaB1WNI05
+vIpdluPR1cN857DxEJSo5PYq0IDCPuracLClrW0MuOA+gNovLxxkXGDlXJtKPdaA7RDCh8AtbZll
+u/HbtLgeooX1b+6Vaw7qvDrPdgZEvIbH/mlTmVeRRSv37kOATpXe7IfYHcw0KyQKjcd4bOm7q4GY
+BHNAYH+rB/bc2QIQx9DZiAP8TQLf3TboMJUsujRtNFC7FgQz8MD1TANsCuNW+7A/yuutt+GhbRqa
+7kAGYF6YCLEO/nhwdjrsCUVkZ9QB3L4V91dttAgPwNCAGxyZ6I5UO3k00VHNiNqVsSY4o4X5eaa4
+L9vHWp1giMgcu1cGd2twlCTTmL8IMVHY5QjuVn9jMUdrbUILnYt0hgnX/HBXt4W9oOdLcQ8iMBsh
+TzBtYHirV/fGo/e9VdzWPnadLqAUx+mtKrLU3VwTxubGmMPTE7qtsp9GULHTb8QDM5Cp9gC29+6D
+vKHJ7KTGoZog9iTR1XozNDjbCJZ3I+js9f02LvUMvnZX9/6Um/qqkLnhn/MQ3J+7mr9+Oq0ti0zE
+6ArmcJBsTDGXAU68yVo4v9mt84W+HjqYMT4siXK7+4uxufKnO4Rky1se34MHBi2hXQOyMa9HkFGK
+5zT5fU9poDPyvNl2jymXbbvvd0BurmHTs6kFeacZJ2YtBl2AZJxfUelOVeHMogwLyNbQdHDH0FXi
+r6zDxe8uCOMN5Hg13gcd/mxz3lbhbtjLOkMsOp1Y6Qjza3alDvO5XLPtvoBXVNq3STbV++sihWHI
+82kN8Q5uQ5WEN7a/vcGX620uxWKy6LhRYMNpln0mPB3xtwbuAq7vRC3QuMD+YRkW3A7nI8HGG0cj
+42vp8BId0Z3mxbTRl0N37cOe0xzaz3CspAfYAt8II9yYQg1q40lP002/uHhfuu/VLef72nyq0oE7
+pgTmGl93a7PJlxrSdWf/rnV2c+P/fz79l9vzuizA5jxw1dcv+j6GcdS+NNReuqZO04bJfNpN9Y6Y
+/8wNaMJIjEhYMvLdV6uzZbPFkbY69oKP3egG71NjuzAYMto3hXpWYn+9zltOZhqJmuPJ94Yn70zz
+6nt7sdrhxXmGzTIVREaw/B1tMsCRs/CzJPdEN5et0stz76B+S3X/cXv1cR3y9djs7YE7xD9NCVhf
+IfCdecC3c4ZFFNNlCpO6yFVO9TKsfQVFp9LKArTK6BC2CAK8O10QNNNqA/6r6Pek+DXOhnqGrN3w
+d04CsS86V1CkraZ1kH5QkBSTKlfavv7TFCEAVXXA0d/gjce251iXFcRsq6Rg5l50pdiier6wbESM
+VsXsS2GBMkfzDVxYyPo7uO4nPZ4LxVk1bngydSj0a0frNPf5dv0t7gLO2QVDtRvrk1kjhLnYD0Jq
+f03XcrAONrp+xlUh+cLbFecPqK8XK4ncHdaERlOXsfjYKjLYyhi2QWVm4IuJ88I276+HuVEvp87X
+seh4jOsmt995pNldKk5Bp0tzjQfk2TyR04CZ+SbWfCJLbjzkr+kU94CiKhtT0rbz84/wxwyQ/ksc
+cIrfIRg6NuFWaNfFBaD+1/8Bd5RAdg==
+"""
@@ -0,0 +1,211 @@
+"""
+Conditional HTTP client for the spore's remote update checks.
+
+Uses `http.client` directly (rather than urllib) so that:
+
+- one keep-alive connection is reused for every resource fetched from the
+  same host in a run
+- response validators (ETag, Last-Modified) can be replayed as
+  If-None-Match / If-Modified-Since, so an unchanged resource costs a
+  bodyless 304
+- bodies are read with a hard byte cap, or streamed to the caller
+  (upstream archives, see `sync`)
+
+Honours `https_proxy` / `http_proxy` / `no_proxy` like urllib does (via a
+CONNECT tunnel for https).
+"""
+
+import http.client
+import os
+from urllib.parse import urljoin, urlsplit
+
+USER_AGENT = "Myskillium-Bootstrap/1.0"
+
+# Maximum redirects followed per request
+MAX_REDIRECTS = 3
+
+
+class RemoteError(Exception):
+    """Any failure fetching a remote resource (network, HTTP status, size cap)."""
+
+
+class Response:
+    """A fetched resource: status, lower-cased headers and (capped) body."""
+
+    def __init__(self, status: int, headers: dict[str, str], body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+
+def _proxy_for(scheme: str, host: str) -> str | None:
+    """Return the proxy URL to use for scheme/host, honouring no_proxy."""
+    proxy = os.environ.get(f"{scheme}_proxy") or os.environ.get(f"{scheme.upper()}_PROXY")
+    if not proxy:
+        return None
+    no_proxy = os.environ.get("no_proxy") or os.environ.get("NO_PROXY") or ""
+    for entry in no_proxy.replace(" ", "").split(","):
+        if entry == "*" or (entry and (host == entry.lstrip(".") or host.endswith("." + entry.lstrip(".")))):
+            return None
+    return proxy
+
+
+class RemoteClient:
+    """
+    Keep-alive HTTP(S) client.
+
+    Reuses one connection per (scheme, host, port) for the lifetime of the
+    client; use it as a context manager so connections are closed.
+    """
+
+    def __init__(self, timeout: float = 5.0):
+        self.timeout = timeout
+        self._connections = {}
+        self.requests = 0
+        self.bytes_read = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        for conn in self._connections.values():
+            conn.close()
+        self._connections.clear()
+
+    def _connection(self, scheme: str, host: str, port: int | None) -> http.client.HTTPConnection:
+        key = (scheme, host, port)
+        conn = self._connections.get(key)
+        if conn is None:
+            proxy = _proxy_for(scheme, host)
+            cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            if proxy:
+                parts = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+                conn = cls(parts.hostname, parts.port, timeout=self.timeout)
+                conn.set_tunnel(host, port)
+            else:
+                conn = cls(host, port, timeout=self.timeout)
+            self._connections[key] = conn
+        return conn
+
+    def _drop(self, scheme: str, host: str, port: int | None) -> None:
+        conn = self._connections.pop((scheme, host, port), None)
+        if conn is not None:
+            conn.close()
+
+    def get(self, url: str, headers: dict[str, str] | None = None, max_bytes: int = 65536) -> Response:
+        """
+        GET url, following redirects. Raises RemoteError on failure, on a
+        non-2xx/304 status, or if the body exceeds max_bytes.
+        """
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            if parts.scheme not in ("http", "https") or not parts.hostname:
+                raise RemoteError(f"unsupported URL: {url}")
+            path = parts.path or "/"
+            if parts.query:
+                path += "?" + parts.query
+            request_headers = {"User-Agent": USER_AGENT, "Accept-Encoding": "identity"}
+            request_headers.update(headers or {})
+
+            response = self._request(parts.scheme, parts.hostname, parts.port, path, request_headers, max_bytes)
+            if response.status in (301, 302, 303, 307, 308) and "location" in response.headers:
+                url = urljoin(url, response.headers["location"])
+                continue
+            if response.status == 304 or 200 <= response.status < 300:
+                return response
+            raise RemoteError(f"HTTP {response.status} for {url}")
+        raise RemoteError(f"too many redirects for {url}")
+
+    def stream(self, url: str, headers: dict[str, str] | None = None) -> http.client.HTTPResponse:
+        """
+        GET url, following redirects, and return the unread 2xx response for
+        the caller to read incrementally (nothing is buffered). The
+        connection is dropped from the pool: close the response when done.
+        Raises RemoteError on failure or a non-2xx status.
+        """
+        for _ in range(MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            if parts.scheme not in ("http", "https") or not parts.hostname:
+                raise RemoteError(f"unsupported URL: {url}")
+            path = parts.path or "/"
+            if parts.query:
+                path += "?" + parts.query
+            request_headers = {"User-Agent": USER_AGENT, "Accept-Encoding": "identity"}
+            request_headers.update(headers or {})
+
+            conn = self._connection(parts.scheme, parts.hostname, parts.port)
+            try:
+                conn.request("GET", path, headers=request_headers)
+                raw = conn.getresponse()
+            except (http.client.HTTPException, OSError) as e:
+                self._drop(parts.scheme, parts.hostname, parts.port)
+                raise RemoteError(str(e)) from e
+            self.requests += 1
+            if 200 <= raw.status < 300:
+                # Hand the connection over to the response without closing
+                # it (that would close the response too); its socket is
+                # released once the response is closed
+                self._connections.pop((parts.scheme, parts.hostname, parts.port), None)
+                return raw
+            location = raw.getheader("Location")
+            self._drop(parts.scheme, parts.hostname, parts.port)
+            if raw.status in (301, 302, 303, 307, 308) and location:
+                url = urljoin(url, location)
+                continue
+            raise RemoteError(f"HTTP {raw.status} for {url}")
+        raise RemoteError(f"too many redirects for {url}")
+
+    def _request(self, scheme, host, port, path, headers, max_bytes) -> Response:
+        # A kept-alive connection may have been closed by the server since the
+        # last request; retry once on a fresh connection in that case
+        for attempt in (1, 2):
+            conn = self._connection(scheme, host, port)
+            try:
+                conn.request("GET", path, headers=headers)
+                raw = conn.getresponse()
+                length = raw.getheader("Content-Length")
+                if length is not None and length.isdigit() and int(length) > max_bytes:
+                    self._drop(scheme, host, port)
+                    raise RemoteError(f"response too large ({length} bytes, cap {max_bytes})")
+                body = raw.read(max_bytes + 1)
+                if len(body) > max_bytes:
+                    self._drop(scheme, host, port)
+                    raise RemoteError(f"response exceeds {max_bytes} bytes")
+                if raw.will_close:
+                    self._drop(scheme, host, port)
+                self.requests += 1
+                self.bytes_read += len(body)
+                return Response(raw.status, {k.lower(): v for k, v in raw.getheaders()}, body)
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError) as e:
+                self._drop(scheme, host, port)
+                if attempt == 2:
+                    raise RemoteError(str(e)) from e
+            except (http.client.HTTPException, OSError) as e:
+                self._drop(scheme, host, port)
+                raise RemoteError(str(e)) from e
+        raise RemoteError("unreachable")
+
+
+def conditional_headers(validators: dict[str, str]) -> dict[str, str]:
+    """Build If-None-Match / If-Modified-Since headers from stored validators."""
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def response_validators(response: Response) -> dict[str, str]:
+    """Extract the validators worth storing from a 200 response."""
+    return {
+        "etag": response.headers.get("etag", ""),
+        "last_modified": response.headers.get("last-modified", ""),
+    }
@@ -0,0 +1,109 @@
+"""
+Sync rules shared by sync-myskillium.py and the git-less `sync` module.
+
+Both entry points copy the same roots, preserve the same project files and
+print the same report, so the definitions live here, in the package every
+project already has (it ships with the spore). Standard library only and
+cheap to import: nothing here loads `hashlib`, `sqlite3` or the hook.
+"""
+
+import os
+from pathlib import Path
+
+# Directories to sync (source -> destination relative paths)
+SYNC_DIRS = [
+    (".claude/skills", ".claude/skills"),
+]
+
+# Patterns to preserve (never overwrite)
+PRESERVE_PATTERNS = [
+    ".claude/data/*.db",
+    ".claude/local/*",
+    ".claude/settings.local.json",
+]
+
+# Upstream commit the project was last synced to
+VERSION_FILE = ".myskillium-version"
+
+# Full-text skill index (relative to the project, see sync-myskillium.py).
+# It is derived, per-machine state, so it lives under .claude/local/ -
+# gitignored and never synced over
+INDEX_DB = ".claude/local/skill-index.db"
+
+
+def should_preserve(path: Path, project_dir: Path) -> bool:
+    """Check if a path should be preserved (not overwritten)."""
+    rel_path = path.relative_to(project_dir)
+    rel_str = str(rel_path)
+
+    for pattern in PRESERVE_PATTERNS:
+        # Simple glob matching
+        if pattern.endswith("/*"):
+            prefix = pattern[:-2]
+            if rel_str.startswith(prefix + "/") or rel_str.startswith(prefix + os.sep):
+                return True
+        elif pattern.endswith("/*.db"):
+            prefix = pattern[:-5]
+            if rel_str.startswith(prefix + "/") or rel_str.startswith(prefix + os.sep):
+                if rel_str.endswith(".db"):
+                    return True
+        elif rel_str == pattern:
+            return True
+
+    return False
+
+
+def get_current_version(project_dir: Path) -> str | None:
+    """Read the current Myskillium version."""
+    version_file = project_dir / VERSION_FILE
+    if version_file.exists():
+        return version_file.read_text().strip()
+    return None
+
+
+def print_report(old_version: str | None, new_version: str, all_stats: dict, dry_run: bool,
+                 index_stats: dict | None = None) -> None:
+    """Print the outcome of a sync."""
+    print()
+    if dry_run:
+        print("=== DRY RUN (no changes made) ===")
+        print()
+
+    old_short = old_version[:7] if old_version else "none"
+    new_short = new_version[:7]
+
+    if old_version == new_version:
+        print(f"Already at version {new_short}")
+    else:
+        print(f"Updated from {old_short} to {new_short}")
+
+    print()
+
+    if all_stats["added"]:
+        print(f"Added ({len(all_stats['added'])}):")
+        for f in all_stats["added"]:
+            print(f"  + {f}")
+        print()
+
+    if all_stats["updated"]:
+        print(f"Updated ({len(all_stats['updated'])}):")
+        for f in all_stats["updated"]:
+            print(f"  ~ {f}")
+        print()
+
+    if all_stats["preserved"]:
+        print(f"Preserved ({len(all_stats['preserved'])}):")
+        for f in all_stats["preserved"]:
+            print(f"  * {f}")
+        print()
+
+    if all_stats["unchanged"]:
+        print(f"Unchanged: {len(all_stats['unchanged'])} files")
+        print()
+
+    if index_stats:
+        print(f"Skill index: {index_stats['indexed']} file(s) re-indexed, {index_stats['files']} indexed")
+        print()
+
+    if not dry_run:
+        print("Run: git add . && git commit -m 'chore: sync myskillium'")
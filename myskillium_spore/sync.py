@@ -0,0 +1,246 @@
+"""
+Git-less skill sync: stream the upstream archive into the project.
+
+Does what sync-myskillium.py does, for dependents without git (web
+sandboxes, locked-down hosts): downloads the upstream commit archive
+(tar.gz) over HTTP and extracts only the entries under the sync roots
+straight to their destinations, with the same sync roots, preserve rules
+and report (`rules`), then records the commit in `.myskillium-version`. An
+existing skill index (built by `sync-myskillium.py index`) is brought up to
+date with the files the sync wrote.
+
+The archive is read as a stream: the response is decompressed and untarred
+incrementally and each file is copied in chunks to a temp file next to its
+destination, so neither the archive nor any whole file is held in memory,
+and nothing outside the sync roots is written. An entry is compared with the
+existing file as it is read, and a temp file is only opened once they
+differ, so files whose content did not change are never written.
+
+The commit SHA comes from the archive's pax global header (`git archive`,
+and so GitHub, stores it as `comment`); an archive without one is recorded
+by its SHA-256.
+
+Usage:
+    python -m myskillium_spore.sync [--dry-run] [--url URL] [--project DIR]
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import tarfile
+from pathlib import Path
+
+from . import get_project_root_str
+from .hook import _SOURCE_OWNER, _SOURCE_REPO
+from .remote import RemoteClient, RemoteError
+from .rules import INDEX_DB, SYNC_DIRS, VERSION_FILE, get_current_version, print_report, should_preserve
+
+# Upstream archive of the main branch; MYSKILLIUM_SPORE_ARCHIVE_URL
+# overrides it (e.g. a local stand-in server)
+ARCHIVE_URL = os.environ.get("MYSKILLIUM_SPORE_ARCHIVE_URL") or (
+    f"https://codeload.github.com/{_SOURCE_OWNER}/{_SOURCE_REPO}/tar.gz/refs/heads/main"
+)
+
+# sync-myskillium.py, which holds the skill index code; needed only to
+# refresh an index the project already has
+SYNC_SCRIPT = Path(__file__).resolve().parent.parent / "sync-myskillium.py"
+
+# Cap on the bytes extracted from one archive (guards against archive bombs)
+MAX_EXTRACT_BYTES = 256 * 1024 * 1024
+
+# Network timeout per socket operation, in seconds
+TIMEOUT = 30
+
+CHUNK_SIZE = 64 * 1024
+
+
+class SyncError(Exception):
+    """The archive could not be synced (network, format or size cap)."""
+
+
+class _HashingReader:
+    """File-like wrapper that hashes everything read through it."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.digest = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.stream.read(size)
+        self.digest.update(data)
+        return data
+
+    def drain(self) -> None:
+        """Read (and hash) whatever the tar reader left unread."""
+        while self.read(CHUNK_SIZE):
+            pass
+
+
+def destination(member_name: str) -> str | None:
+    """
+    Map an archive entry to its project-relative destination, or None if it
+    is outside the sync roots. The archive's top-level directory is dropped.
+    """
+    parts = member_name.split("/")[1:]
+    if not parts or any(part in ("", ".", "..") for part in parts):
+        return None
+    rel = "/".join(parts)
+    for src, dst in SYNC_DIRS:
+        if rel.startswith(src + "/"):
+            return dst + rel[len(src):]
+    return None
+
+
+def extract_member(source, size: int, mode: int, dst: Path, dry_run: bool) -> str:
+    """
+    Copy one archive entry to dst. Returns "added", "updated" or "unchanged".
+
+    An existing dst of the same size is compared chunk by chunk as the
+    entry is read; the temp file is only opened at the first difference
+    (seeded with the prefix that matched), so an unchanged file costs reads
+    only.
+    """
+    try:
+        st = dst.stat()
+    except OSError:
+        st = None
+    chunks = iter(lambda: source.read(CHUNK_SIZE), b"")
+    pending = b""  # the first chunk that differs from dst
+    matched = 0    # bytes at the start of dst equal to the entry's
+    if st is not None and st.st_size == size:
+        try:
+            current = open(dst, "rb")
+        except OSError:
+            current = None
+        if current is not None:
+            with current:
+                for chunk in chunks:
+                    if current.read(len(chunk)) != chunk:
+                        pending = chunk
+                        break
+                    matched += len(chunk)
+                else:
+                    return "unchanged"
+    outcome = "updated" if st is not None else "added"
+    if dry_run:
+        return outcome  # the tar reader skips the rest of the entry
+
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dst.parent / f".{dst.name}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as out:
+            if matched:
+                with open(dst, "rb") as current:
+                    remaining = matched
+                    while remaining:
+                        data = current.read(min(CHUNK_SIZE, remaining))
+                        if not data:
+                            raise OSError(f"{dst} shrank during the sync")
+                        out.write(data)
+                        remaining -= len(data)
+            out.write(pending)
+            for chunk in chunks:
+                out.write(chunk)
+        if mode & 0o111:
+            os.chmod(tmp, os.stat(tmp).st_mode | (mode & 0o111))
+        os.replace(tmp, dst)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return outcome
+
+
+def sync_archive(stream, project_dir: Path, dry_run: bool) -> tuple[str, dict]:
+    """
+    Extract the sync roots from a tar.gz stream into project_dir.
+
+    Returns (version, stats), with stats listing destination paths under
+    added, updated, unchanged and preserved.
+    """
+    stats = {"added": [], "updated": [], "unchanged": [], "preserved": []}
+    reader = _HashingReader(stream)
+    extracted = 0
+    try:
+        with tarfile.open(fileobj=reader, mode="r|gz") as tar:
+            for member in tar:
+                rel = destination(member.name)
+                if rel is None or not member.isfile():
+                    continue  # directories are created as needed; links are not synced
+                dst = project_dir / rel
+                if should_preserve(dst, project_dir) and dst.exists():
+                    stats["preserved"].append(rel)
+                    continue
+                extracted += member.size
+                if extracted > MAX_EXTRACT_BYTES:
+                    raise SyncError(f"archive exceeds {MAX_EXTRACT_BYTES} extracted bytes")
+                outcome = extract_member(tar.extractfile(member), member.size, member.mode, dst, dry_run)
+                stats[outcome].append(rel)
+            commit = tar.pax_headers.get("comment", "")
+        reader.drain()
+    except (tarfile.TarError, EOFError, OSError) as e:
+        raise SyncError(f"cannot read archive: {e}") from e
+    if len(commit) == 40 and all(c in "0123456789abcdef" for c in commit):
+        return commit, stats
+    return reader.digest.hexdigest(), stats
+
+
+def update_index(project_dir: Path, changed: list[str]) -> dict | None:
+    """
+    Re-index the files a sync changed in the project's existing skill index
+    (as sync-myskillium.py does after a sync). Returns its counts, or None
+    with a warning if it cannot be updated.
+    """
+    import importlib.util
+    try:
+        spec = importlib.util.spec_from_file_location("sync_myskillium", SYNC_SCRIPT)
+        sync_myskillium = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(sync_myskillium)
+    except (OSError, ImportError) as e:
+        print(f"Warning: skill index not updated ({SYNC_SCRIPT.name} not loadable: {e})")
+        return None
+    try:
+        return sync_myskillium.update_index(project_dir, changed)
+    except sync_myskillium.SkillIndexError as e:
+        print(f"Warning: skill index not updated: {e}")
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync Myskillium skills to local project (without git)")
+    parser.add_argument("--dry-run", action="store_true", help="Show what would be done without making changes")
+    parser.add_argument("--url", default=ARCHIVE_URL, help="Upstream tar.gz archive (default: main branch)")
+    parser.add_argument("--project", default=None, help="Project root (default: $CLAUDE_PROJECT_DIR or cwd)")
+    args = parser.parse_args()
+
+    project_dir = Path(args.project or get_project_root_str())
+    old_version = get_current_version(project_dir)
+
+    print(f"Fetching Myskillium from {args.url}...")
+    try:
+        with RemoteClient(timeout=TIMEOUT) as client:
+            response = client.stream(args.url)
+            try:
+                new_version, all_stats = sync_archive(response, project_dir, args.dry_run)
+            finally:
+                response.close()
+    except (RemoteError, SyncError) as e:
+        print(f"Error: Failed to fetch Myskillium archive: {e}")
+        print("Check your network connection and try again.")
+        sys.exit(1)
+
+    if not args.dry_run:
+        (project_dir / VERSION_FILE).write_text(new_version + "\n")
+
+    index_stats = None
+    if not args.dry_run and (project_dir / INDEX_DB).exists():
+        index_stats = update_index(project_dir, all_stats["added"] + all_stats["updated"])
+
+    print_report(old_version, new_version, all_stats, args.dry_run, index_stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Aggregate the spore hook's opt-in trace log into a latency report.
+
+With MYSKILLIUM_SPORE_TRACE set, every hook run appends one JSON line: the
+path it took (fast, busy, recent, source, sync, remote-spawn, remote-error,
+remote-update, remote-current, remote-delta, deferred, capped), its total and
+per-step milliseconds and the bytes the process read. This command reports
+how often each path is taken and p50/p95/p99 latencies per step, across any
+number of logs (e.g. collected from many machines).
+
+Usage:
+    python -m myskillium_spore.trace [LOG ...] [--project DIR]
+
+Without LOG arguments, reads the project's log (and its rotated `.1`).
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from . import TRACE_FILE, get_project_root_str
+
+PERCENTILES = (50, 95, 99)
+
+
+def read_records(paths: list[str]) -> tuple[list[dict], int]:
+    """Read trace records from the given logs. Returns (records, malformed lines)."""
+    records = []
+    malformed = 0
+    for path in paths:
+        try:
+            with open(path, encoding="utf-8") as f:
+                lines = f.readlines()
+        except OSError:
+            continue
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                malformed += 1  # e.g. a line cut short by a killed process
+                continue
+            if isinstance(record, dict) and "path" in record and "total_ms" in record:
+                records.append(record)
+            else:
+                malformed += 1
+    return records, malformed
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def summarize(records: list[dict]) -> dict:
+    """
+    Return {"runs", "paths": {path: count}, "steps": {step: [ms, ...]},
+    "bytes_read": [n, ...]}, with the whole run counted as step "total".
+    """
+    paths = {}
+    steps = {"total": []}
+    bytes_read = []
+    for record in records:
+        paths[record["path"]] = paths.get(record["path"], 0) + 1
+        steps["total"].append(record["total_ms"])
+        for step, ms in (record.get("steps") or {}).items():
+            steps.setdefault(step, []).append(ms)
+        if isinstance(record.get("bytes_read"), int):
+            bytes_read.append(record["bytes_read"])
+    return {"runs": len(records), "paths": paths, "steps": steps, "bytes_read": bytes_read}
+
+
+def render_report(summary: dict) -> str:
+    """Format a summary as a plain-text report."""
+    runs = summary["runs"]
+    lines = [f"Spore hook trace: {runs} run(s)", "", "Paths:"]
+    for path, count in sorted(summary["paths"].items(), key=lambda item: -item[1]):
+        lines.append(f"  {path:<16} {count:>7}  {count / runs * 100:5.1f}%")
+
+    header = "".join(f"{f'p{pct}':>9}" for pct in PERCENTILES)
+    lines += ["", f"Latency (ms):     {'runs':>7}{header}"]
+    # Whole run first, then steps in the order the hook runs them
+    for step, values in summary["steps"].items():
+        cells = "".join(f"{percentile(values, pct):9.2f}" for pct in PERCENTILES)
+        lines.append(f"  {step:<16}{len(values):>7}{cells}")
+
+    if summary["bytes_read"]:
+        cells = "".join(f"{percentile(summary['bytes_read'], pct):9.0f}" for pct in PERCENTILES)
+        lines += ["", f"Bytes read:       {len(summary['bytes_read']):>7}{cells}"]
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report on the spore hook's trace log")
+    parser.add_argument("logs", nargs="*", help="Trace logs to aggregate (default: the project's log)")
+    parser.add_argument("--project", default=None, help="Project root (default: $CLAUDE_PROJECT_DIR or cwd)")
+    args = parser.parse_args()
+
+    paths = args.logs
+    if not paths:
+        log = os.path.join(args.project or get_project_root_str(), TRACE_FILE)
+        paths = [log + ".1", log]
+
+    records, malformed = read_records(paths)
+    if not records:
+        print(f"No trace records in {', '.join(paths)} (enable tracing with MYSKILLIUM_SPORE_TRACE=1)")
+        sys.exit(1)
+    print(render_report(summarize(records)))
+    if malformed:
+        print(f"\n({malformed} malformed line(s) skipped)")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,33 +5,82 @@ Sync Myskillium skills to local project.
 Fetches the latest Myskillium repository and copies shared skills
 while preserving project-specific files.
 
+Also keeps a full-text index of the synced skills (BM25-ranked, SQLite
+FTS5) in `.claude/local/skill-index.db`, so "find me a skill that can X" is
+one query instead of reading every SKILL.md. `index` builds it and catches
+up with local edits (re-reading only files whose size or mtime changed);
+once it exists, a sync re-indexes only the files it added or updated.
+`search` queries one or more projects' indexes.
+
+The index also stores a MinHash signature per skill, banded into an LSH
+table, so `similar` finds near-duplicates and diverged forks of a skill -
+in one project or across many - by bucket lookups rather than comparing
+every pair of skills, and lists the files that differ.
+
+And it keeps a Merkle hash of every directory under the synced roots,
+recomputed only along the paths of changed files, so `compare` can tell
+where two projects (or a project and upstream) differ by descending only
+into subtrees whose hashes differ, without reading any skill file.
+
 Usage:
     python sync-myskillium.py [--dry-run]
+    python sync-myskillium.py index [--rebuild]
+    python sync-myskillium.py search QUERY [--limit N] [--files] [--project DIR ...]
+    python sync-myskillium.py similar [SKILL] [--threshold T] [--limit N] [--project DIR ...]
+    python sync-myskillium.py compare [--upstream] [--cached] [--project DIR ...]
 """
 
 import argparse
 import os
+import re
 import shutil
 import subprocess
 import sys
 import tempfile
+import time
 from pathlib import Path
 
+# Sync roots, preserve rules and the report, shared with the git-less sync
+# (`python -m myskillium_spore.sync`); the package sits next to this script
+from myskillium_spore.rules import (
+    INDEX_DB,
+    SYNC_DIRS,
+    VERSION_FILE,
+    get_current_version,
+    print_report,
+    should_preserve,
+)
+
+# The index code imports sqlite3, hashlib, zlib and array where it uses
+# them, so that a plain sync does not load them. Type checkers still see
+# `array` for the annotations (the constant spares importing typing).
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from array import array
+
 # Configuration
 MYSKILLIUM_REPO = "https://github.com/Mharbulous/Myskillium.git"
 MYSKILLIUM_BRANCH = "main"
 
-# Directories to sync (source -> destination relative paths)
-SYNC_DIRS = [
-    (".claude/skills", ".claude/skills"),
-]
+# Full-text skill index schema (the file is rules.INDEX_DB)
+INDEX_SCHEMA_VERSION = "3"
+
+# Indexed columns and their BM25 weights: a match in a skill's name or
+# description counts far more than one in the body of a doc
+INDEX_COLUMNS = ("skill", "name", "description", "frontmatter", "path", "body")
+INDEX_WEIGHTS = (4.0, 10.0, 6.0, 2.0, 1.5, 1.0)
 
-# Patterns to preserve (never overwrite)
-PRESERVE_PATTERNS = [
-    ".claude/data/*.db",
-    ".claude/local/*",
-    ".claude/settings.local.json",
-]
+# Larger files, and files that are not UTF-8 text, are not indexed
+INDEX_MAX_BYTES = 1024 * 1024
+
+# MinHash signatures (one-permutation hashing): shingles of SHINGLE_WORDS
+# words are hashed into MINHASH_BINS bins, each keeping its smallest hash.
+# LSH_BANDS bands of 4 bins make skills with a Jaccard similarity above
+# ~0.45 likely to share a bucket (and below ~0.2 unlikely to)
+MINHASH_BINS = 128
+LSH_BANDS = 32
+SHINGLE_WORDS = 4
+MINHASH_EMPTY = 0xFFFFFFFF
 
 
 def run_command(cmd: list[str], cwd: str | None = None) -> subprocess.CompletedProcess:
@@ -45,14 +94,6 @@ def check_git_available() -> bool:
     return result.returncode == 0
 
 
-def get_current_version(project_dir: Path) -> str | None:
-    """Read the current Myskillium version."""
-    version_file = project_dir / ".myskillium-version"
-    if version_file.exists():
-        return version_file.read_text().strip()
-    return None
-
-
 def clone_myskillium(temp_dir: str) -> str | None:
     """Clone Myskillium repo and return the commit SHA."""
     print(f"Fetching Myskillium from {MYSKILLIUM_REPO}...")
@@ -77,28 +118,6 @@ def clone_myskillium(temp_dir: str) -> str | None:
     return result.stdout.strip()
 
 
-def should_preserve(path: Path, project_dir: Path) -> bool:
-    """Check if a path should be preserved (not overwritten)."""
-    rel_path = path.relative_to(project_dir)
-    rel_str = str(rel_path)
-
-    for pattern in PRESERVE_PATTERNS:
-        # Simple glob matching
-        if pattern.endswith("/*"):
-            prefix = pattern[:-2]
-            if rel_str.startswith(prefix + "/") or rel_str.startswith(prefix + os.sep):
-                return True
-        elif pattern.endswith("/*.db"):
-            prefix = pattern[:-5]
-            if rel_str.startswith(prefix + "/") or rel_str.startswith(prefix + os.sep):
-                if rel_str.endswith(".db"):
-                    return True
-        elif rel_str == pattern:
-            return True
-
-    return False
-
-
 def sync_directory(src_dir: Path, dst_dir: Path, project_dir: Path, dry_run: bool) -> dict:
     """Sync a directory, returning stats about changes."""
     stats = {"added": [], "updated": [], "unchanged": [], "preserved": []}
@@ -144,11 +163,770 @@ def sync_directory(src_dir: Path, dst_dir: Path, project_dir: Path, dry_run: boo
     return stats
 
 
+class SkillIndexError(Exception):
+    """The skill index cannot be opened or queried."""
+
+
+def parse_frontmatter(text: str) -> tuple[dict[str, str], str]:
+    """
+    Split a doc into its YAML frontmatter fields and body.
+
+    Only `key: value` lines are understood (indented continuation lines are
+    appended to the previous key, as in folded descriptions); that is all
+    skill frontmatter uses.
+    """
+    if not text.startswith("---\n"):
+        return {}, text
+    end = text.find("\n---", 3)
+    if end == -1:
+        return {}, text
+    fields = {}
+    key = None
+    for line in text[4:end].splitlines():
+        match = re.match(r"^([A-Za-z0-9_-]+):\s*(.*)$", line)
+        if match:
+            key = match.group(1).lower()
+            value = match.group(2).strip()
+            fields[key] = "" if value in (">", "|", ">-", "|-") else value.strip("\"'")
+        elif key and line[:1] in (" ", "\t"):
+            fields[key] = (fields[key] + " " + line.strip()).strip()
+    return fields, text[end + 4:].lstrip("\n")
+
+
+def open_index(project_dir: Path) -> tuple[object, bool]:
+    """
+    Open (creating if needed) the project's skill index. Returns (connection, created).
+
+    The index holds nothing that cannot be rebuilt from the files, so one
+    that is not a readable SQLite database is deleted and built afresh.
+    """
+    try:
+        import sqlite3
+    except ImportError as e:
+        raise SkillIndexError("Python was built without sqlite3") from e
+    db_path = project_dir / INDEX_DB
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    try:
+        version = conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+    except sqlite3.OperationalError:
+        version = None  # new, or from before the schema was versioned
+    except sqlite3.DatabaseError:
+        conn.close()
+        try:
+            for suffix in ("", "-journal", "-wal", "-shm"):
+                Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+        except OSError as e:
+            raise SkillIndexError(f"cannot remove the damaged skill index {db_path}: {e}") from e
+        conn = sqlite3.connect(db_path)
+        version = None
+    if version == (INDEX_SCHEMA_VERSION,):
+        return conn, False
+    try:
+        conn.executescript(f"""
+            DROP TABLE IF EXISTS meta;
+            DROP TABLE IF EXISTS files;
+            DROP TABLE IF EXISTS skill_fts;
+            DROP TABLE IF EXISTS skills;
+            DROP TABLE IF EXISTS lsh;
+            DROP TABLE IF EXISTS dirs;
+            CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE files (
+                id INTEGER PRIMARY KEY,
+                path TEXT UNIQUE NOT NULL,
+                dir TEXT NOT NULL,
+                skill TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                executable INTEGER NOT NULL,
+                indexed INTEGER NOT NULL,
+                sha256 TEXT NOT NULL,
+                minhash BLOB NOT NULL
+            );
+            CREATE INDEX files_dir ON files (dir);
+            CREATE INDEX files_skill ON files (skill);
+            CREATE TABLE dirs (path TEXT PRIMARY KEY, parent TEXT, hash TEXT NOT NULL);
+            CREATE INDEX dirs_parent ON dirs (parent);
+            CREATE TABLE skills (name TEXT PRIMARY KEY, files INTEGER NOT NULL, signature BLOB NOT NULL);
+            CREATE TABLE lsh (band INTEGER NOT NULL, bucket INTEGER NOT NULL, skill TEXT NOT NULL);
+            CREATE INDEX lsh_bucket ON lsh (band, bucket);
+            CREATE INDEX lsh_skill ON lsh (skill);
+            CREATE VIRTUAL TABLE skill_fts USING fts5({", ".join(INDEX_COLUMNS)}, tokenize = 'porter unicode61');
+            INSERT INTO meta VALUES ('schema', '{INDEX_SCHEMA_VERSION}');
+        """)
+    except sqlite3.DatabaseError as e:
+        conn.close()
+        raise SkillIndexError(f"cannot create the skill index {db_path} (SQLite without FTS5?): {e}") from e
+    return conn, True
+
+
+def skill_of(rel_path: str) -> str | None:
+    """Return the skill a project-relative path belongs to, or None if it is outside the synced skills."""
+    for _, dst_rel in SYNC_DIRS:
+        prefix = dst_rel + "/"
+        if rel_path.startswith(prefix) and "/" in rel_path[len(prefix):]:
+            return rel_path[len(prefix):].split("/", 1)[0]
+    return None
+
+
+def file_minhash(data: bytes | None, digest: str) -> "array":
+    """
+    MinHash signature of one file: its lower-cased word shingles, or for a
+    binary or oversized file (data None) its content hash as the only shingle.
+    """
+    import zlib
+    from array import array
+    from itertools import repeat
+    words = data.lower().split() if data is not None else []
+    if len(words) >= SHINGLE_WORDS:
+        shingles = map(b" ".join, zip(*(words[i:] for i in range(SHINGLE_WORDS))))
+    else:
+        shingles = [b" ".join(words) if words else digest.encode()]
+    # Descending, so for each bin the last (kept) entry is its smallest hash
+    hashes = sorted(map(zlib.crc32, shingles), reverse=True)
+    bins = dict(zip(map(MINHASH_BINS.__rmod__, hashes), hashes))
+    return array("I", map(bins.get, range(MINHASH_BINS), repeat(MINHASH_EMPTY)))
+
+
+def skill_signature(file_signatures: list[bytes]) -> "array | None":
+    """
+    Combine a skill's file signatures into the signature of the skill (the
+    union of their shingles): the smallest hash per bin. Bins no shingle
+    fell into borrow the next filled bin's hash, offset by the distance, so
+    that two small skills do not match on empty bins.
+    """
+    if not file_signatures:
+        return None
+    from array import array
+    signature = array("I", map(min, zip(*(array("I", blob) for blob in file_signatures))))
+    filled = [i for i, value in enumerate(signature) if value != MINHASH_EMPTY]
+    if len(filled) < MINHASH_BINS:
+        for i in range(MINHASH_BINS):
+            if signature[i] == MINHASH_EMPTY:
+                source = next((j for j in filled if j > i), filled[0])
+                distance = (source - i) % MINHASH_BINS
+                signature[i] = (signature[source] + distance * 0x9E3779B9) & 0xFFFFFFFF
+    return signature
+
+
+def lsh_buckets(signature: "array") -> list[int]:
+    """One bucket (a signed 64-bit hash) per band of a skill signature."""
+    import hashlib
+    rows = MINHASH_BINS // LSH_BANDS
+    return [
+        int.from_bytes(hashlib.blake2b(signature[band * rows:(band + 1) * rows].tobytes(), digest_size=8).digest(),
+                       "little", signed=True)
+        for band in range(LSH_BANDS)
+    ]
+
+
+def _is_executable(st: os.stat_result) -> bool:
+    return bool(st.st_mode & 0o111) and os.name != "nt"
+
+
+def _index_row(conn, project_dir: Path, rel_path: str, st: os.stat_result) -> None:
+    """(Re-)index one file."""
+    import hashlib
+    row = conn.execute("SELECT id FROM files WHERE path = ?", (rel_path,)).fetchone()
+    if row:
+        conn.execute("DELETE FROM skill_fts WHERE rowid = ?", row)
+        conn.execute("DELETE FROM files WHERE id = ?", row)
+    data = None
+    digest = ""
+    try:
+        if st.st_size <= INDEX_MAX_BYTES:
+            data = (project_dir / rel_path).read_bytes()
+            digest = hashlib.sha256(data).hexdigest()
+        else:
+            sha = hashlib.sha256()
+            with open(project_dir / rel_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    sha.update(chunk)
+            digest = sha.hexdigest()
+    except OSError:
+        data = None
+    text = None
+    if data is not None and b"\0" not in data:
+        try:
+            text = data.decode("utf-8")
+        except UnicodeDecodeError:
+            text = None
+    skill = skill_of(rel_path)
+    cursor = conn.execute(
+        "INSERT INTO files (path, dir, skill, size, mtime_ns, executable, indexed, sha256, minhash)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (rel_path, rel_path.rpartition("/")[0], skill, st.st_size, st.st_mtime_ns,
+         _is_executable(st), text is not None, digest,
+         file_minhash(data if text is not None else None, digest).tobytes()),
+    )
+    if text is None:
+        return
+    fields, body = parse_frontmatter(text)
+    frontmatter = " ".join(f"{k} {v}" for k, v in fields.items() if k not in ("name", "description"))
+    conn.execute(
+        f"INSERT INTO skill_fts (rowid, {', '.join(INDEX_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (cursor.lastrowid, skill, fields.get("name", ""), fields.get("description", ""),
+         frontmatter, rel_path[len(SYNC_DIRS[0][1]) + 1:].replace("/", " ").replace("-", " "), body),
+    )
+
+
+def _remove_row(conn, rel_path: str) -> str | None:
+    """Drop one file from the index. Returns its skill, or None if it was not indexed."""
+    row = conn.execute("SELECT id, skill FROM files WHERE path = ?", (rel_path,)).fetchone()
+    if not row:
+        return None
+    conn.execute("DELETE FROM skill_fts WHERE rowid = ?", row[:1])
+    conn.execute("DELETE FROM files WHERE id = ?", row[:1])
+    return row[1]
+
+
+def refresh_skills(conn, skills) -> None:
+    """Recompute the signature and LSH buckets of the given skills from their files' stored signatures."""
+    for skill in skills:
+        conn.execute("DELETE FROM skills WHERE name = ?", (skill,))
+        conn.execute("DELETE FROM lsh WHERE skill = ?", (skill,))
+        blobs = [blob for (blob,) in conn.execute("SELECT minhash FROM files WHERE skill = ?", (skill,))]
+        signature = skill_signature(blobs)
+        if signature is None:
+            continue  # the skill is gone
+        conn.execute("INSERT INTO skills VALUES (?, ?, ?)", (skill, len(blobs), signature.tobytes()))
+        conn.executemany("INSERT INTO lsh VALUES (?, ?, ?)",
+                         [(band, bucket, skill) for band, bucket in enumerate(lsh_buckets(signature))])
+
+
+def sync_root(rel_path: str) -> str | None:
+    """Return the synced root (destination) a project-relative path is under."""
+    for _, dst_rel in SYNC_DIRS:
+        if rel_path == dst_rel or rel_path.startswith(dst_rel + "/"):
+            return dst_rel
+    return None
+
+
+def refresh_dirs(conn, dirs) -> int:
+    """
+    Recompute the Merkle hashes of the given directories and all their
+    ancestors up to the synced root, deepest first. Returns how many were
+    recomputed.
+
+    A directory's hash is the SHA-256 of its entries sorted by name, one
+    `<kind> <hash> <name>\n` line each, where kind is `f` (file), `x`
+    (executable file) or `d` (directory) - the same format as conidium
+    manifests (myskillium_spore/germinate.py). Directories left without
+    files are dropped.
+    """
+    import hashlib
+    pending = set()
+    for directory in dirs:
+        root = sync_root(directory)
+        while root is not None and directory not in pending:
+            pending.add(directory)
+            if directory == root:
+                break
+            directory = directory.rpartition("/")[0]
+    for directory in sorted(pending, key=lambda d: d.count("/"), reverse=True):
+        entries = [(path.rpartition("/")[2], "x" if executable else "f", digest) for path, executable, digest in
+                   conn.execute("SELECT path, executable, sha256 FROM files WHERE dir = ?", (directory,))]
+        entries += [(path.rpartition("/")[2], "d", digest) for path, digest in
+                    conn.execute("SELECT path, hash FROM dirs WHERE parent = ?", (directory,))]
+        if not entries:
+            conn.execute("DELETE FROM dirs WHERE path = ?", (directory,))
+            continue
+        lines = "".join(f"{kind} {digest} {name}\n" for name, kind, digest in sorted(entries))
+        parent = None if directory == sync_root(directory) else directory.rpartition("/")[0]
+        conn.execute("INSERT OR REPLACE INTO dirs VALUES (?, ?, ?)",
+                     (directory, parent, hashlib.sha256(lines.encode("utf-8")).hexdigest()))
+    return len(pending)
+
+
+def _walk_skill_files(project_dir: Path):
+    """Yield (project-relative path, stat) for every file in the synced skills."""
+    for _, dst_rel in SYNC_DIRS:
+        pending = [dst_rel]
+        while pending:
+            rel_dir = pending.pop()
+            try:
+                entries = list(os.scandir(os.path.join(project_dir, rel_dir)))
+            except OSError:
+                continue
+            for entry in entries:
+                rel = f"{rel_dir}/{entry.name}"
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name != "__pycache__":
+                            pending.append(rel)
+                    elif entry.is_file() and rel_dir != dst_rel:
+                        yield rel, entry.stat()
+                except OSError:
+                    continue
+
+
+def update_index(project_dir: Path, changed: list[str] | None = None, rebuild: bool = False) -> dict:
+    """
+    Bring the skill index up to date. Returns counts: indexed, removed,
+    files, skills (skill signatures recomputed) and dirs (directory hashes
+    recomputed).
+
+    With `changed` (the paths a sync added, updated or removed), only those
+    are re-indexed. Without it, every file under the synced roots is
+    stat-checked and only files whose size, mtime or executable bit changed
+    since they were indexed are re-read; files that disappeared are dropped. A new or
+    rebuilt index is always built in full. Only the signatures of skills,
+    and the hashes of directories, with a re-indexed or dropped file are
+    recomputed.
+    """
+    if rebuild:
+        (project_dir / INDEX_DB).unlink(missing_ok=True)
+    conn, created = open_index(project_dir)
+    import sqlite3
+    stats = {"indexed": 0, "removed": 0, "files": 0, "skills": 0, "dirs": 0}
+    touched = set()
+    try:
+        with conn:
+            if changed is not None and not created:
+                for rel in changed:
+                    rel = rel.replace(os.sep, "/")
+                    try:
+                        st = (project_dir / rel).stat()
+                    except OSError:
+                        if _remove_row(conn, rel) is not None:
+                            stats["removed"] += 1
+                            touched.add(rel)
+                        continue
+                    if skill_of(rel) is not None:
+                        _index_row(conn, project_dir, rel, st)
+                        stats["indexed"] += 1
+                        touched.add(rel)
+            else:
+                known = {path: (size, mtime, executable) for path, size, mtime, executable in
+                         conn.execute("SELECT path, size, mtime_ns, executable FROM files")}
+                for rel, st in _walk_skill_files(project_dir):
+                    if known.pop(rel, None) != (st.st_size, st.st_mtime_ns, _is_executable(st)):
+                        _index_row(conn, project_dir, rel, st)
+                        stats["indexed"] += 1
+                        touched.add(rel)
+                for rel in known:
+                    if _remove_row(conn, rel) is not None:
+                        stats["removed"] += 1
+                        touched.add(rel)
+            skills = sorted({skill_of(rel) for rel in touched})
+            refresh_skills(conn, skills)
+            stats["skills"] = len(skills)
+            stats["dirs"] = refresh_dirs(conn, {rel.rpartition("/")[0] for rel in touched})
+        stats["files"] = conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+    except sqlite3.DatabaseError as e:
+        # Damage past the header (e.g. a malformed page) shows up mid-update
+        raise SkillIndexError(f"cannot update {project_dir / INDEX_DB}: {e} "
+                              f"(run: python sync-myskillium.py index --rebuild)") from e
+    finally:
+        conn.close()
+    return stats
+
+
+# Words dropped from free-text queries ("find me a skill that can ...")
+# unless nothing else is left: they match nearly every doc and only cost time
+QUERY_STOPWORDS = frozenset(
+    "a an and are as at be by can could do does find for from help how i in is it me my of on or "
+    "skill skills something that the this to want what which with would you".split()
+)
+
+
+def match_expression(query: str) -> str | None:
+    """Turn a free-text query into an FTS5 expression matching any of its words."""
+    words = list(dict.fromkeys(re.findall(r"\w+", query.lower())))
+    words = [w for w in words if w not in QUERY_STOPWORDS] or words
+    return " OR ".join(f'"{w}"' for w in words) or None
+
+
+def _open_readonly(project_dir: Path):
+    """Open a project's skill index for reading (it must exist and be current)."""
+    import sqlite3
+    db_path = project_dir / INDEX_DB
+    if not db_path.exists():
+        raise SkillIndexError(f"no skill index in {project_dir} (run: python sync-myskillium.py index)")
+    try:
+        conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            version = conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+        except sqlite3.DatabaseError:
+            version = None
+    except sqlite3.DatabaseError as e:
+        raise SkillIndexError(f"cannot open {db_path}: {e}") from e
+    if version != (INDEX_SCHEMA_VERSION,):
+        conn.close()
+        raise SkillIndexError(f"outdated skill index in {project_dir} (run: python sync-myskillium.py index)")
+    return conn
+
+
+def search_index(project_dir: Path, query: str, limit: int = 10) -> list[dict]:
+    """
+    Return the best-ranked files for query in one project's index, best
+    first: dicts with project, path, skill, score (higher is better) and a
+    snippet with matches in [brackets].
+    """
+    import sqlite3
+    expression = match_expression(query)
+    if expression is None:
+        return []
+    conn = _open_readonly(project_dir)
+    try:
+        rows = conn.execute(
+            f"SELECT f.path, f.skill, bm25(skill_fts, {', '.join('?' * len(INDEX_WEIGHTS))}) AS rank,"
+            " snippet(skill_fts, -1, '[', ']', '...', 12)"
+            " FROM skill_fts JOIN files f ON f.id = skill_fts.rowid"
+            " WHERE skill_fts MATCH ? ORDER BY rank LIMIT ?",
+            (*INDEX_WEIGHTS, expression, limit),
+        ).fetchall()
+    except sqlite3.DatabaseError as e:
+        raise SkillIndexError(f"cannot query {project_dir / INDEX_DB}: {e}") from e
+    finally:
+        conn.close()
+    return [
+        {"project": str(project_dir), "path": path, "skill": skill, "score": -rank, "snippet": snippet}
+        for path, skill, rank, snippet in rows
+    ]
+
+
+def _skill_files(conn, skill: str) -> dict[str, str]:
+    """{path relative to the skill's directory: sha256} of a skill's files."""
+    files = {}
+    for path, digest in conn.execute("SELECT path, sha256 FROM files WHERE skill = ?", (skill,)):
+        for _, dst_rel in SYNC_DIRS:
+            prefix = f"{dst_rel}/{skill}/"
+            if path.startswith(prefix):
+                files[path[len(prefix):]] = digest
+                break
+    return files
+
+
+def diff_files(a: dict[str, str], b: dict[str, str]) -> list[tuple[str, str]]:
+    """
+    Compare two skills' {path: sha256}. Returns sorted (mark, path) pairs:
+    "-" only in a, "+" only in b, "~" in both with different content.
+    """
+    marks = [("-", path) for path in a if path not in b]
+    marks += [("+", path) for path in b if path not in a]
+    marks += [("~", path) for path in a if path in b and a[path] != b[path]]
+    return sorted(marks, key=lambda mark: (mark[1], mark[0]))
+
+
+def similar_skills(projects: list[Path], skill: str | None = None, threshold: float = 0.5) -> tuple[list[dict], int]:
+    """
+    Find near-duplicate skills via the LSH tables of the projects' indexes.
+
+    With `skill` (a skill of the first project), return the skills similar
+    to it: one indexed bucket lookup per band and project, so the cost
+    depends on how many skills collide, not on how many there are. Without
+    it, return every similar pair across all the projects (and within each).
+
+    Candidates sharing a bucket are scored by their estimated Jaccard
+    similarity (the fraction of equal signature bins); those at or above
+    threshold are returned, best first, as dicts with a and b
+    ((project, skill) each), score and files (see diff_files). Also returns
+    how many candidates were scored.
+    """
+    import sqlite3
+    from array import array
+    conns = {}
+    try:
+        for project_dir in projects:
+            conns[project_dir] = _open_readonly(project_dir)
+        try:
+            signatures = {}
+
+            def signature(key: tuple[Path, str]) -> "array | None":
+                if key not in signatures:
+                    row = conns[key[0]].execute("SELECT signature FROM skills WHERE name = ?", key[1:]).fetchone()
+                    signatures[key] = array("I", row[0]) if row else None
+                return signatures[key]
+
+            candidates = set()
+            if skill is not None:
+                query = (projects[0], skill)
+                if signature(query) is None:
+                    raise SkillIndexError(f"skill {skill!r} is not in the index of {projects[0]}")
+                buckets = list(enumerate(lsh_buckets(signature(query))))
+                for project_dir, conn in conns.items():
+                    for band, bucket in buckets:
+                        for (name,) in conn.execute("SELECT skill FROM lsh WHERE band = ? AND bucket = ?",
+                                                    (band, bucket)):
+                            candidates.add((query, (project_dir, name)))
+                candidates.discard((query, query))
+            else:
+                members = {}
+                for project_dir, conn in conns.items():
+                    for band, bucket, name in conn.execute("SELECT band, bucket, skill FROM lsh"):
+                        members.setdefault((band, bucket), []).append((project_dir, name))
+                for group in members.values():
+                    for i, a in enumerate(group):
+                        candidates.update((min(a, b), max(a, b)) for b in group[i + 1:])
+
+            matches = []
+            for a, b in candidates:
+                score = sum(x == y for x, y in zip(signature(a), signature(b))) / MINHASH_BINS
+                if score >= threshold:
+                    matches.append({"a": a, "b": b, "score": score})
+            for match in matches:
+                (project_a, skill_a), (project_b, skill_b) = match["a"], match["b"]
+                match["files"] = diff_files(_skill_files(conns[project_a], skill_a),
+                                            _skill_files(conns[project_b], skill_b))
+        except sqlite3.DatabaseError as e:
+            raise SkillIndexError(f"cannot query skill signatures: {e}") from e
+    finally:
+        for conn in conns.values():
+            conn.close()
+    matches.sort(key=lambda match: (-match["score"], str(match["a"]), str(match["b"])))
+    return matches, len(candidates)
+
+
+def _dir_entries(conn, directory: str) -> dict[str, tuple[str, str]]:
+    """{name: (kind, hash)} of one indexed directory (kinds as in refresh_dirs)."""
+    entries = {path.rpartition("/")[2]: ("x" if executable else "f", digest) for path, executable, digest in
+               conn.execute("SELECT path, executable, sha256 FROM files WHERE dir = ?", (directory,))}
+    entries.update({path.rpartition("/")[2]: ("d", digest) for path, digest in
+                    conn.execute("SELECT path, hash FROM dirs WHERE parent = ?", (directory,))})
+    return entries
+
+
+def _subtree_files(conn, directory: str) -> list[str]:
+    # "0" sorts right after "/": a range scan of the path index
+    return [path for (path,) in conn.execute(
+        "SELECT path FROM files WHERE path > ? AND path < ? ORDER BY path", (directory + "/", directory + "0"))]
+
+
+def compare_indexes(conn_a, conn_b) -> tuple[dict[str, dict], int]:
+    """
+    Compare two projects' skill trees by their Merkle hashes, top-down.
+
+    Directories with equal hashes are skipped whole; only directories whose
+    hashes differ are listed (from the index, no file is read). Returns
+    ({skill: {"status": "only-a" | "only-b" | "diverged", "files": [(mark,
+    path)]}}, directories listed), with file paths relative to the skill
+    and marks as in diff_files.
+    """
+    diverged = {}
+    listed = 0
+    for _, root in SYNC_DIRS:
+        hashes = [conn.execute("SELECT hash FROM dirs WHERE path = ?", (root,)).fetchone() for conn in (conn_a, conn_b)]
+        if hashes[0] == hashes[1]:
+            continue
+        pending = [root]
+        while pending:
+            directory = pending.pop()
+            a, b = _dir_entries(conn_a, directory), _dir_entries(conn_b, directory)
+            listed += 1
+            for name in sorted(a.keys() | b.keys()):
+                if a.get(name) == b.get(name):
+                    continue
+                path = f"{directory}/{name}"
+                kind_a, kind_b = a.get(name, ("",))[0], b.get(name, ("",))[0]
+                if directory == root and not (kind_a and kind_b):
+                    diverged[name] = {"status": "only-a" if kind_a else "only-b", "files": []}
+                    continue
+                if kind_a == kind_b == "d":
+                    pending.append(path)
+                    continue
+                skill = skill_of(path)
+                skip = len(f"{root}/{skill}/")
+                changes = diverged.setdefault(skill, {"status": "diverged", "files": []})["files"]
+                if kind_a and kind_b and "d" not in (kind_a, kind_b):
+                    changes.append(("~", path[skip:]))
+                    continue
+                for mark, kind, conn in (("-", kind_a, conn_a), ("+", kind_b, conn_b)):
+                    if kind == "d":
+                        changes += [(mark, sub[skip:]) for sub in _subtree_files(conn, path)]
+                    elif kind:
+                        changes.append((mark, path[skip:]))
+    for result in diverged.values():
+        result["files"].sort(key=lambda change: (change[1], change[0]))
+    return dict(sorted(diverged.items())), listed
+
+
+def cmd_index(args) -> None:
+    project_dir = Path.cwd()
+    start = time.perf_counter()
+    try:
+        stats = update_index(project_dir, rebuild=args.rebuild)
+    except SkillIndexError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"Skill index {INDEX_DB}: {stats['files']} files "
+          f"({stats['indexed']} re-indexed, {stats['removed']} removed) in {elapsed:.0f}ms")
+
+
+def cmd_search(args) -> None:
+    projects = [Path(p) for p in args.project] if args.project else [Path.cwd()]
+    start = time.perf_counter()
+    hits = []
+    for project_dir in projects:
+        try:
+            # Fetch extra rows so that collapsing to skills still fills the limit
+            hits += search_index(project_dir, args.query, args.limit * (1 if args.files else 5))
+        except SkillIndexError as e:
+            print(f"Warning: {e}")
+    hits.sort(key=lambda hit: -hit["score"])
+    if not args.files:
+        # One hit per skill (per project): its best-ranked file
+        seen = set()
+        hits = [hit for hit in hits if (hit["project"], hit["skill"]) not in seen
+                and not seen.add((hit["project"], hit["skill"]))]
+    hits = hits[:args.limit]
+    elapsed = (time.perf_counter() - start) * 1000
+
+    for i, hit in enumerate(hits, 1):
+        where = f"{hit['project']}: " if len(projects) > 1 else ""
+        print(f"{i:2}. {hit['skill']:<24} {hit['score']:7.2f}  {where}{hit['path']}")
+        print(f"    {' '.join(hit['snippet'].split())}")
+    print()
+    print(f"{len(hits)} hit(s) in {elapsed:.1f}ms")
+
+
+def cmd_similar(args) -> None:
+    projects = [Path.cwd()]
+    for project in args.project or []:
+        if Path(project).resolve() not in [p.resolve() for p in projects]:
+            projects.append(Path(project))
+    skill = Path(args.skill).name if args.skill else None
+    start = time.perf_counter()
+    try:
+        matches, checked = similar_skills(projects, skill, args.threshold)
+    except SkillIndexError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    # Across a fleet most pairs are unmodified copies of the same skill:
+    # count those, list the ones that diverged
+    identical = [m for m in matches if not m["files"] and m["a"][1] == m["b"][1]]
+    if skill is None:
+        matches = [m for m in matches if m not in identical]
+    matches = matches[:args.limit]
+
+    def label(project_dir: Path, name: str) -> str:
+        return f"{name} ({project_dir})" if len(projects) > 1 else name
+
+    for i, match in enumerate(matches, 1):
+        if skill is None:
+            print(f"{i:2}. {match['score']:.2f}  {label(*match['a'])}  ~  {label(*match['b'])}")
+        else:
+            print(f"{i:2}. {match['score']:.2f}  {label(*match['b'])}")
+        for mark, path in match["files"]:
+            print(f"      {mark} {path}")
+        if not match["files"]:
+            print("      (same files)")
+    print()
+    summary = f"{len(matches)} similar skill(s)"
+    if skill is None and identical:
+        summary += f", {len(identical)} identical cop{'y' if len(identical) == 1 else 'ies'} not listed"
+    print(f"{summary} at >= {args.threshold:.2f} ({checked} candidate(s) scored in {elapsed:.1f}ms)")
+
+
+def cmd_compare(args) -> None:
+    projects = [Path(p) for p in args.project or []]
+    if not projects and not args.upstream:
+        print("Error: nothing to compare (give --project DIR and/or --upstream)")
+        sys.exit(1)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        try:
+            if args.upstream:
+                if not check_git_available():
+                    print("Error: git is not available. Please install git and try again.")
+                    sys.exit(1)
+                version = clone_myskillium(temp_dir)
+                if not version:
+                    print("Error: Failed to fetch Myskillium repository.")
+                    sys.exit(1)
+                reference, reference_label = Path(temp_dir), f"upstream ({version[:7]})"
+                update_index(reference)
+                projects = projects or [Path.cwd()]
+            else:
+                reference, reference_label = Path.cwd(), "this project"
+            # Catch up with local edits (stat checks; only changed files are read)
+            if not args.cached:
+                for project_dir in ([] if args.upstream else [reference]) + projects:
+                    update_index(project_dir)
+
+            start = time.perf_counter()
+            results = []
+            reference_conn = _open_readonly(reference)
+            try:
+                for project_dir in projects:
+                    conn = _open_readonly(project_dir)
+                    try:
+                        results.append((project_dir, *compare_indexes(reference_conn, conn)))
+                    finally:
+                        conn.close()
+            finally:
+                reference_conn.close()
+            elapsed = (time.perf_counter() - start) * 1000
+        except SkillIndexError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+
+    print(f"Comparing with {reference_label}")
+    print()
+    for project_dir, diverged, listed in results:
+        if not diverged:
+            print(f"{project_dir}: same skills")
+            print()
+            continue
+        print(f"{project_dir}: {len(diverged)} skill(s) differ ({listed} director{'y' if listed == 1 else 'ies'} listed)")
+        for skill, result in diverged.items():
+            if result["status"] == "only-a":
+                print(f"  - {skill} (only in {reference_label})")
+            elif result["status"] == "only-b":
+                print(f"  + {skill} (only in {project_dir})")
+            else:
+                print(f"  ~ {skill}")
+                for mark, path in result["files"]:
+                    print(f"      {mark} {path}")
+        print()
+    print(f"{sum(bool(diverged) for _, diverged, _ in results)} of {len(results)} project(s) diverged "
+          f"(compared in {elapsed:.1f}ms)")
+
+
 def main():
     parser = argparse.ArgumentParser(description="Sync Myskillium skills to local project")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be done without making changes")
+    commands = parser.add_subparsers(dest="command", metavar="{sync,index,search,similar,compare}")
+    sync_parser = commands.add_parser("sync", help="Sync skills from Myskillium (the default)")
+    sync_parser.add_argument("--dry-run", action="store_true", default=argparse.SUPPRESS,
+                             help="Show what would be done without making changes")
+    index_parser = commands.add_parser("index", help="Bring the skill index up to date with local files")
+    index_parser.add_argument("--rebuild", action="store_true", help="Rebuild the index from scratch")
+    search_parser = commands.add_parser("search", help="Find skills matching a description of a task")
+    search_parser.add_argument("query", help="What the skill should do")
+    search_parser.add_argument("--limit", type=int, default=10, help="Maximum hits (default: 10)")
+    search_parser.add_argument("--files", action="store_true", help="List matching files instead of one hit per skill")
+    search_parser.add_argument("--project", action="append", help="Project to search (repeatable; default: cwd)")
+    similar_parser = commands.add_parser("similar", help="Find near-duplicate skills and diverged forks")
+    similar_parser.add_argument("skill", nargs="?", help="Skill to find copies of (default: all similar pairs)")
+    similar_parser.add_argument("--threshold", type=float, default=0.5,
+                                help="Minimum estimated similarity, 0-1 (default: 0.5)")
+    similar_parser.add_argument("--limit", type=int, default=20, help="Maximum results (default: 20)")
+    similar_parser.add_argument("--project", action="append", help="Other project to compare with (repeatable)")
+    compare_parser = commands.add_parser("compare", help="Show which skills differ between projects or from upstream")
+    compare_parser.add_argument("--project", action="append",
+                                help="Project to compare with this one, or with upstream (repeatable)")
+    compare_parser.add_argument("--upstream", action="store_true",
+                                help="Compare with the latest Myskillium (default project: cwd)")
+    compare_parser.add_argument("--cached", action="store_true",
+                                help="Compare the indexes as they are, without checking for local edits")
     args = parser.parse_args()
 
+    if args.command == "index":
+        cmd_index(args)
+    elif args.command == "search":
+        cmd_search(args)
+    elif args.command == "similar":
+        cmd_similar(args)
+    elif args.command == "compare":
+        cmd_compare(args)
+    else:
+        cmd_sync(args)
+
+
+def cmd_sync(args):
     # Check git
     if not check_git_available():
         print("Error: git is not available. Please install git and try again.")
@@ -183,49 +961,19 @@ def main():
 
         # Update version file
         if not args.dry_run:
-            version_file = project_dir / ".myskillium-version"
+            version_file = project_dir / VERSION_FILE
             version_file.write_text(new_version + "\n")
 
-    # Report
-    print()
-    if args.dry_run:
-        print("=== DRY RUN (no changes made) ===")
-        print()
-
-    old_short = old_version[:7] if old_version else "none"
-    new_short = new_version[:7]
-
-    if old_version == new_version:
-        print(f"Already at version {new_short}")
-    else:
-        print(f"Updated from {old_short} to {new_short}")
-
-    print()
-
-    if all_stats["added"]:
-        print(f"Added ({len(all_stats['added'])}):")
-        for f in all_stats["added"]:
-            print(f"  + {f}")
-        print()
-
-    if all_stats["updated"]:
-        print(f"Updated ({len(all_stats['updated'])}):")
-        for f in all_stats["updated"]:
-            print(f"  ~ {f}")
-        print()
-
-    if all_stats["preserved"]:
-        print(f"Preserved ({len(all_stats['preserved'])}):")
-        for f in all_stats["preserved"]:
-            print(f"  * {f}")
-        print()
-
-    if all_stats["unchanged"]:
-        print(f"Unchanged: {len(all_stats['unchanged'])} files")
-        print()
+    # Keep an existing index current, re-indexing only what the sync
+    # changed. A project without one (built by `index`) pays nothing for it.
+    index_stats = None
+    if not args.dry_run and (project_dir / INDEX_DB).exists():
+        try:
+            index_stats = update_index(project_dir, all_stats["added"] + all_stats["updated"])
+        except SkillIndexError as e:
+            print(f"Warning: skill index not updated: {e}")
 
-    if not args.dry_run:
-        print("Run: git add . && git commit -m 'chore: sync myskillium'")
+    print_report(old_version, new_version, all_stats, args.dry_run, index_stats)
 
 
 if __name__ == "__main__":
@@ -10,6 +10,7 @@
 #
 
 set -e
+set -o pipefail
 
 # Configuration
 MYSKILLIUM_REPO="https://github.com/Mharbulous/Myskillium.git"
@@ -59,65 +60,112 @@ UPDATED=()
 PRESERVED=()
 UNCHANGED=0
 
+# Check if a destination path is preserved (never overwritten)
+is_preserved() {
+    local dst="$1"
+    local rel_path="$2"
+
+    [[ "$dst" == ".claude/data" && "$rel_path" == *.db ]] && return 0
+    [[ "$dst/$rel_path" == .claude/local/* ]] && return 0
+    [[ "$dst/$rel_path" == ".claude/settings.local.json" ]] && return 0
+    return 1
+}
+
+# Print the git blob hash of each file, given as paths relative to the
+# root directory $1. --no-filters hashes raw bytes, so equal hashes mean a
+# byte-wise cmp would pass.
+#
+# git reads the paths from inside the root rather than as absolute paths:
+# on Windows, Git Bash does not convert MSYS paths fed on stdin, so native
+# git.exe could not open them. Discovery is stopped at the root's parent,
+# as inside a repository git would resolve them against its top level.
+hash_files() {
+    local root="$1"
+    shift
+    (cd "$root" && printf '%s\n' "$@" |
+        GIT_CEILING_DIRECTORIES="${root%/*}" git hash-object --no-filters --stdin-paths 2>/dev/null)
+}
+
 # Function to sync a directory
+#
+# Files are classified in batches rather than with one process per file:
+# existence and preserve checks use shell builtins, contents are compared
+# with one `git hash-object` pass per side, and the changed set is copied
+# through one tar pipe (which also creates any directories).
 sync_dir() {
     local src="$1"
     local dst="$2"
+    local src_root="$TEMP_DIR/$src"
+    local dst_root="$PROJECT_DIR/$dst"
+    local rel_path
+    local compare=()
+    local changed=()
 
-    if [[ ! -d "$TEMP_DIR/$src" ]]; then
+    if [[ ! -d "$src_root" ]]; then
         return
     fi
 
     # Create destination if needed
     if [[ "$DRY_RUN" == "false" ]]; then
-        mkdir -p "$PROJECT_DIR/$dst"
+        mkdir -p "$dst_root"
     fi
 
-    # Find all files in source
-    while IFS= read -r -d '' src_file; do
-        rel_path="${src_file#$TEMP_DIR/$src/}"
-        dst_file="$PROJECT_DIR/$dst/$rel_path"
+    # Find all files in source; new files are added, existing ones compared
+    while IFS= read -r -d '' rel_path; do
+        rel_path="${rel_path#./}"
 
-        # Check if file should be preserved
-        if [[ "$dst" == ".claude/data" && "$rel_path" == *.db ]]; then
-            if [[ -f "$dst_file" ]]; then
+        if [[ -f "$dst_root/$rel_path" ]]; then
+            if is_preserved "$dst" "$rel_path"; then
                 PRESERVED+=("$dst/$rel_path")
-                continue
+            else
+                compare+=("$rel_path")
             fi
+        else
+            ADDED+=("$dst/$rel_path")
+            changed+=("$rel_path")
         fi
-
-        if [[ "$dst/$rel_path" == .claude/local/* ]]; then
-            if [[ -f "$dst_file" ]]; then
-                PRESERVED+=("$dst/$rel_path")
-                continue
-            fi
+    done < <(cd "$src_root" && find . -type f -print0)
+
+    # Compare files: hash the source copies, then the destination ones
+    if [[ ${#compare[@]} -gt 0 ]]; then
+        local hashes=()
+        local hash
+        local count=${#compare[@]}
+        local same
+        local i
+
+        while IFS= read -r hash; do
+            hashes+=("$hash")
+        done < <(hash_files "$src_root" "${compare[@]}"; hash_files "$dst_root" "${compare[@]}")
+
+        # --stdin-paths is line-based, so a newline in any name (or a git
+        # error) misaligns the output; fall back to comparing file by file
+        if [[ ${#hashes[@]} -ne $((count * 2)) ]]; then
+            hashes=()
         fi
 
-        if [[ "$dst/$rel_path" == ".claude/settings.local.json" ]]; then
-            if [[ -f "$dst_file" ]]; then
-                PRESERVED+=("$dst/$rel_path")
-                continue
+        for ((i = 0; i < count; i++)); do
+            rel_path="${compare[$i]}"
+            if [[ ${#hashes[@]} -gt 0 ]]; then
+                [[ "${hashes[$i]}" == "${hashes[$((i + count))]}" ]] && same=true || same=false
+            else
+                cmp -s "$src_root/$rel_path" "$dst_root/$rel_path" && same=true || same=false
             fi
-        fi
 
-        # Compare files
-        if [[ -f "$dst_file" ]]; then
-            if cmp -s "$src_file" "$dst_file"; then
+            if [[ "$same" == "true" ]]; then
                 ((UNCHANGED++)) || true
-                continue
             else
                 UPDATED+=("$dst/$rel_path")
+                changed+=("$rel_path")
             fi
-        else
-            ADDED+=("$dst/$rel_path")
-        fi
+        done
+    fi
 
-        # Copy file
-        if [[ "$DRY_RUN" == "false" ]]; then
-            mkdir -p "$(dirname "$dst_file")"
-            cp "$src_file" "$dst_file"
-        fi
-    done < <(find "$TEMP_DIR/$src" -type f -print0)
+    # Copy changed files in bulk, creating parent directories as needed
+    if [[ "$DRY_RUN" == "false" && ${#changed[@]} -gt 0 ]]; then
+        (cd "$src_root" && printf '%s\0' "${changed[@]}" | tar --null -T - -cf -) |
+            (cd "$dst_root" && tar --no-same-owner -xmf -)
+    fi
 }
 
 # Sync skills directory only